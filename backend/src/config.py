@@ -20,6 +20,8 @@ class Settings(BaseSettings):
     # Scraper Configuration
     SCRAPER_MAX_ARTICLES: int = 100
     SCRAPER_TIMEOUT: int = 30
+    SCRAPER_STATE_DIR: str = ""
+    SCRAPER_INCREMENTAL: bool = False
 
     # Analyzer Configuration
     ANALYZER_TIMEOUT: int = 30
@@ -16,6 +16,9 @@ from src.db.mongo import get_database
 from src.services.article_service import ArticleService
 from src.utils.logger import logger
 
+# intelligence-scraper exit status for a run cut short by --deadline
+SCRAPER_EXIT_PARTIAL = 3
+
 
 async def run_startup_pipeline():
     """
@@ -128,6 +131,10 @@ async def run_scraper() -> List[Dict[str, Any]]:
         ) as temp_file:
             temp_path = temp_file.name
 
+        # Leave the scraper time to write completed articles before the subprocess is killed
+        subprocess_timeout = settings.SCRAPER_TIMEOUT * settings.SCRAPER_MAX_ARTICLES
+        deadline = max(1, int(subprocess_timeout * 0.95) - 10)
+
         try:
             # Run scraper CLI
             cmd = [
@@ -138,7 +145,13 @@ async def run_scraper() -> List[Dict[str, Any]]:
                 str(settings.SCRAPER_MAX_ARTICLES),
                 "--timeout",
                 str(settings.SCRAPER_TIMEOUT),
+                "--deadline",
+                str(deadline),
             ]
+            if settings.SCRAPER_STATE_DIR:
+                cmd.extend(["--state-dir", settings.SCRAPER_STATE_DIR])
+                if settings.SCRAPER_INCREMENTAL:
+                    cmd.append("--incremental")
 
             logger.info(f"Running scraper command: {' '.join(cmd)}")
 
@@ -146,10 +159,15 @@ async def run_scraper() -> List[Dict[str, Any]]:
                 cmd,
                 capture_output=True,
                 text=True,
-                timeout=settings.SCRAPER_TIMEOUT * settings.SCRAPER_MAX_ARTICLES,
+                timeout=subprocess_timeout,
             )
 
-            if result.returncode != 0:
+            if result.returncode == SCRAPER_EXIT_PARTIAL:
+                logger.warning(
+                    "Scraper deadline reached, storing partial results",
+                    extra={"deadline": deadline, "stderr": result.stderr},
+                )
+            elif result.returncode != 0:
                 logger.error(
                     f"Scraper command failed",
                     extra={
@@ -0,0 +1,76 @@
+"""
+Benchmark for near-duplicate lookup
+
+Fills a DuplicateIndex with random signatures and measures lookup latency for
+near-duplicates (a few flipped bits) and unrelated documents.
+
+Usage:
+    python benchmarks/bench_dedup.py [--documents 100000] [--lookups 10000]
+"""
+
+import argparse
+import random
+import statistics
+import time
+from typing import List
+
+from intelligence_scraper.utils.dedup import DuplicateIndex, simhash
+
+
+def flip_bits(signature: int, count: int, rng: random.Random) -> int:
+    """Flip `count` distinct random bits of a 64-bit signature."""
+    for bit in rng.sample(range(64), count):
+        signature ^= 1 << bit
+    return signature
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Get the q-th percentile (0-100) of a list of values."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(q / 100 * (len(ordered) - 1))))]
+
+
+def main():
+    """Run the lookup benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description="Benchmark near-duplicate index lookups")
+    parser.add_argument("--documents", type=int, default=100_000, help="Indexed documents")
+    parser.add_argument("--lookups", type=int, default=10_000, help="Lookups to time")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    index = DuplicateIndex(max_distance=3, bands=4)
+
+    start = time.perf_counter()
+    signatures = [rng.getrandbits(64) for _ in range(args.documents)]
+    for i, signature in enumerate(signatures):
+        index.add(f"https://example.com/{i}", signature)
+    print(f"Indexed {len(index)} documents in {time.perf_counter() - start:.2f}s")
+
+    near, unrelated, found = [], [], 0
+    for _ in range(args.lookups):
+        probe = flip_bits(rng.choice(signatures), rng.randint(0, 3), rng)
+        start = time.perf_counter()
+        found += index.find(probe) is not None
+        near.append((time.perf_counter() - start) * 1e6)
+
+        probe = rng.getrandbits(64)
+        start = time.perf_counter()
+        index.find(probe)
+        unrelated.append((time.perf_counter() - start) * 1e6)
+
+    for name, timings in (("near-duplicate", near), ("unrelated", unrelated)):
+        print(
+            f"{name:15s} lookup: mean {statistics.mean(timings):6.1f} us, "
+            f"p50 {percentile(timings, 50):6.1f} us, p99 {percentile(timings, 99):6.1f} us"
+        )
+    print(f"Recall within 3 bits: {found / args.lookups:.1%}")
+
+    text = " ".join(f"word{rng.randint(0, 5000)}" for _ in range(800))
+    start = time.perf_counter()
+    for _ in range(100):
+        simhash(text)
+    print(f"SimHash of an 800-word article: {(time.perf_counter() - start) * 10:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Benchmark for trafilatura extraction paths
+
+Compares per-article CPU time of the two-pass extraction (extract + extract_metadata,
+parsing the HTML twice) against the single-parse bare_extraction path, on saved pages.
+
+Usage:
+    python benchmarks/bench_extraction.py [<pages>] [--repeat N]
+
+<pages> is a fixture archive (*.jsonl.gz, e.g. one written with --record) or a
+directory of saved *.html article pages. It defaults to the committed newsroom
+page set in benchmarks/fixtures/newsroom.jsonl.gz (regenerate it with
+benchmarks/newsroom_pages.py).
+
+Results on the committed page set (40 pages, best of 5 runs, Python 3.11,
+trafilatura 2.3.1):
+
+    Two-pass extraction:         6.80 ms CPU/article
+    Single-parse extraction:     5.54 ms CPU/article
+    Saved:                       1.26 ms CPU/article (18.6%)
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from intelligence_scraper.utils.extraction import (
+    ExtractedContent,
+    extract_article,
+    extract_article_two_pass,
+)
+from intelligence_scraper.utils.fixtures import FixtureArchive
+
+DEFAULT_PAGES = Path(__file__).parent / "fixtures" / "newsroom.jsonl.gz"
+
+
+def load_pages(path: Path) -> Dict[str, str]:
+    """
+    Load recorded pages from a fixture archive or a directory of *.html files.
+
+    Args:
+        path: Fixture archive file or pages directory
+
+    Returns:
+        Dict[str, str]: Mapping of page name to HTML
+    """
+    if path.is_file():
+        return {
+            entry.url: entry.content.decode("utf-8", errors="replace")
+            for entry in FixtureArchive.load(str(path)).entries
+            if entry.status == 200
+        }
+    return {
+        p.name: p.read_text(encoding="utf-8", errors="replace") for p in sorted(path.glob("*.html"))
+    }
+
+
+def time_extraction(
+    func: Callable[[str], Optional[ExtractedContent]], pages: List[str], repeat: int
+) -> List[float]:
+    """
+    Measure the CPU time of an extraction function per page.
+
+    Args:
+        func: Extraction function taking HTML text
+        pages: HTML documents
+        repeat: Number of runs per page (the minimum is kept)
+
+    Returns:
+        List[float]: Best CPU time per page in milliseconds
+    """
+    timings = []
+    for html in pages:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.process_time()
+            func(html)
+            best = min(best, time.process_time() - start)
+        timings.append(best * 1000)
+    return timings
+
+
+def check_parity(pages: Dict[str, str]) -> List[str]:
+    """
+    Check that both extraction paths produce the same body text and title.
+
+    Args:
+        pages: Mapping of page name to HTML
+
+    Returns:
+        List[str]: Names of pages whose results differ
+    """
+    mismatches = []
+    for name, html in pages.items():
+        single = extract_article(html)
+        two_pass = extract_article_two_pass(html)
+        single_key = (single.content, single.title) if single else None
+        two_pass_key = (two_pass.content, two_pass.title) if two_pass else None
+        if single_key != two_pass_key:
+            mismatches.append(name)
+    return mismatches
+
+
+def main():
+    """Run the extraction benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description="Benchmark trafilatura extraction paths")
+    parser.add_argument(
+        "pages",
+        type=str,
+        nargs="?",
+        default=str(DEFAULT_PAGES),
+        help="Fixture archive or directory of saved *.html pages (default: committed page set)",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per page, best is kept (default: 5)"
+    )
+    args = parser.parse_args()
+
+    pages = load_pages(Path(args.pages))
+    if not pages:
+        print(f"Error: no pages found in {args.pages}", file=sys.stderr)
+        sys.exit(1)
+
+    html_list = list(pages.values())
+
+    # Warm up imports and caches before measuring
+    extract_article(html_list[0])
+    extract_article_two_pass(html_list[0])
+
+    two_pass = time_extraction(extract_article_two_pass, html_list, args.repeat)
+    single = time_extraction(extract_article, html_list, args.repeat)
+
+    two_pass_mean = statistics.mean(two_pass)
+    single_mean = statistics.mean(single)
+    saved = two_pass_mean - single_mean
+
+    print(f"Pages: {len(pages)} (best of {args.repeat} runs each)")
+    print(f"Two-pass extraction:     {two_pass_mean:8.2f} ms CPU/article")
+    print(f"Single-parse extraction: {single_mean:8.2f} ms CPU/article")
+    print(f"Saved:                   {saved:8.2f} ms CPU/article ({saved / two_pass_mean:.1%})")
+
+    mismatches = check_parity(pages)
+    if mismatches:
+        print(f"Output differs for {len(mismatches)} pages: {', '.join(mismatches)}")
+    else:
+        print("Output parity: body text and title identical on all pages")
+
+
+if __name__ == "__main__":
+    main()
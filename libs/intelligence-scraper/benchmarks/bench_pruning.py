@@ -0,0 +1,175 @@
+"""
+Benchmark for pre-extraction HTML pruning
+
+Compares per-article CPU time, peak Python memory and DOM size of trafilatura
+extraction on full pages against pages pruned of scripts, styles, inline SVG,
+navigation and footers, and checks that both produce the same article.
+
+Usage:
+    python benchmarks/bench_pruning.py <pages> [--repeat N] [--prune-xpath XPATH ...]
+
+<pages> is either a directory of saved *.html article pages or an HTML
+archive directory written by `intelligence-scraper --archive-html`.
+
+Peak memory is measured with tracemalloc, which sees Python allocations made
+by trafilatura but not libxml2's own tree memory; the element counts show how
+much smaller the tree handed to trafilatura is.
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from intelligence_scraper.utils.extraction import extract_article
+from intelligence_scraper.utils.html_archive import INDEX_DB_NAME, HtmlArchive
+from intelligence_scraper.utils.pruning import PruneRules, prune_html
+
+
+def load_pages(path: Path) -> Dict[str, str]:
+    """
+    Load recorded pages from a directory of *.html files or an HTML archive.
+
+    Args:
+        path: Pages directory or archive directory
+
+    Returns:
+        Dict[str, str]: Mapping of page name to HTML
+    """
+    if (path / INDEX_DB_NAME).exists():
+        archive = HtmlArchive(str(path))
+        try:
+            return {entry.url: archive.read(entry) for entry in archive.entries()}
+        finally:
+            archive.close()
+    return {
+        p.name: p.read_text(encoding="utf-8", errors="replace") for p in sorted(path.glob("*.html"))
+    }
+
+
+def measure(pages: List[str], rules: Optional[PruneRules], repeat: int) -> Dict[str, List[float]]:
+    """
+    Measure extraction CPU time and peak Python memory per page.
+
+    Args:
+        pages: HTML documents
+        rules: Pruning rules (None = extract full pages)
+        repeat: Number of timed runs per page (the minimum is kept)
+
+    Returns:
+        Dict[str, List[float]]: "cpu_ms" and "peak_kib" per page
+    """
+    cpu_ms, peak_kib = [], []
+    for html in pages:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.process_time()
+            extract_article(html, rules)
+            best = min(best, time.process_time() - start)
+        cpu_ms.append(best * 1000)
+
+        tracemalloc.start()
+        extract_article(html, rules)
+        peak_kib.append(tracemalloc.get_traced_memory()[1] / 1024)
+        tracemalloc.stop()
+    return {"cpu_ms": cpu_ms, "peak_kib": peak_kib}
+
+
+def element_count(html: str, rules: PruneRules) -> int:
+    """Count the elements left in a page after pruning."""
+    tree = prune_html(html, rules)
+    return sum(1 for _ in tree.iter()) if tree is not None else 0
+
+
+def check_parity(pages: Dict[str, str], rules: PruneRules) -> List[str]:
+    """
+    Check that pruning leaves the extracted article unchanged.
+
+    Compares body text, title, publish date, author and description.
+
+    Args:
+        pages: Mapping of page name to HTML
+        rules: Pruning rules
+
+    Returns:
+        List[str]: Names of pages whose results differ
+    """
+    mismatches = []
+    for name, html in pages.items():
+        results = []
+        for page_rules in (None, rules):
+            article = extract_article(html, page_rules)
+            results.append(
+                (
+                    article.content,
+                    article.title,
+                    article.publish_date,
+                    article.author,
+                    article.description,
+                )
+                if article
+                else None
+            )
+        if results[0] != results[1]:
+            mismatches.append(name)
+    return mismatches
+
+
+def main():
+    """Run the pruning benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description="Benchmark pre-extraction HTML pruning")
+    parser.add_argument("pages", type=str, help="Directory of *.html pages or an HTML archive")
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per page, best is kept (default: 5)"
+    )
+    parser.add_argument(
+        "--prune-xpath",
+        action="append",
+        default=[],
+        metavar="XPATH",
+        help="Extra XPath of site boilerplate to prune (repeatable)",
+    )
+    args = parser.parse_args()
+
+    pages = load_pages(Path(args.pages))
+    if not pages:
+        print(f"Error: no pages found in {args.pages}", file=sys.stderr)
+        sys.exit(1)
+
+    rules = PruneRules(xpaths=tuple(args.prune_xpath))
+    html_list = list(pages.values())
+
+    # Warm up imports and caches before measuring
+    extract_article(html_list[0])
+    extract_article(html_list[0], rules)
+
+    full = measure(html_list, None, args.repeat)
+    pruned = measure(html_list, rules, args.repeat)
+    full_elements = statistics.mean(element_count(html, PruneRules.none()) for html in html_list)
+    pruned_elements = statistics.mean(element_count(html, rules) for html in html_list)
+
+    print(f"Pages: {len(pages)} (best of {args.repeat} runs each)")
+    for label, key, unit in (("CPU", "cpu_ms", "ms"), ("Peak Python memory", "peak_kib", "KiB")):
+        before = statistics.mean(full[key])
+        after = statistics.mean(pruned[key])
+        print(
+            f"{label + ':':20} {before:9.1f} -> {after:9.1f} {unit}/article "
+            f"({(before - after) / before:.1%} less)"
+        )
+    print(
+        f"{'Elements:':20} {full_elements:9.0f} -> {pruned_elements:9.0f} per page "
+        f"({(full_elements - pruned_elements) / full_elements:.1%} fewer)"
+    )
+
+    mismatches = check_parity(pages, rules)
+    if mismatches:
+        print(f"Output differs for {len(mismatches)} pages: {', '.join(mismatches)}")
+    else:
+        print("Output parity: body text, title, date, author and description identical")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Offline scraper throughput benchmark
+
+Replays a recorded fixture archive from a local server with configurable latency and
+measures NvidiaScraper throughput for the trafilatura and Playwright paths at several
+concurrency levels. Playwright cases can be run under the lean page-load policy
+(resource blocking, DOMContentLoaded + readiness selector) and the full one (every
+resource, networkidle) to show the bytes and time saved. Each case runs in a fresh
+process so peak RSS is per case.
+
+Record an archive first:
+    intelligence-scraper nvidia /tmp/articles.json --record fixtures/nvidia.jsonl.gz
+
+Then run:
+    python benchmarks/bench_scraper.py fixtures/nvidia.jsonl.gz \\
+        --concurrency 1,4,8 --methods trafilatura,playwright --latency 0.1 \
+        --playwright-policies lean,full
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.models import ScrapedArticle
+from intelligence_scraper.utils.fixtures import FixtureArchive, ReplayServer
+from intelligence_scraper.utils.page_load import ResourcePolicy
+from intelligence_scraper.utils.telemetry import percentile
+
+METHODS = ("trafilatura", "playwright")
+POLICIES = ("lean", "full")
+
+
+class TimedNvidiaScraper(NvidiaScraper):
+    """NvidiaScraper that records per-article latency and can force one method."""
+
+    def __init__(self, method: str, **kwargs):
+        super().__init__(**kwargs)
+        self.method = method
+        self.latencies: List[float] = []
+        self.page_loads: List[Dict[str, Any]] = []
+
+    async def _scrape_article_with_retry(self, url: str) -> Optional[ScrapedArticle]:
+        start = time.perf_counter()
+        try:
+            return await super()._scrape_article_with_retry(url)
+        finally:
+            self.latencies.append(time.perf_counter() - start)
+
+    async def _scrape_with_trafilatura(self, url: str) -> Optional[ScrapedArticle]:
+        if self.method == "playwright":
+            return None
+        return await super()._scrape_with_trafilatura(url)
+
+    async def _scrape_with_playwright(self, url: str) -> Optional[ScrapedArticle]:
+        article = await super()._scrape_with_playwright(url)
+        if article and "pageLoad" in article.metadata:
+            self.page_loads.append(article.metadata["pageLoad"])
+        return article
+
+
+def run_case(
+    archive_path: str,
+    method: str,
+    concurrency: int,
+    latency: float,
+    max_articles: int,
+    extract_workers: int,
+    policy: str = "lean",
+) -> Dict[str, Any]:
+    """
+    Run one benchmark case in the current (fresh) process.
+
+    Returns:
+        Dict: Throughput, latency percentiles and peak RSS for the case
+    """
+    archive = FixtureArchive.load(archive_path)
+
+    with ReplayServer(archive, latency=latency) as server:
+        scraper = TimedNvidiaScraper(
+            method=method,
+            base_url=server.base_url,
+            max_articles=max_articles,
+            concurrency=concurrency,
+            extract_workers=extract_workers,
+            resource_policy=ResourcePolicy.full() if policy == "full" else None,
+        )
+        start = time.perf_counter()
+        articles = asyncio.run(scraper.scrape())
+        wall = time.perf_counter() - start
+
+    self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+
+    page_loads = scraper.page_loads
+    return {
+        "method": method,
+        "policy": policy if method == "playwright" else "-",
+        "concurrency": concurrency,
+        "articles": len(articles),
+        "wall_seconds": round(wall, 3),
+        "articles_per_second": round(len(articles) / wall, 2) if wall else 0.0,
+        "p50_latency_ms": round(percentile(scraper.latencies, 50) * 1000, 1),
+        "p95_latency_ms": round(percentile(scraper.latencies, 95) * 1000, 1),
+        # ru_maxrss is reported in kilobytes on Linux
+        "peak_rss_mb": round(self_rss / 1024, 1),
+        "peak_children_rss_mb": round(children_rss / 1024, 1),
+        "page_bytes_mean": (
+            round(sum(p["bytes_downloaded"] for p in page_loads) / len(page_loads))
+            if page_loads
+            else None
+        ),
+        "page_load_ms_mean": (
+            round(sum(p["load_ms"] for p in page_loads) / len(page_loads), 1)
+            if page_loads
+            else None
+        ),
+        "page_blocked_mean": (
+            round(sum(p["blocked"] for p in page_loads) / len(page_loads), 1)
+            if page_loads
+            else None
+        ),
+    }
+
+
+def main():
+    """Run all benchmark cases and print a summary table."""
+    parser = argparse.ArgumentParser(description="Offline NvidiaScraper throughput benchmark")
+    parser.add_argument("archive", type=str, help="Fixture archive recorded with --record")
+    parser.add_argument(
+        "--concurrency",
+        type=str,
+        default="1,4,8",
+        help="Comma-separated concurrency levels (default: 1,4,8)",
+    )
+    parser.add_argument(
+        "--methods",
+        type=str,
+        default="trafilatura,playwright",
+        help="Comma-separated extraction paths to measure (default: trafilatura,playwright)",
+    )
+    parser.add_argument(
+        "--playwright-policies",
+        type=str,
+        default="lean",
+        help="Comma-separated Playwright page-load policies: lean, full (default: lean)",
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.1,
+        help="Seconds of delay per replayed response (default: 0.1)",
+    )
+    parser.add_argument(
+        "--max-articles", type=int, default=100, help="Articles per case (default: 100)"
+    )
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=0,
+        help="Extraction processes for the trafilatura path (default: 0 = threads)",
+    )
+    parser.add_argument(
+        "--json", type=str, default=None, help="Also write results to this JSON file"
+    )
+    args = parser.parse_args()
+
+    methods = [m.strip() for m in args.methods.split(",") if m.strip()]
+    unknown = set(methods) - set(METHODS)
+    if unknown:
+        print(f"Error: unknown methods: {', '.join(sorted(unknown))}", file=sys.stderr)
+        sys.exit(1)
+    policies = [p.strip() for p in args.playwright_policies.split(",") if p.strip()]
+    unknown = set(policies) - set(POLICIES)
+    if unknown:
+        print(f"Error: unknown policies: {', '.join(sorted(unknown))}", file=sys.stderr)
+        sys.exit(1)
+    levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+
+    cases = [
+        (method, concurrency, policy)
+        for method in methods
+        for policy in (policies if method == "playwright" else ["lean"])
+        for concurrency in levels
+    ]
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    for method, concurrency, policy in cases:
+        # A fresh process per case keeps peak RSS figures independent
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            result = pool.submit(
+                run_case,
+                args.archive,
+                method,
+                concurrency,
+                args.latency,
+                args.max_articles,
+                args.extract_workers,
+                policy,
+            ).result()
+        results.append(result)
+        page_info = ""
+        if result["page_bytes_mean"] is not None:
+            page_info = (
+                f"  page {result['page_bytes_mean']:>9} B "
+                f"{result['page_load_ms_mean']:>7.1f} ms "
+                f"{result['page_blocked_mean']:>5.1f} blocked"
+            )
+        print(
+            f"{result['method']:<12} {result['policy']:<5} c={result['concurrency']:<3} "
+            f"{result['articles']:>4} articles  "
+            f"{result['articles_per_second']:>7.2f} art/s  "
+            f"p50 {result['p50_latency_ms']:>8.1f} ms  "
+            f"p95 {result['p95_latency_ms']:>8.1f} ms  "
+            f"RSS {result['peak_rss_mb']:>7.1f} MB "
+            f"(+{result['peak_children_rss_mb']:.1f} MB children)"
+            f"{page_info}"
+        )
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Generator for the committed newsroom benchmark page set
+
+Builds newsroom-style article pages (site header and navigation, inline scripts
+and styles, JSON-LD and Open Graph metadata, the article body with figures and
+quotes, related-story rails and a footer) and saves them as a fixture archive
+that the extraction benchmarks replay. Pages are generated from a fixed seed,
+so regenerating the archive yields the same HTML.
+
+Usage:
+    python benchmarks/newsroom_pages.py [--output PATH] [--pages N] [--seed N]
+"""
+
+import argparse
+import json
+import random
+from datetime import date, timedelta
+from html import escape
+from pathlib import Path
+from typing import List, Tuple
+
+from intelligence_scraper.utils.fixtures import FixtureArchive
+
+DEFAULT_OUTPUT = Path(__file__).parent / "fixtures" / "newsroom.jsonl.gz"
+BASE_URL = "https://nvidianews.nvidia.com"
+
+TOPICS = [
+    "GPU architecture",
+    "AI supercomputer",
+    "autonomous vehicle platform",
+    "robotics simulation",
+    "data center networking",
+    "generative AI microservices",
+    "climate digital twin",
+    "healthcare foundation models",
+    "RTX graphics",
+    "quantum computing research",
+]
+VERBS = ["Announces", "Unveils", "Expands", "Launches", "Introduces", "Accelerates"]
+PARTNERS = ["cloud providers", "automakers", "research institutes", "server makers", "startups"]
+SENTENCE_PARTS = [
+    "delivers up to {n}x higher throughput for large language model inference",
+    "reduces energy consumption across {n} data center regions",
+    "is available today through {partner} worldwide",
+    "integrates with the CUDA software stack and more than {n} accelerated libraries",
+    "enables developers to train models with {n} billion parameters on a single node",
+    "builds on a decade of collaboration with {partner}",
+    "brings accelerated computing to {n} new industries",
+    "combines simulation, training and deployment in one workflow",
+]
+
+
+def _sentence(rng: random.Random, topic: str) -> str:
+    part = rng.choice(SENTENCE_PARTS).format(n=rng.randint(2, 60), partner=rng.choice(PARTNERS))
+    return f"The new {topic} {part}."
+
+
+def _paragraph(rng: random.Random, topic: str) -> str:
+    return " ".join(_sentence(rng, topic) for _ in range(rng.randint(3, 6)))
+
+
+def build_page(rng: random.Random, index: int) -> Tuple[str, str]:
+    """
+    Build one newsroom-style article page.
+
+    Args:
+        rng: Seeded random generator
+        index: Page number (used in the slug and publish date)
+
+    Returns:
+        Tuple[str, str]: Article URL and HTML document
+    """
+    topic = rng.choice(TOPICS)
+    title = f"NVIDIA {rng.choice(VERBS)} {topic.title()} for {rng.choice(PARTNERS).title()}"
+    slug = "-".join(title.lower().split() + [str(index)])
+    published = date(2024, 1, 1) + timedelta(days=index * 7)
+    url = f"{BASE_URL}/news/{slug}"
+
+    nav = "".join(
+        f'<li class="nav-item"><a href="{BASE_URL}/{section}">{section.title()}</a></li>'
+        for section in ("news", "multimedia", "events", "about", "contacts", "rss")
+    )
+    body: List[str] = []
+    for n in range(rng.randint(6, 18)):
+        body.append(f"<p>{escape(_paragraph(rng, topic))}</p>")
+        if n % 5 == 2:
+            body.append(
+                f'<figure class="article-image"><img src="{BASE_URL}/images/{slug}-{n}.jpg"'
+                f' alt="{escape(topic)}" loading="lazy"><figcaption>'
+                f"{escape(topic.title())} in action.</figcaption></figure>"
+            )
+        if n % 7 == 4:
+            body.append(
+                f"<blockquote><p>“{escape(_sentence(rng, topic))}” said Jensen Huang,"
+                " founder and CEO of NVIDIA.</p></blockquote>"
+            )
+    related = "".join(
+        f'<li><a href="{BASE_URL}/news/related-{index}-{n}">'
+        f"{escape(rng.choice(VERBS))} {escape(rng.choice(TOPICS).title())}</a></li>"
+        for n in range(8)
+    )
+    json_ld = json.dumps(
+        {
+            "@context": "https://schema.org",
+            "@type": "NewsArticle",
+            "headline": title,
+            "datePublished": published.isoformat(),
+            "author": {"@type": "Organization", "name": "NVIDIA Newsroom"},
+        }
+    )
+    styles = "\n".join(
+        f".block-{n} {{ margin: {n}px; padding: {n % 9}px; color: #{n * 4099 % 0xFFFFFF:06x}; }}"
+        for n in range(120)
+    )
+    script = "\n".join(
+        f"window.dataLayer.push({{event: 'impression', slot: {n}, id: '{slug[:24]}-{n}'}});"
+        for n in range(60)
+    )
+
+    html = f"""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>{escape(title)} | NVIDIA Newsroom</title>
+<meta name="description" content="{escape(_sentence(rng, topic))}">
+<meta property="og:title" content="{escape(title)}">
+<meta property="og:url" content="{url}">
+<meta property="og:type" content="article">
+<meta name="author" content="NVIDIA Newsroom">
+<meta property="article:published_time" content="{published.isoformat()}">
+<link rel="canonical" href="{url}">
+<script type="application/ld+json">{json_ld}</script>
+<style>
+{styles}
+</style>
+<script>
+window.dataLayer = window.dataLayer || [];
+{script}
+</script>
+</head>
+<body class="page-news">
+<header class="site-header">
+<a class="logo" href="{BASE_URL}/">
+<svg width="120" height="24"><rect width="120" height="24"/></svg>
+</a>
+<nav class="main-nav"><ul>{nav}</ul></nav>
+<form class="search" action="{BASE_URL}/search"><input name="q" placeholder="Search"></form>
+</header>
+<main>
+<article class="article">
+<div class="article-header">
+<h1 class="article-title">{escape(title)}</h1>
+<div class="article-date">
+<time datetime="{published.isoformat()}">{published:%B %d, %Y}</time>
+</div>
+</div>
+<div class="article-body">
+{"".join(body)}
+</div>
+<div class="share-links"><a href="#">Share on X</a> <a href="#">Share on LinkedIn</a></div>
+</article>
+<aside class="related-news"><h2>Related News</h2><ul>{related}</ul></aside>
+</main>
+<footer class="site-footer">
+<ul><li><a href="{BASE_URL}/privacy">Privacy Policy</a></li>
+<li><a href="{BASE_URL}/legal">Legal Info</a></li>
+<li><a href="{BASE_URL}/cookies">Manage My Privacy</a></li></ul>
+<p>Copyright &copy; {published.year} NVIDIA Corporation</p>
+</footer>
+<script src="{BASE_URL}/static/app.js" async></script>
+</body>
+</html>
+"""
+    return url, html
+
+
+def build_archive(pages: int, seed: int) -> FixtureArchive:
+    """
+    Build a fixture archive of newsroom-style article pages.
+
+    Args:
+        pages: Number of pages
+        seed: Random seed
+
+    Returns:
+        FixtureArchive: Archive with one HTML response per page
+    """
+    rng = random.Random(seed)
+    archive = FixtureArchive()
+    for index in range(pages):
+        url, html = build_page(rng, index)
+        archive.add(url, 200, {"content-type": "text/html; charset=utf-8"}, html.encode("utf-8"))
+    return archive
+
+
+def main():
+    """Generate the page set and save it."""
+    parser = argparse.ArgumentParser(description="Generate the newsroom benchmark page set")
+    parser.add_argument("--output", type=str, default=str(DEFAULT_OUTPUT), help="Archive path")
+    parser.add_argument("--pages", type=int, default=40, help="Number of pages (default: 40)")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed (default: 7)")
+    args = parser.parse_args()
+
+    build_archive(args.pages, args.seed).save(args.output)
+    print(f"Wrote {args.pages} pages to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,86 +7,460 @@ Provides command-line interface for running scrapers.
 import argparse
 import asyncio
 import json
+import os
+import re
 import sys
-from pathlib import Path
+from collections import Counter
+from dataclasses import replace
+from typing import Any, Dict, List, Optional
 
-from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.extractors.base import BaseScraper
+from intelligence_scraper.registry import available_sources, get_scraper_class
+from intelligence_scraper.runner import MultiSourceRunner, load_run_config
+from intelligence_scraper.utils.fixtures import FixtureArchive, ReplayServer
+from intelligence_scraper.utils.frontier import DEFAULT_LEASE_SECONDS, CrawlFrontier
+from intelligence_scraper.utils.http import DEFAULT_MAX_RESPONSE_BYTES
 from intelligence_scraper.utils.logger import get_logger
+from intelligence_scraper.utils.network_capture import DEFAULT_CAPTURE_WAIT_MS, PayloadCapture
+from intelligence_scraper.utils.output import OUTPUT_FORMATS, STDOUT, create_writer
+from intelligence_scraper.utils.page_load import WAIT_MODES
 
 logger = get_logger("intelligence.scraper.cli")
 
+# Exit status when --deadline cut the run short; completed articles were still written
+EXIT_PARTIAL = 3
 
-async def run_scraper(source: str, output_file: str, max_articles: int, timeout: int):
+
+def load_known_urls(path: str) -> List[str]:
+    """
+    Load already-scraped URLs from a file.
+
+    Args:
+        path: Text file with one URL per line (blank lines and '#' comments ignored)
+
+    Returns:
+        List[str]: Known URLs
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith("#")]
+
+
+def parse_resource_policy_args(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Collect Playwright page-load policy overrides from CLI arguments.
+
+    Args:
+        args: Parsed CLI arguments
+
+    Returns:
+        Dict[str, Any]: ResourcePolicy fields set on the command line
+    """
+    overrides: Dict[str, Any] = {}
+    if args.playwright_wait is not None:
+        overrides["wait_until"] = args.playwright_wait
+    if args.ready_selector is not None:
+        overrides["ready_selector"] = args.ready_selector or None
+    if args.block_types is not None:
+        overrides["blocked_resource_types"] = frozenset(
+            t.strip() for t in args.block_types.split(",") if t.strip()
+        )
+    if args.allow_third_party:
+        overrides["block_third_party"] = False
+    return overrides
+
+
+async def run_scraper(
+    source: str,
+    output_file: str,
+    max_articles: int,
+    timeout: int,
+    output_format: str = "json",
+    known_urls_file: Optional[str] = None,
+    replay: Optional[str] = None,
+    replay_latency: float = 0.0,
+    resource_policy_overrides: Optional[Dict[str, Any]] = None,
+    summary_file: Optional[str] = None,
+    frontier_url: Optional[str] = None,
+    frontier_options: Optional[Dict[str, Any]] = None,
+    **scraper_options: Any,
+) -> None:
     """
     Run the scraper and save results to a file.
 
     Args:
-        source: Source to scrape (currently only 'nvidia' is supported)
-        output_file: Path to output JSON file
+        source: Registered source to scrape (e.g. 'nvidia')
+        output_file: Path to output file, or "-" for stdout
         max_articles: Maximum number of articles to scrape
         timeout: Request timeout in seconds
+        output_format: "json" (one array written at the end) or "ndjson"
+            (one article per line, written as soon as it is scraped)
+        known_urls_file: File with already-scraped URLs, one per line
+        replay: Fixture archive to serve from a local replay server instead of the live site
+        replay_latency: Delay in seconds added to each replayed response
+        resource_policy_overrides: ResourcePolicy fields to change from the
+            scraper's default Playwright page-load policy
+        summary_file: Path to write the run telemetry summary (per-stage
+            timing percentiles and histograms, byte counts, methods, retries) as JSON
+        frontier_url: MongoDB connection string of a crawl frontier shared with
+            other workers; URLs are claimed from it instead of scraped directly
+        frontier_options: CrawlFrontier settings (worker_id, lease_seconds,
+            recrawl_after)
+        **scraper_options: Additional scraper settings (concurrency, max_connections,
+            http2, max_browser_pages, browser_recycle_after, state_dir, incremental,
+            extract_workers, record_fixtures, html_archive_dir, rate_limit, rate_burst,
+            respect_robots, detect_duplicates, deadline, max_response_bytes, use_feeds,
+            prune, prune_xpaths, payload_capture, journal_path, resume)
     """
     logger.info(
-        f"Starting scraper CLI",
+        "Starting scraper CLI",
         extra={
             "source": source,
             "output_file": output_file,
+            "output_format": output_format,
             "max_articles": max_articles,
             "timeout": timeout,
+            "known_urls_file": known_urls_file,
+            "replay": replay,
+            "replay_latency": replay_latency,
+            "resource_policy_overrides": resource_policy_overrides,
+            "summary_file": summary_file,
+            "frontier_url": frontier_url,
+            "frontier_options": frontier_options,
+            **scraper_options,
         },
     )
 
-    # Select scraper based on source
-    if source.lower() == "nvidia":
-        scraper = NvidiaScraper(max_articles=max_articles, timeout=timeout)
-    else:
+    if known_urls_file:
+        scraper_options["known_urls"] = load_known_urls(known_urls_file)
+
+    replay_server = None
+    if replay:
+        replay_server = ReplayServer(FixtureArchive.load(replay), latency=replay_latency).start()
+        scraper_options["base_url"] = replay_server.base_url
+
+    frontier = None
+    if frontier_url:
+        try:
+            frontier = CrawlFrontier.connect(frontier_url, **(frontier_options or {}))
+        except ImportError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        scraper_options["frontier"] = frontier
+
+    # Select scraper from the registry (built-ins plus installed plugins)
+    scraper_class = get_scraper_class(source)
+    if scraper_class is None:
         logger.error(f"Unsupported source: {source}")
-        print(f"Error: Unsupported source '{source}'. Supported sources: nvidia", file=sys.stderr)
+        print(
+            f"Error: Unsupported source '{source}'. "
+            f"Supported sources: {', '.join(available_sources())}",
+            file=sys.stderr,
+        )
         sys.exit(1)
+    scraper = scraper_class(max_articles=max_articles, timeout=timeout, **scraper_options)
+
+    if resource_policy_overrides:
+        scraper.resource_policy = replace(scraper.resource_policy, **resource_policy_overrides)
+
+    # Keep stdout clean for article data when streaming to it
+    info_stream = sys.stderr if output_file == STDOUT else sys.stdout
 
     try:
-        # Run scraper
-        articles = await scraper.scrape()
+        if frontier is not None:
+            await frontier.ensure_indexes()
 
-        if not articles:
+        # Run scraper with one pooled HTTP client for the whole run
+        with create_writer(output_file, output_format) as writer:
+            async with scraper:
+                if output_format == "ndjson":
+                    # Stream each article out as soon as it is scraped
+                    async for article in scraper.scrape_iter():
+                        writer.write(article)
+                else:
+                    for article in await scraper.scrape():
+                        writer.write(article)
+
+        if not writer.count:
             logger.warning("No articles were scraped")
             print("Warning: No articles were scraped", file=sys.stderr)
 
-        # Convert articles to JSON
-        articles_data = [article.model_dump(mode="json") for article in articles]
+        logger.info(
+            f"Successfully scraped {writer.count} articles to {output_file}",
+            extra={"article_count": writer.count, "output_file": output_file},
+        )
+
+        print(f"Successfully scraped {writer.count} articles", file=info_stream)
+        print(f"Output saved to: {output_file}", file=info_stream)
 
-        # Write to output file
-        output_path = Path(output_file)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        if scraper.unchanged_urls:
+            print(f"Skipped {len(scraper.unchanged_urls)} unchanged articles", file=info_stream)
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(articles_data, f, indent=2, ensure_ascii=False, default=str)
+        if scraper.skipped_urls:
+            reasons = Counter(scraper.skipped_urls.values())
+            print(
+                f"Skipped {len(scraper.skipped_urls)} articles ("
+                + ", ".join(f"{reason}: {count}" for reason, count in sorted(reasons.items()))
+                + ")",
+                file=info_stream,
+            )
 
-        logger.info(
-            f"Successfully scraped {len(articles)} articles to {output_file}",
-            extra={"article_count": len(articles), "output_file": output_file},
+        stats = scraper.connection_stats
+        print(
+            f"HTTP connections: {stats.connections_opened} opened, "
+            f"{stats.connections_reused} reused ({stats.requests} requests)",
+            file=info_stream,
         )
 
-        print(f"Successfully scraped {len(articles)} articles")
-        print(f"Output saved to: {output_file}")
+        for host, host_stats in scraper.politeness.stats().items():
+            print(
+                f"Politeness {host}: {host_stats['requests']} requests, "
+                f"queue wait mean {host_stats['mean_wait_ms']} ms / "
+                f"max {host_stats['max_wait_ms']} ms, {host_stats['throttled']} throttled",
+                file=info_stream,
+            )
+
+        if summary_file:
+            with open(summary_file, "w", encoding="utf-8") as f:
+                json.dump(scraper.run_telemetry.summary(), f, indent=2)
+            print(f"Run summary saved to: {summary_file}", file=info_stream)
+
+        if scraper.journal_path:
+            print(f"Run journal saved to: {scraper.journal_path}", file=info_stream)
+
+        if frontier is not None:
+            counts = await frontier.stats(source=scraper.get_source_name())
+            print(
+                f"Frontier ({frontier.worker_id}): "
+                + ", ".join(f"{state} {count}" for state, count in counts.items()),
+                file=info_stream,
+            )
 
     except Exception as e:
         logger.error(f"Scraping failed: {e}", extra={"error": str(e)})
         print(f"Error: Scraping failed - {e}", file=sys.stderr)
         sys.exit(1)
 
+    finally:
+        if replay_server is not None:
+            replay_server.stop()
+        if frontier is not None:
+            frontier.close()
+
+    if scraper.deadline_reached:
+        skipped = [url for url, reason in scraper.skipped_urls.items() if reason == "deadline"]
+        logger.warning(
+            f"Deadline reached, {len(skipped)} articles skipped",
+            extra={"deadline": scraper.deadline, "skipped_urls": skipped},
+        )
+        print(f"Partial run: deadline of {scraper.deadline}s reached", file=sys.stderr)
+        for url in skipped:
+            print(f"  skipped: {url}", file=sys.stderr)
+        sys.exit(EXIT_PARTIAL)
+
+
+async def run_all(
+    config_file: str,
+    output_file: Optional[str] = None,
+    output_format: Optional[str] = None,
+    global_concurrency: Optional[int] = None,
+) -> None:
+    """
+    Run every source in a config file concurrently and save results to one file.
+
+    Args:
+        config_file: YAML or JSON file listing the sources (see load_run_config)
+        output_file: Path to output file, or "-" for stdout (overrides the config)
+        output_format: "json" or "ndjson" (overrides the config)
+        global_concurrency: Articles in flight across all sources (overrides the config)
+    """
+    try:
+        config = load_run_config(config_file)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"Error: Invalid config {config_file} - {e}", file=sys.stderr)
+        sys.exit(1)
+
+    output_file = output_file or config.output or STDOUT
+    output_format = output_format or config.format
+    runner = MultiSourceRunner(config.sources, global_concurrency or config.concurrency)
+
+    info_stream = sys.stderr if output_file == STDOUT else sys.stdout
+
+    try:
+        with create_writer(output_file, output_format) as writer:
+            async for article in runner.run_iter():
+                writer.write(article)
+    except Exception as e:
+        logger.error(f"Multi-source run failed: {e}", extra={"error": str(e)})
+        print(f"Error: Scraping failed - {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Successfully scraped {writer.count} articles", file=info_stream)
+    print(f"Output saved to: {output_file}", file=info_stream)
+    for key, result in runner.results.items():
+        status = f"failed ({result.error})" if result.error else "ok"
+        print(f"  {key}: {result.scraped} articles, {status}", file=info_stream)
+
+    if any(result.error for result in runner.results.values()):
+        sys.exit(1)
+
+
+async def run_reextract(
+    source: str,
+    output_file: str,
+    archive_dir: str,
+    output_format: str = "json",
+    workers: Optional[int] = None,
+) -> None:
+    """
+    Re-extract articles from the raw HTML archive without network access.
+
+    Args:
+        source: Registered source whose archived pages are re-extracted
+        output_file: Path to output file, or "-" for stdout
+        archive_dir: HTML archive directory written with --archive-html
+        output_format: "json" or "ndjson"
+        workers: Extraction processes (default: CPU count)
+    """
+    scraper_class = get_scraper_class(source)
+    if scraper_class is None:
+        print(
+            f"Error: Unsupported source '{source}'. "
+            f"Supported sources: {', '.join(available_sources())}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+    workers = workers or os.cpu_count() or 1
+    # Keep every worker process busy while the next pages are read from the archive
+    scraper = scraper_class(
+        extract_workers=workers, concurrency=workers * 2, html_archive_dir=archive_dir
+    )
+    info_stream = sys.stderr if output_file == STDOUT else sys.stdout
+
+    try:
+        with create_writer(output_file, output_format) as writer:
+            async with scraper:
+                async for article in scraper.reextract_iter(ordered=output_format == "json"):
+                    writer.write(article)
+    except Exception as e:
+        logger.error(f"Re-extraction failed: {e}", extra={"error": str(e)})
+        print(f"Error: Re-extraction failed - {e}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"Re-extracted {writer.count} articles with {workers} workers", file=info_stream)
+    print(f"Output saved to: {output_file}", file=info_stream)
+
+
+def reextract_main(argv: List[str]) -> None:
+    """
+    Entry point for `intelligence-scraper re-extract`.
+
+    Args:
+        argv: Arguments after the `re-extract` subcommand
+    """
+    parser = argparse.ArgumentParser(
+        prog="intelligence-scraper re-extract",
+        description="Rebuild articles from archived raw HTML without refetching",
+    )
+    parser.add_argument("source", type=str, help="Source to re-extract (e.g., 'nvidia')")
+    parser.add_argument("output_file", type=str, help="Path to output file ('-' for stdout)")
+    parser.add_argument(
+        "--archive",
+        type=str,
+        required=True,
+        help="HTML archive directory written by a run with --archive-html",
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help="Output format (default: json)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of extraction processes (default: CPU count)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if not os.path.isdir(args.archive):
+        parser.error(f"--archive {args.archive} is not a directory")
+
+    asyncio.run(
+        run_reextract(args.source, args.output_file, args.archive, args.format, args.workers)
+    )
+
+
+def run_all_main(argv: List[str]) -> None:
+    """
+    Entry point for `intelligence-scraper run-all`.
+
+    Args:
+        argv: Arguments after the `run-all` subcommand
+    """
+    parser = argparse.ArgumentParser(
+        prog="intelligence-scraper run-all",
+        description="Scrape several sources concurrently under one concurrency budget",
+    )
+    parser.add_argument(
+        "--config",
+        type=str,
+        required=True,
+        help="YAML (requires the 'config' extra) or JSON file listing the sources",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Path to output file ('-' for stdout; default: from config, else stdout)",
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=OUTPUT_FORMATS,
+        default=None,
+        help="Output format (default: from config, else ndjson)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=None,
+        help="Articles in flight across all sources (default: from config, else 8)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.concurrency is not None and args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+
+    asyncio.run(run_all(args.config, args.output, args.format, args.concurrency))
+
 
-def main():
+def main() -> None:
     """
     Main CLI entry point.
 
     Command usage:
         intelligence-scraper <source> <output-file> [options]
+        intelligence-scraper run-all --config sources.yaml [options]
+        intelligence-scraper re-extract <source> <output-file> --archive DIR [options]
 
     Examples:
         intelligence-scraper nvidia articles.json
         intelligence-scraper nvidia articles.json --max-articles 50 --timeout 60
+        intelligence-scraper run-all --config sources.yaml --output articles.ndjson
     """
+    if len(sys.argv) > 1 and sys.argv[1] == "run-all":
+        run_all_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "re-extract":
+        reextract_main(sys.argv[2:])
+        return
+
     parser = argparse.ArgumentParser(
         description="Scrape articles from various sources",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -95,19 +469,40 @@ Examples:
   %(prog)s nvidia articles.json
   %(prog)s nvidia articles.json --max-articles 50
   %(prog)s nvidia articles.json --max-articles 100 --timeout 60
+  %(prog)s nvidia articles.json --concurrency 8
+  %(prog)s nvidia articles.json --deadline 1800
+  %(prog)s nvidia articles.json --rate-limit 2 --respect-robots
+  %(prog)s nvidia articles.json --state-dir .scraper-state --incremental
+  %(prog)s nvidia - --format ndjson
+  %(prog)s nvidia articles.json --record fixtures/nvidia.jsonl.gz
+  %(prog)s nvidia articles.json --replay fixtures/nvidia.jsonl.gz --replay-latency 0.2
+  %(prog)s run-all --config sources.yaml --output articles.ndjson --concurrency 8
+  %(prog)s nvidia articles.json --archive-html archive/
+  %(prog)s re-extract nvidia articles.json --archive archive/ --workers 8
         """,
     )
 
     parser.add_argument(
         "source",
         type=str,
-        help="Source to scrape (e.g., 'nvidia')",
+        help="Source to scrape (e.g., 'nvidia'), or the 'run-all' / 're-extract' command",
     )
 
     parser.add_argument(
         "output_file",
         type=str,
-        help="Path to output JSON file",
+        help="Path to output file ('-' for stdout)",
+    )
+
+    parser.add_argument(
+        "--format",
+        type=str,
+        choices=OUTPUT_FORMATS,
+        default="json",
+        help=(
+            "Output format: 'json' writes one array when the run finishes, 'ndjson' writes "
+            "each article as a JSON line as soon as it is scraped (default: json)"
+        ),
     )
 
     parser.add_argument(
@@ -124,10 +519,434 @@ Examples:
         help="Request timeout in seconds (default: 30)",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=BaseScraper.DEFAULT_CONCURRENCY,
+        help=(
+            "Maximum number of articles fetched in parallel "
+            f"(default: {BaseScraper.DEFAULT_CONCURRENCY}, 1 = sequential)"
+        ),
+    )
+
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        help=(
+            "Wall-clock budget for the run in seconds. Articles that cannot finish in time "
+            "are skipped or cancelled, completed ones are still written, and the exit "
+            f"status is {EXIT_PARTIAL} (partial)"
+        ),
+    )
+
+    parser.add_argument(
+        "--summary",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help=(
+            "Write a JSON run summary with p50/p95 and histograms per stage (connect, "
+            "download, extract, clean, Playwright, ...), byte counts, methods and retries"
+        ),
+    )
+
+    parser.add_argument(
+        "--journal",
+        type=str,
+        default=None,
+        metavar="FILE",
+        help=(
+            "Record discovered URLs, completed articles and failures in a run journal, "
+            "flushed after every article, so an interrupted run can be resumed"
+        ),
+    )
+
+    parser.add_argument(
+        "--resume",
+        type=str,
+        default=None,
+        metavar="JOURNAL",
+        help=(
+            "Continue the run recorded in a journal: completed articles are written "
+            "without being fetched again and only the remaining URLs are scraped"
+        ),
+    )
+
+    parser.add_argument(
+        "--max-response-bytes",
+        type=int,
+        default=DEFAULT_MAX_RESPONSE_BYTES,
+        help=(
+            "Largest article page read; bigger pages and non-HTML responses are skipped "
+            f"without reading the body (default: {DEFAULT_MAX_RESPONSE_BYTES})"
+        ),
+    )
+
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=BaseScraper.DEFAULT_MAX_CONNECTIONS,
+        help=(
+            "Maximum number of pooled HTTP connections "
+            f"(default: {BaseScraper.DEFAULT_MAX_CONNECTIONS})"
+        ),
+    )
+
+    parser.add_argument(
+        "--http2",
+        action="store_true",
+        help="Use HTTP/2 when available (requires the 'http2' extra)",
+    )
+
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=None,
+        help=(
+            "Requests per second allowed to each host (default: no fixed limit; "
+            "hosts answering 429/503 are always slowed down)"
+        ),
+    )
+
+    parser.add_argument(
+        "--rate-burst",
+        type=int,
+        default=1,
+        help="Requests to a host that may start back to back (default: 1)",
+    )
+
+    parser.add_argument(
+        "--respect-robots",
+        action="store_true",
+        help="Honour each host's robots.txt Crawl-delay / Request-rate",
+    )
+
+    parser.add_argument(
+        "--browser-pages",
+        type=int,
+        default=BaseScraper.DEFAULT_MAX_BROWSER_PAGES,
+        help=(
+            "Maximum number of Playwright pages open at once "
+            f"(default: {BaseScraper.DEFAULT_MAX_BROWSER_PAGES})"
+        ),
+    )
+
+    parser.add_argument(
+        "--browser-recycle-after",
+        type=int,
+        default=BaseScraper.DEFAULT_BROWSER_RECYCLE_AFTER,
+        help=(
+            "Relaunch Chromium after this many pages to limit memory growth "
+            f"(default: {BaseScraper.DEFAULT_BROWSER_RECYCLE_AFTER})"
+        ),
+    )
+
+    parser.add_argument(
+        "--state-dir",
+        type=str,
+        default=None,
+        help=(
+            "Directory for per-URL fetch state (ETag, Last-Modified, content hash) and "
+            "per-domain extraction strategy; unchanged articles are skipped on re-runs"
+        ),
+    )
+
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Only scrape articles not seen before (from --state-dir and --known-urls) and "
+            "stop paging the listing at the first page of known articles"
+        ),
+    )
+
+    parser.add_argument(
+        "--known-urls",
+        type=str,
+        default=None,
+        help="File with already-scraped article URLs, one per line (used with --incremental)",
+    )
+
+    parser.add_argument(
+        "--no-feeds",
+        action="store_true",
+        help=(
+            "Always walk the HTML listing instead of reading the site's sitemap or RSS feed "
+            "(with --incremental and --state-dir, feeds only list articles newer than the "
+            "last run)"
+        ),
+    )
+
+    parser.add_argument(
+        "--no-dedup",
+        action="store_true",
+        help=(
+            "Do not tag near-duplicate articles with metadata.duplicateOf "
+            "(the index persists across runs in --state-dir)"
+        ),
+    )
+
+    parser.add_argument(
+        "--extract-workers",
+        type=int,
+        default=0,
+        help=(
+            "Number of processes for trafilatura extraction; use the CPU count to scale "
+            "across cores (default: 0 = extract in a thread pool)"
+        ),
+    )
+
+    parser.add_argument(
+        "--no-prune",
+        action="store_true",
+        help=(
+            "Extract from the full page instead of first removing scripts, styles, "
+            "inline SVG, navigation and footers"
+        ),
+    )
+
+    parser.add_argument(
+        "--prune-xpath",
+        action="append",
+        default=[],
+        metavar="XPATH",
+        help="XPath of site boilerplate removed before extraction (repeatable)",
+    )
+
+    parser.add_argument(
+        "--archive-html",
+        type=str,
+        default=None,
+        metavar="DIR",
+        help=(
+            "Append the raw HTML of every fetched article to a compressed archive "
+            "(zstd with the 'archive' extra, else gzip) for use with re-extract"
+        ),
+    )
+
+    parser.add_argument(
+        "--playwright-wait",
+        type=str,
+        choices=WAIT_MODES,
+        default=None,
+        help="Page load event Playwright waits for (default: domcontentloaded)",
+    )
+
+    parser.add_argument(
+        "--ready-selector",
+        type=str,
+        default=None,
+        help="CSS selector that marks the article as rendered ('' to disable)",
+    )
+
+    parser.add_argument(
+        "--block-types",
+        type=str,
+        default=None,
+        help=(
+            "Comma-separated Playwright resource types to abort "
+            "(default: image,media,font; '' to block none)"
+        ),
+    )
+
+    parser.add_argument(
+        "--allow-third-party",
+        action="store_true",
+        help="Let Playwright load resources from third-party hosts",
+    )
+
+    parser.add_argument(
+        "--record",
+        type=str,
+        default=None,
+        metavar="ARCHIVE",
+        help="Record all listing and article responses into a fixture archive (*.jsonl.gz)",
+    )
+
+    parser.add_argument(
+        "--capture-url",
+        type=str,
+        default=None,
+        metavar="REGEX",
+        help=(
+            "Network-capture mode for Playwright pages: read the article from the first "
+            "XHR/fetch JSON response whose URL matches REGEX and close the page as soon as "
+            "it arrives, instead of rendering the page and reading its text"
+        ),
+    )
+
+    parser.add_argument(
+        "--capture-title",
+        type=str,
+        default="title",
+        metavar="PATH",
+        help="Dot path of the title in the captured JSON (default: title)",
+    )
+
+    parser.add_argument(
+        "--capture-content",
+        type=str,
+        default="body",
+        metavar="PATH",
+        help="Dot path of the HTML article body in the captured JSON (default: body)",
+    )
+
+    parser.add_argument(
+        "--capture-date",
+        type=str,
+        default="date",
+        metavar="PATH",
+        help="Dot path of the publish date in the captured JSON (default: date)",
+    )
+
+    parser.add_argument(
+        "--capture-wait",
+        type=float,
+        default=DEFAULT_CAPTURE_WAIT_MS,
+        metavar="MS",
+        help=(
+            "Milliseconds to wait for the captured JSON before rendering the page instead "
+            f"(default: {DEFAULT_CAPTURE_WAIT_MS:g})"
+        ),
+    )
+
+    parser.add_argument(
+        "--frontier",
+        type=str,
+        default=None,
+        metavar="MONGODB_URL",
+        help=(
+            "Share the crawl with other workers through a MongoDB frontier: discovered "
+            "URLs are added to it and articles are scraped from leased batches "
+            "(needs the 'mongo' extra)"
+        ),
+    )
+
+    parser.add_argument(
+        "--worker-id",
+        type=str,
+        default=None,
+        help="Lease owner name for this worker (default: host, PID and a random suffix)",
+    )
+
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=DEFAULT_LEASE_SECONDS,
+        help=(
+            "Seconds a claimed frontier URL stays leased before other workers may "
+            f"reclaim it; renewed while it is being scraped (default: {DEFAULT_LEASE_SECONDS:g})"
+        ),
+    )
+
+    parser.add_argument(
+        "--recrawl-after",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Make scraped frontier URLs due again after this long (default: fetch once)",
+    )
+
+    parser.add_argument(
+        "--replay",
+        type=str,
+        default=None,
+        metavar="ARCHIVE",
+        help="Scrape a recorded fixture archive from a local replay server (no network)",
+    )
+
+    parser.add_argument(
+        "--replay-latency",
+        type=float,
+        default=0.0,
+        help="Seconds of delay added to each replayed response (default: 0)",
+    )
+
     args = parser.parse_args()
 
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.browser_pages < 1 or args.browser_recycle_after < 1:
+        parser.error("--browser-pages and --browser-recycle-after must be at least 1")
+    if args.max_response_bytes < 1:
+        parser.error("--max-response-bytes must be at least 1")
+    if args.deadline is not None and args.deadline <= 0:
+        parser.error("--deadline must be positive")
+    if args.rate_limit is not None and args.rate_limit <= 0:
+        parser.error("--rate-limit must be positive")
+    if args.rate_burst < 1:
+        parser.error("--rate-burst must be at least 1")
+    if args.extract_workers < 0:
+        parser.error("--extract-workers must be 0 or greater")
+    if args.record and args.replay:
+        parser.error("--record and --replay cannot be used together")
+    if args.capture_wait <= 0:
+        parser.error("--capture-wait must be positive")
+    if args.lease_seconds <= 0:
+        parser.error("--lease-seconds must be positive")
+    if args.journal and args.resume:
+        parser.error("--journal and --resume cannot be used together")
+    if args.resume and not os.path.isfile(args.resume):
+        parser.error(f"--resume journal not found: {args.resume}")
+
+    payload_capture = None
+    if args.capture_url:
+        try:
+            re.compile(args.capture_url)
+        except re.error as e:
+            parser.error(f"--capture-url is not a valid regular expression: {e}")
+        payload_capture = PayloadCapture(
+            url_pattern=args.capture_url,
+            title_path=args.capture_title,
+            content_path=args.capture_content,
+            date_path=args.capture_date,
+            wait_ms=args.capture_wait,
+        )
+
     # Run scraper
-    asyncio.run(run_scraper(args.source, args.output_file, args.max_articles, args.timeout))
+    asyncio.run(
+        run_scraper(
+            args.source,
+            args.output_file,
+            args.max_articles,
+            args.timeout,
+            output_format=args.format,
+            known_urls_file=args.known_urls,
+            replay=args.replay,
+            replay_latency=args.replay_latency,
+            resource_policy_overrides=parse_resource_policy_args(args),
+            summary_file=args.summary,
+            frontier_url=args.frontier,
+            frontier_options={
+                "worker_id": args.worker_id,
+                "lease_seconds": args.lease_seconds,
+                "recrawl_after": args.recrawl_after,
+            },
+            concurrency=args.concurrency,
+            max_connections=args.max_connections,
+            http2=args.http2,
+            max_browser_pages=args.browser_pages,
+            browser_recycle_after=args.browser_recycle_after,
+            state_dir=args.state_dir,
+            incremental=args.incremental,
+            extract_workers=args.extract_workers,
+            record_fixtures=args.record,
+            html_archive_dir=args.archive_html,
+            rate_limit=args.rate_limit,
+            rate_burst=args.rate_burst,
+            respect_robots=args.respect_robots,
+            detect_duplicates=not args.no_dedup,
+            deadline=args.deadline,
+            max_response_bytes=args.max_response_bytes,
+            use_feeds=not args.no_feeds,
+            prune=not args.no_prune,
+            prune_xpaths=args.prune_xpath,
+            payload_capture=payload_capture,
+            journal_path=args.resume or args.journal,
+            resume=bool(args.resume),
+        )
+    )
 
 
 if __name__ == "__main__":
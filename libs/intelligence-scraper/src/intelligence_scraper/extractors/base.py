@@ -4,9 +4,64 @@ Base scraper abstract class
 Defines the interface that all scrapers must implement.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
-from typing import List
+from contextlib import asynccontextmanager, nullcontext
+from dataclasses import replace
+from datetime import datetime, timedelta
+from types import TracebackType
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import httpx
+
 from intelligence_scraper.models import ScrapedArticle
+from intelligence_scraper.utils.browser_pool import BrowserPool
+from intelligence_scraper.utils.dedup import DuplicateIndex, simhash
+from intelligence_scraper.utils.extraction import ExtractionExecutor
+from intelligence_scraper.utils.feeds import (
+    DEFAULT_MAX_FEED_BYTES,
+    discover_feed_entries,
+    newest_first,
+)
+from intelligence_scraper.utils.fetch_state import FetchStateStore, content_hash
+from intelligence_scraper.utils.fixtures import FixtureArchive
+from intelligence_scraper.utils.frontier import CrawlFrontier, FrontierItem
+from intelligence_scraper.utils.html_archive import ArchiveEntry, HtmlArchive
+from intelligence_scraper.utils.http import (
+    DEFAULT_MAX_RESPONSE_BYTES,
+    ConnectionStats,
+    HtmlBody,
+    ResponseSkipped,
+    create_http_client,
+    read_html_body,
+)
+from intelligence_scraper.utils.journal import RunJournal
+from intelligence_scraper.utils.logger import get_logger
+from intelligence_scraper.utils.network_capture import PayloadCapture
+from intelligence_scraper.utils.page_load import ResourcePolicy
+from intelligence_scraper.utils.politeness import PolitenessScheduler
+from intelligence_scraper.utils.pruning import PruneRules
+from intelligence_scraper.utils.retry import CircuitBreaker, RetryPolicy
+from intelligence_scraper.utils.strategy import StrategyMemory
+from intelligence_scraper.utils.telemetry import DEDUP, ArticleTelemetry, RunTelemetry, stage
+
+logger = get_logger("intelligence.scraper.base")
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 class BaseScraper(ABC):
@@ -14,32 +69,1024 @@ class BaseScraper(ABC):
     Abstract base class for all web scrapers.
 
     All scraper implementations must inherit from this class and implement
-    the scrape method.
+    the scrape_iter method; scrape() is built on it.
+
+    A scraper owns one pooled HTTP client and one browser pool for the whole
+    run. Use it as an async context manager to keep them open across several
+    scrape calls:
+
+        async with NvidiaScraper() as scraper:
+            articles = await scraper.scrape()
     """
 
-    def __init__(self, max_articles: int = 100, timeout: int = 30):
+    DEFAULT_CONCURRENCY = 4
+    DEFAULT_MAX_CONNECTIONS = 10
+    DEFAULT_MAX_BROWSER_PAGES = 2
+    DEFAULT_BROWSER_RECYCLE_AFTER = 50
+
+    def __init__(
+        self,
+        max_articles: int = 100,
+        timeout: int = 30,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: Optional[int] = None,
+        http2: bool = False,
+        max_browser_pages: int = DEFAULT_MAX_BROWSER_PAGES,
+        browser_recycle_after: int = DEFAULT_BROWSER_RECYCLE_AFTER,
+        state_dir: Optional[str] = None,
+        incremental: bool = False,
+        known_urls: Optional[Iterable[str]] = None,
+        extract_workers: int = 0,
+        record_fixtures: Optional[str] = None,
+        resource_policy: Optional[ResourcePolicy] = None,
+        html_archive_dir: Optional[str] = None,
+        rate_limit: Optional[float] = None,
+        rate_burst: int = 1,
+        respect_robots: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        detect_duplicates: bool = True,
+        deadline: Optional[float] = None,
+        max_response_bytes: int = DEFAULT_MAX_RESPONSE_BYTES,
+        use_feeds: bool = True,
+        prune: bool = True,
+        prune_xpaths: Sequence[str] = (),
+        payload_capture: Optional[PayloadCapture] = None,
+        frontier: Optional[CrawlFrontier] = None,
+        journal_path: Optional[str] = None,
+        resume: bool = False,
+    ):
         """
         Initialize the scraper with configuration.
 
         Args:
             max_articles: Maximum number of articles to scrape
             timeout: Request timeout in seconds
+            concurrency: Maximum number of articles fetched in parallel (1 = sequential)
+            max_connections: Maximum number of open connections in the HTTP pool
+            max_keepalive_connections: Maximum idle connections kept alive
+                (default: same as max_connections)
+            http2: Use HTTP/2 when the optional `h2` package is installed
+            max_browser_pages: Maximum number of Playwright pages open at once
+            browser_recycle_after: Pages served before Chromium is relaunched
+            state_dir: Directory for the per-URL fetch state store and extraction
+                strategy memory; enables conditional requests, skipping of
+                unchanged pages and remembering which pages need a browser
+            incremental: Only scrape URLs not seen before, and stop walking the
+                listing at the first page made up entirely of known URLs
+            known_urls: URLs already scraped, in addition to those in the
+                fetch state store (used in incremental mode)
+            extract_workers: Number of processes for content extraction
+                (0 = extract in a thread pool)
+            record_fixtures: Path of a fixture archive to record all HTTP
+                responses into; written when the scraper is closed
+            resource_policy: Resource blocking and wait strategy for Playwright
+                page loads (default: default_resource_policy())
+            html_archive_dir: Directory of a compressed archive that stores the
+                raw HTML of every fetched article for later re-extraction
+            rate_limit: Requests per second allowed to each host (None = no fixed
+                limit; 429/503 responses still slow a host down)
+            rate_burst: Requests to a host that may start back to back
+            respect_robots: Honour each host's robots.txt Crawl-delay
+            retry_policy: Which article failures are retried and the backoff
+                between attempts (default: default_retry_policy())
+            circuit_breaker: Per-host breaker that skips articles while a host
+                keeps failing (default: CircuitBreaker())
+            detect_duplicates: Tag near-duplicate articles with the URL of the
+                first copy seen (persisted across runs in state_dir)
+            deadline: Wall-clock budget in seconds for each scrape run; articles
+                that cannot finish in time are skipped and in-flight ones cancelled
+            max_response_bytes: Largest article page read; bigger responses and
+                non-HTML Content-Types are skipped without reading the body
+            use_feeds: List articles from the site's sitemaps and RSS/Atom feeds
+                (see feed_urls()) before falling back to scraping HTML listings
+            prune: Remove scripts, styles, inline SVG, navigation, footers and
+                default_prune_rules() selectors from pages before extraction
+            prune_xpaths: Extra XPath selectors of site boilerplate to remove
+                before extraction
+            payload_capture: For Playwright pages, read the article from the
+                XHR/fetch JSON that hydrates it instead of the rendered text
+                (default: default_payload_capture())
+            frontier: Shared crawl frontier; discovered URLs are added to it and
+                articles are scraped from batches claimed from it, so several
+                workers can split one crawl
+            journal_path: File that records the discovered URLs, completed
+                articles and failures of each run, flushed after every article
+            resume: Continue the run recorded in journal_path: its completed
+                articles are yielded again without being fetched and only the
+                remaining URLs are scraped
         """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if extract_workers < 0:
+            raise ValueError("extract_workers must be 0 or greater")
+        if deadline is not None and deadline <= 0:
+            raise ValueError("deadline must be positive")
+        if resume and not journal_path:
+            raise ValueError("resume needs a journal_path")
+
         self.max_articles = max_articles
         self.timeout = timeout
+        self.concurrency = concurrency
+        self.max_connections = max_connections
+        self.max_keepalive_connections = (
+            max_keepalive_connections if max_keepalive_connections is not None else max_connections
+        )
+        self.http2 = http2
+        self.max_browser_pages = max_browser_pages
+        self.browser_recycle_after = browser_recycle_after
+        self.connection_stats = ConnectionStats()
+        self._client: Optional[httpx.AsyncClient] = None
+        self._browser_pool: Optional[BrowserPool] = None
+        self.state_dir = state_dir
+        self.fetch_state: Optional[FetchStateStore] = None
+        self._strategy: Optional[StrategyMemory] = None
+        self.unchanged_urls: Set[str] = set()
+        self._pending_fetch_state: Dict[str, Tuple[Optional[str], Optional[str], str]] = {}
+        self.incremental = incremental
+        self.known_urls: Set[str] = set(known_urls or ())
+        self.extract_workers = extract_workers
+        self._extractor: Optional[ExtractionExecutor] = None
+        self.record_fixtures = record_fixtures
+        self._fixture_archive: Optional[FixtureArchive] = None
+        self.resource_policy = resource_policy or self.default_resource_policy()
+        self.html_archive_dir = html_archive_dir
+        self.html_archive: Optional[HtmlArchive] = None
+        self.politeness = PolitenessScheduler(
+            requests_per_second=rate_limit, burst=rate_burst, respect_robots=respect_robots
+        )
+        self.retry_policy = retry_policy or self.default_retry_policy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        # URLs given up on without an attempt, with the reason
+        self.skipped_urls: Dict[str, str] = {}
+        self.detect_duplicates = detect_duplicates
+        self.deadline = deadline
+        self.max_response_bytes = max_response_bytes
+        self.use_feeds = use_feeds
+        prune_rules = self.default_prune_rules() if prune else PruneRules.none()
+        self.prune_rules = replace(prune_rules, xpaths=prune_rules.xpaths + tuple(prune_xpaths))
+        self.payload_capture = payload_capture or self.default_payload_capture()
+        self.frontier = frontier
+        # Frontier URLs this worker holds leases on, by URL
+        self._frontier_leases: Dict[str, FrontierItem] = {}
+        self.journal_path = journal_path
+        self.resume = resume
+        self.journal: Optional[RunJournal] = None
+        # Newest feed entry date listed this run, stored once the run completes
+        self._pending_watermark: Optional[datetime] = None
+        # Dates of the dated feed entries listed this run, by URL
+        self._feed_entry_dates: Dict[str, datetime] = {}
+        # URLs that failed or were skipped for a reason a later run may not hit
+        self._unfinished_urls: Set[str] = set()
+        self._deadline_at: Optional[float] = None
+        # Running mean of article durations, used to avoid starting work that cannot finish
+        self._article_seconds: Optional[float] = None
+        self.duplicate_index: Optional[DuplicateIndex] = None
+        self.run_telemetry = RunTelemetry()
+        # Optional budget shared with other scrapers running in the same process
+        self.shared_limiter: Optional[asyncio.Semaphore] = None
+
+    def default_resource_policy(self) -> ResourcePolicy:
+        """
+        Get the Playwright page-load policy used when none is configured.
+
+        Returns:
+            ResourcePolicy: Blocks images, media, fonts and third-party hosts and
+                stops waiting at DOMContentLoaded
+        """
+        return ResourcePolicy()
+
+    def default_prune_rules(self) -> PruneRules:
+        """
+        Get the markup removed from pages before extraction.
+
+        Returns:
+            PruneRules: Drops script (except JSON-LD), style, noscript, svg, nav
+                and footer elements
+        """
+        return PruneRules()
+
+    def default_payload_capture(self) -> Optional[PayloadCapture]:
+        """
+        Get where the site's article JSON payload is, for network-capture mode.
+
+        Returns:
+            Optional[PayloadCapture]: None, so Playwright renders pages and reads
+                their text unless a capture is configured
+        """
+        return None
+
+    def default_retry_policy(self) -> RetryPolicy:
+        """
+        Get the retry policy used when none is configured.
+
+        Returns:
+            RetryPolicy: Two attempts with jittered exponential backoff
+        """
+        return RetryPolicy()
+
+    async def __aenter__(self) -> "BaseScraper":
+        """Open the shared resources used for scraping."""
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        """Close the shared resources used for scraping."""
+        await self.close()
+
+    async def open(self) -> None:
+        """Open the pooled HTTP client and browser pool if they are not already open."""
+        if self._client is None:
+            if self.record_fixtures:
+                self._fixture_archive = FixtureArchive()
+            self._client = create_http_client(
+                timeout=self.timeout,
+                stats=self.connection_stats,
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                http2=self.http2,
+                record_archive=self._fixture_archive,
+                scheduler=self.politeness,
+            )
+        if self._browser_pool is None:
+            # Chromium itself is only launched when the first page is requested
+            self._browser_pool = BrowserPool(
+                max_pages=self.max_browser_pages,
+                recycle_after=self.browser_recycle_after,
+            )
+        if self._extractor is None:
+            self._extractor = ExtractionExecutor(
+                workers=self.extract_workers, thread_workers=self.concurrency
+            )
+        if self.fetch_state is None and self.state_dir:
+            self.fetch_state = FetchStateStore(self.state_dir)
+        if self._strategy is None:
+            # Without a state directory the memory only lasts for this run
+            self._strategy = StrategyMemory(self.state_dir)
+        if self.duplicate_index is None and self.detect_duplicates:
+            # Without a state directory duplicates are only found within this run
+            self.duplicate_index = DuplicateIndex(self.state_dir)
+        if self.html_archive is None and self.html_archive_dir:
+            self.html_archive = HtmlArchive(self.html_archive_dir)
+
+    async def close(self) -> None:
+        """Close the browser pool, extraction workers, HTTP client and state stores."""
+        if self._extractor is not None:
+            self._extractor.close()
+            self._extractor = None
+
+        if self.fetch_state is not None:
+            self.fetch_state.close()
+            self.fetch_state = None
+
+        if self._strategy is not None:
+            self._strategy.close()
+            self._strategy = None
+
+        if self.duplicate_index is not None:
+            self.duplicate_index.close()
+            self.duplicate_index = None
+
+        if self.html_archive is not None:
+            self.html_archive.close()
+            self.html_archive = None
+
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+
+        if self._browser_pool is not None:
+            await self._browser_pool.close()
+            self._browser_pool = None
+
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.info(
+                "HTTP client closed",
+                extra={
+                    "connection_stats": self.connection_stats.to_dict(),
+                    "politeness": self.politeness.stats(),
+                },
+            )
+
+        if self._fixture_archive is not None and self.record_fixtures:
+            self._fixture_archive.save(self.record_fixtures)
+            self._fixture_archive = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Get the shared HTTP client.
+
+        Raises:
+            RuntimeError: If the scraper has not been opened
+        """
+        if self._client is None:
+            raise RuntimeError("Scraper is not open; use 'async with' or call open() first")
+        return self._client
+
+    @property
+    def browser_pool(self) -> BrowserPool:
+        """
+        Get the shared Playwright browser pool.
+
+        Raises:
+            RuntimeError: If the scraper has not been opened
+        """
+        if self._browser_pool is None:
+            raise RuntimeError("Scraper is not open; use 'async with' or call open() first")
+        return self._browser_pool
+
+    def _get_known_urls(self) -> Set[str]:
+        """
+        Get every URL considered already scraped for incremental runs.
+
+        Returns:
+            Set[str]: Supplied known URLs plus URLs in the fetch state store
+        """
+        known = set(self.known_urls)
+        if self.fetch_state is not None:
+            known |= self.fetch_state.known_urls()
+        return known
+
+    def feed_urls(self) -> List[str]:
+        """
+        Get candidate sitemap and feed URLs, in order of preference.
+
+        Subclasses list their site's sitemaps and RSS/Atom feeds here.
+
+        Returns:
+            List[str]: Candidate URLs (default: none, so listings are always scraped)
+        """
+        return []
+
+    def is_article_url(self, url: str) -> bool:
+        """Check whether a sitemap or feed entry is an article page (default: all entries)."""
+        return True
+
+    async def _discover_feed_urls(self) -> Optional[List[str]]:
+        """
+        List article URLs from the first sitemap or feed that lists articles.
+
+        In incremental mode, known URLs and entries not newer than the stored
+        watermark are dropped, and the oldest new entries are taken first so a
+        backlog larger than max_articles is worked through across runs instead
+        of being skipped. The watermark advances when the run completes.
+
+        Returns:
+            Optional[List[str]]: Article URLs, newest first (at most max_articles),
+                or None when the site has no usable sitemap or feed
+        """
+        candidates = self.feed_urls() if self.use_feeds else []
+        if not candidates:
+            return None
+
+        watermark = None
+        if self.incremental and self.fetch_state is not None:
+            watermark = self.fetch_state.get_watermark(self.get_source_name())
+
+        entries = await discover_feed_entries(
+            self.client,
+            candidates,
+            watermark=watermark,
+            accept=self.is_article_url,
+            max_bytes=max(self.max_response_bytes, DEFAULT_MAX_FEED_BYTES),
+        )
+        if entries is None:
+            return None
+
+        if self.incremental:
+            known = self._get_known_urls()
+            entries = [entry for entry in entries if entry.url not in known]
+        if watermark is not None and len(entries) > self.max_articles:
+            backlog = sorted(entries, key=lambda e: (e.updated is None, e.updated or watermark))
+            entries = newest_first(backlog[: self.max_articles])
+        entries = entries[: self.max_articles]
+
+        if self.incremental and self.fetch_state is not None:
+            dates = [entry.updated for entry in entries if entry.updated is not None]
+            if dates and (watermark is None or max(dates) > watermark):
+                self._pending_watermark = max(dates)
+            self._feed_entry_dates = {
+                entry.url: entry.updated for entry in entries if entry.updated is not None
+            }
+        return [entry.url for entry in entries]
+
+    def _commit_feed_watermark(self) -> None:
+        """
+        Store the run's feed watermark unless the run was cut short.
+
+        The watermark stays below the oldest listed entry that failed or was
+        skipped for a retryable reason (e.g. an open circuit), so the next run
+        lists it again; entries scraped meanwhile are dropped as known URLs.
+        """
+        if self._pending_watermark is None or self.fetch_state is None or self.deadline_reached:
+            return
+
+        watermark = self._pending_watermark
+        unfinished = [
+            self._feed_entry_dates[url]
+            for url in self._unfinished_urls
+            if url in self._feed_entry_dates
+        ]
+        if unfinished:
+            # Entries are listed again only when strictly newer than the watermark
+            watermark = min(watermark, min(unfinished) - timedelta(microseconds=1))
+            stored = self.fetch_state.get_watermark(self.get_source_name())
+            if stored is not None and watermark <= stored:
+                logger.info(
+                    "Feed watermark held back by unfinished articles",
+                    extra={"unfinished": len(unfinished)},
+                )
+                return
+
+        self.fetch_state.set_watermark(self.get_source_name(), watermark)
+        logger.info(
+            "Feed watermark advanced",
+            extra={"watermark": watermark.isoformat(), "unfinished": len(unfinished)},
+        )
+
+    def _check_unchanged(
+        self, url: str, response: httpx.Response, body_hash: Optional[str] = None
+    ) -> bool:
+        """
+        Check a page response against the stored fetch state.
+
+        Returns True (and marks the URL unchanged) for a 304 response or a body
+        whose hash matches the last fetch. Otherwise remembers the response's
+        validators so they can be committed once the article is extracted.
+
+        Args:
+            url: Page URL
+            response: Response to a (possibly conditional) GET
+            body_hash: Content hash of the body if it was already read by streaming
+                (default: hash of response.content)
+
+        Returns:
+            bool: True if the page has not changed since the last run
+        """
+        if self.fetch_state is None:
+            return False
+
+        if response.status_code == 304:
+            self._mark_unchanged(url)
+            return True
+
+        if body_hash is None:
+            body_hash = content_hash(response.content)
+        state = self.fetch_state.get(url)
+        if state is not None and state.content_hash == body_hash:
+            self._mark_unchanged(url)
+            return True
+
+        self._pending_fetch_state[url] = (
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            body_hash,
+        )
+        return False
+
+    async def _read_html(self, url: str, response: httpx.Response) -> Optional[HtmlBody]:
+        """
+        Read an article page body within the size cap.
+
+        Args:
+            url: Page URL
+            response: Streamed response
+
+        Returns:
+            Optional[HtmlBody]: Body, or None if the page was skipped (recorded in skipped_urls)
+        """
+        try:
+            return await read_html_body(response, self.max_response_bytes)
+        except ResponseSkipped as e:
+            logger.warning(
+                f"Skipping response: {e}",
+                extra={"url": url, "reason": e.reason, "detail": e.detail},
+            )
+            self._skip(url, e.reason)
+            return None
+
+    def _conditional_headers(self, url: str) -> Dict[str, str]:
+        """Get conditional request headers for a URL from the fetch state store."""
+        if self.fetch_state is None:
+            return {}
+        state = self.fetch_state.get(url)
+        return state.conditional_headers() if state else {}
+
+    async def _tag_duplicate(self, article: ScrapedArticle) -> ScrapedArticle:
+        """
+        Add the content signature and, for near-duplicates, the canonical URL to metadata.
+
+        Sets metadata "contentSimhash" on every article, and "duplicateOf" /
+        "duplicateDistance" when the content matches an earlier article, so
+        downstream stages can skip the copy.
+
+        Args:
+            article: Scraped article
+
+        Returns:
+            ScrapedArticle: The same article, tagged
+        """
+        if self.duplicate_index is None:
+            return article
+
+        with stage(DEDUP):
+            signature = await self.extractor.run(simhash, article.content)
+            match = self.duplicate_index.check(str(article.url), signature)
+
+        article.metadata["contentSimhash"] = f"{signature:016x}"
+        if match is not None:
+            canonical_url, distance = match
+            article.metadata["duplicateOf"] = canonical_url
+            article.metadata["duplicateDistance"] = distance
+            logger.info(
+                "Near-duplicate article found",
+                extra={
+                    "url": str(article.url),
+                    "duplicate_of": canonical_url,
+                    "distance": distance,
+                },
+            )
+        return article
+
+    def _skip(self, url: str, reason: str) -> None:
+        """Record that a URL was skipped without being scraped."""
+        self.skipped_urls[url] = reason
+
+    def _record_telemetry(
+        self, url: str, article: Optional[ScrapedArticle], telemetry: ArticleTelemetry
+    ) -> None:
+        """
+        Add an article's stage timings to the run summary and its metadata.
+
+        Args:
+            url: Article URL
+            article: Scraped article, or None if it was not scraped
+            telemetry: Measurements collected while scraping it
+        """
+        if article is not None:
+            article.metadata["telemetry"] = telemetry.to_dict()
+            self.run_telemetry.record(
+                telemetry, "scraped", method=article.metadata.get("scraperMethod")
+            )
+        elif url in self.unchanged_urls:
+            self.run_telemetry.record(telemetry, "unchanged")
+        else:
+            self.run_telemetry.record(telemetry, self.skipped_urls.get(url, "failed"))
+
+    def _article_outcome(self, url: str, article: Optional[ScrapedArticle]) -> str:
+        """
+        Classify how an attempted article ended.
+
+        Returns:
+            str: "done" (scraped, unchanged, or skipped for a reason a retry would
+                not fix), "retry" (not attempted: deadline or open circuit) or "failed"
+        """
+        reason = self.skipped_urls.get(url)
+        if article is not None or url in self.unchanged_urls:
+            return "done"
+        if reason in ("deadline", "circuit_open"):
+            return "retry"
+        # Non-HTML or oversized pages will not change on a retry
+        return "done" if reason is not None else "failed"
+
+    def _record_outcome(self, url: str, article: Optional[ScrapedArticle]) -> None:
+        """Remember how an article ended for the feed watermark and the run journal."""
+        outcome = self._article_outcome(url, article)
+        if outcome != "done":
+            self._unfinished_urls.add(url)
+        if self.journal is None:
+            return
+        if outcome == "done":
+            self.journal.record_completed(url, article)
+        elif outcome == "failed":
+            self.journal.record_failed(url, "failed")
+
+    async def _journaled_discovery(
+        self, discover: Callable[[], Awaitable[Optional[List[str]]]]
+    ) -> List[str]:
+        """
+        Get the run's article URLs, from the resumed journal if it has them.
+
+        Otherwise the URLs are discovered and recorded in the journal, if one is kept.
+
+        Args:
+            discover: Coroutine function listing the article URLs
+
+        Returns:
+            List[str]: Article URLs
+        """
+        if self.journal is not None and self.journal.discovered is not None:
+            logger.info(
+                "Resuming run from journal",
+                extra={
+                    "journal": self.journal_path,
+                    "discovered": len(self.journal.discovered),
+                    "completed": len(self.journal.completed),
+                },
+            )
+            return list(self.journal.discovered)
+
+        urls = await discover() or []
+        if self.journal is not None:
+            self.journal.record_discovered(urls)
+        return urls
+
+    def _resumed_articles(self, urls: Sequence[str]) -> List[Tuple[int, ScrapedArticle]]:
+        """
+        Get the articles a resumed run already completed (none for a new run).
+
+        Args:
+            urls: The run's article URLs in listing order
+
+        Returns:
+            List[Tuple[int, ScrapedArticle]]: Listing position and article, in listing order
+        """
+        if self.journal is None:
+            return []
+        position = {url: index for index, url in enumerate(urls)}
+        replay = [
+            (position.get(url, -1), article) for url, article in self.journal.articles().items()
+        ]
+        return sorted(replay, key=lambda item: item[0])
+
+    def _pending_urls(self, urls: Sequence[str]) -> List[str]:
+        """Drop URLs a resumed run already completed."""
+        return self.journal.pending(urls) if self.journal is not None else list(urls)
+
+    def _start_run(self) -> None:
+        """Reset per-run results, open the run journal and start the deadline clock."""
+        self.unchanged_urls.clear()
+        self.skipped_urls.clear()
+        self.run_telemetry = RunTelemetry()
+        self._pending_watermark = None
+        self._feed_entry_dates = {}
+        self._unfinished_urls.clear()
+        if self.journal_path:
+            if self.journal is not None:
+                self.journal.close()
+            self.journal = RunJournal(self.journal_path, resume=self.resume)
+            self.journal.record_run(self.get_source_name())
+        self._deadline_at = (
+            asyncio.get_running_loop().time() + self.deadline if self.deadline else None
+        )
+
+    @property
+    def deadline_reached(self) -> bool:
+        """Whether the last run skipped or cancelled articles because of its deadline."""
+        return "deadline" in self.skipped_urls.values()
+
+    def _deadline_remaining(self) -> Optional[float]:
+        """Seconds left in the run's budget (None = no deadline)."""
+        if self._deadline_at is None:
+            return None
+        return self._deadline_at - asyncio.get_running_loop().time()
+
+    async def _run_before_deadline(
+        self,
+        url: str,
+        work: Callable[[], Awaitable[Optional[R]]],
+        track_duration: bool = True,
+    ) -> Optional[R]:
+        """
+        Run the work for one URL within the run's deadline.
+
+        The work is not started if the deadline has passed or less time is left
+        than an average article takes, and is cancelled if the deadline passes
+        while it runs. Either way the URL is recorded in skipped_urls.
+
+        Args:
+            url: URL the work is for
+            work: Coroutine function doing the work
+            track_duration: Count the work's duration in the average article time
+                (disable for non-article work such as the listing crawl)
+
+        Returns:
+            Optional[R]: The work's result, or None if it was skipped or cancelled
+        """
+        remaining = self._deadline_remaining()
+        if remaining is None:
+            return await work()
+
+        expected = self._article_seconds if track_duration else None
+        if remaining <= 0 or (expected is not None and remaining < expected):
+            self._skip(url, "deadline")
+            return None
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            async with asyncio.timeout_at(self._deadline_at):
+                result = await work()
+        except TimeoutError:
+            remaining = self._deadline_remaining()
+            if remaining is not None and remaining > 0:
+                raise
+            logger.warning("Run deadline reached, cancelled in-flight article", extra={"url": url})
+            self._skip(url, "deadline")
+            return None
+
+        if not track_duration:
+            return result
+
+        elapsed = loop.time() - started
+        self._article_seconds = (
+            elapsed
+            if self._article_seconds is None
+            else 0.8 * self._article_seconds + 0.2 * elapsed
+        )
+        return result
+
+    def _mark_unchanged(self, url: str) -> None:
+        """Record that a URL was found unchanged in this run."""
+        self.unchanged_urls.add(url)
+        if self.fetch_state is not None:
+            self.fetch_state.mark_unchanged(url)
+
+    def _commit_fetch_state(self, url: str) -> None:
+        """Persist the validators of a page once its article was extracted."""
+        pending = self._pending_fetch_state.pop(url, None)
+        if self.fetch_state is not None and pending is not None:
+            self.fetch_state.record(url, *pending)
+
+    def _archive_html(self, url: str, html: str) -> None:
+        """Store the raw HTML of a fetched article when an archive is configured."""
+        if self.html_archive is not None:
+            self.html_archive.append(url, html, self.get_source_name())
+
+    @property
+    def strategy(self) -> StrategyMemory:
+        """
+        Get the per-domain extraction strategy memory.
+
+        Raises:
+            RuntimeError: If the scraper has not been opened
+        """
+        if self._strategy is None:
+            raise RuntimeError("Scraper is not open; use 'async with' or call open() first")
+        return self._strategy
+
+    @property
+    def extractor(self) -> ExtractionExecutor:
+        """
+        Get the executor used for CPU-bound content extraction.
+
+        Raises:
+            RuntimeError: If the scraper has not been opened
+        """
+        if self._extractor is None:
+            raise RuntimeError("Scraper is not open; use 'async with' or call open() first")
+        return self._extractor
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[None]:
+        """
+        Ensure shared resources are open for the duration of a scrape.
+
+        Resources opened here are closed on exit; resources that were already
+        open (e.g. via 'async with scraper') are left for the owner to close.
+        """
+        owned = self._client is None
+        if owned:
+            await self.open()
+        try:
+            yield
+        finally:
+            if owned:
+                await self.close()
+
+    async def _iter_bounded(
+        self,
+        items: Sequence[T],
+        worker: Callable[[int, T], Awaitable[R]],
+        ordered: bool = False,
+    ) -> AsyncIterator[R]:
+        """
+        Run a worker over items with at most `concurrency` running at once.
+
+        When `shared_limiter` is set, each item also holds a slot of that
+        shared budget while it runs.
+
+        Args:
+            items: Items to process
+            worker: Coroutine function called with (index, item)
+            ordered: Yield results in item order instead of completion order
+
+        Yields:
+            Worker results as they become available
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def _bounded(index: int, item: T) -> R:
+            async with semaphore, self.shared_limiter or nullcontext():
+                return await worker(index, item)
+
+        tasks = [asyncio.create_task(_bounded(i, item)) for i, item in enumerate(items)]
+        try:
+            if ordered:
+                for task in tasks:
+                    yield await task
+            else:
+                for next_done in asyncio.as_completed(tasks):
+                    yield await next_done
+        finally:
+            # Stop outstanding work if the consumer stops iterating early
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _iter_frontier(
+        self, worker: Callable[[int, str], Awaitable[Optional[ScrapedArticle]]]
+    ) -> AsyncIterator[Optional[ScrapedArticle]]:
+        """
+        Run a worker over URLs claimed from the crawl frontier.
+
+        Claims this source's due URLs `concurrency` at a time until max_articles
+        have been attempted, nothing is due or the deadline has passed. Leases
+        are renewed in the background while a batch runs. Each URL is then
+        marked done, failed (retried after a backoff) or, when it was skipped
+        for the deadline or an open circuit, given back without using an attempt.
+
+        Args:
+            worker: Coroutine function called with (index, url)
+
+        Yields:
+            Worker results as they become available
+
+        Raises:
+            RuntimeError: If the scraper has no crawl frontier
+        """
+        frontier = self.frontier
+        if frontier is None:
+            raise RuntimeError("Scraper has no crawl frontier")
+        await frontier.reclaim_expired()
+        renewer = asyncio.create_task(self._renew_frontier_leases(frontier))
+        attempted = 0
+        try:
+            while attempted < self.max_articles:
+                remaining = self._deadline_remaining()
+                if remaining is not None and remaining <= 0:
+                    break
+                batch = await frontier.claim(
+                    min(self.concurrency, self.max_articles - attempted),
+                    source=self.get_source_name(),
+                )
+                if not batch:
+                    break
+                self._frontier_leases.update((item.url, item) for item in batch)
+
+                async def _claimed(
+                    index: int, item: FrontierItem, offset: int = attempted
+                ) -> Optional[ScrapedArticle]:
+                    article = await worker(offset + index, item.url)
+                    await self._finish_frontier_item(frontier, item, article)
+                    return article
+
+                async for article in self._iter_bounded(batch, _claimed):
+                    yield article
+                attempted += len(batch)
+        finally:
+            renewer.cancel()
+            await asyncio.gather(renewer, return_exceptions=True)
+            # Hand back URLs left unfinished when the run was cut short
+            for item in list(self._frontier_leases.values()):
+                await self._frontier_call(item.url, frontier.release(item))
+            self._frontier_leases.clear()
+
+    async def _finish_frontier_item(
+        self, frontier: CrawlFrontier, item: FrontierItem, article: Optional[ScrapedArticle]
+    ) -> None:
+        """Report the outcome of a claimed URL to the frontier."""
+        url = item.url
+        outcome = self._article_outcome(url, article)
+        if outcome == "done":
+            update = frontier.complete(item)
+        elif outcome == "failed":
+            update = frontier.fail(item, "scrape failed")
+        elif self.skipped_urls.get(url) == "circuit_open":
+            update = frontier.release(item, delay=self.circuit_breaker.reset_timeout)
+        else:
+            update = frontier.release(item)
+        await self._frontier_call(url, update)
+        self._frontier_leases.pop(url, None)
+
+    async def _frontier_call(self, url: str, call: Awaitable) -> None:
+        """Await a frontier update, logging failures (an unreported lease simply expires)."""
+        try:
+            await call
+        except Exception as e:
+            logger.warning(
+                f"Frontier update failed: {e}",
+                extra={"url": url, "error": str(e)},
+            )
+
+    async def _renew_frontier_leases(self, frontier: CrawlFrontier) -> None:
+        """Renew the leases this worker holds every third of the lease length."""
+        while True:
+            await asyncio.sleep(frontier.lease_seconds / 3)
+            if not self._frontier_leases:
+                continue
+            try:
+                await frontier.renew(list(self._frontier_leases.values()))
+            except Exception as e:
+                logger.warning(f"Frontier lease renewal failed: {e}", extra={"error": str(e)})
 
-    @abstractmethod
     async def scrape(self) -> List[ScrapedArticle]:
         """
         Scrape articles from the target source.
 
+        Collects `scrape_iter(ordered=True)`, so results keep the source's
+        listing order.
+
         Returns:
             List[ScrapedArticle]: List of scraped articles
 
         Raises:
             Exception: If scraping fails
         """
-        pass
+        return [article async for article in self.scrape_iter(ordered=True)]
+
+    async def extract_html(self, url: str, html: str) -> Optional[ScrapedArticle]:
+        """
+        Build an article from already-fetched page HTML.
+
+        Scrapers that support re-extraction from the HTML archive override this.
+
+        Args:
+            url: Article URL
+            html: Raw page HTML
+
+        Returns:
+            Optional[ScrapedArticle]: Extracted article or None if nothing was extracted
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support re-extraction")
+
+    async def reextract_iter(self, ordered: bool = False) -> AsyncIterator[ScrapedArticle]:
+        """
+        Re-extract the latest archived HTML of every article from this source.
+
+        Uses no network access. Extraction runs on `extract_workers` processes,
+        with up to `concurrency` pages in flight.
+
+        Args:
+            ordered: Yield articles in archive order instead of completion order
+
+        Yields:
+            ScrapedArticle: Successfully re-extracted articles
+
+        Raises:
+            RuntimeError: If no HTML archive is configured
+        """
+        async with self._session():
+            if self.html_archive is None:
+                raise RuntimeError("Re-extraction needs html_archive_dir")
+            archive = self.html_archive
+            entries = archive.entries(source=self.get_source_name())
+
+            async def _extract(index: int, entry: ArchiveEntry) -> Optional[ScrapedArticle]:
+                try:
+                    article = await self.extract_html(entry.url, archive.read(entry))
+                    return await self._tag_duplicate(article) if article else None
+                except Exception as e:
+                    logger.error(
+                        f"Re-extraction failed: {e}",
+                        extra={"url": entry.url, "record_id": entry.record_id, "error": str(e)},
+                    )
+                    return None
+
+            async for article in self._iter_bounded(entries, _extract, ordered=ordered):
+                if article:
+                    yield article
+
+    @abstractmethod
+    def scrape_iter(self, ordered: bool = False) -> AsyncIterator[ScrapedArticle]:
+        """
+        Scrape articles from the target source, yielding each one as it completes.
+
+        Implement as an async generator. Callers can stream results into storage
+        or analysis without holding the whole run in memory:
+
+            async with NvidiaScraper() as scraper:
+                async for article in scraper.scrape_iter():
+                    await store(article)
+
+        Args:
+            ordered: Yield articles in listing order instead of completion order
+
+        Yields:
+            ScrapedArticle: Successfully scraped articles
+
+        Raises:
+            Exception: If scraping fails
+        """
 
     @abstractmethod
     def get_source_name(self) -> str:
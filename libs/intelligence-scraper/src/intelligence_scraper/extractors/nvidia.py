@@ -5,17 +5,38 @@ Scrapes articles from the NVIDIA Newsroom using trafilatura with Playwright fall
 """
 
 import asyncio
+from collections import Counter
 from datetime import datetime
-from typing import List, Optional
-import httpx
-import trafilatura
+from math import ceil
+from typing import Any, AsyncIterator, List, Optional, Set
+from urllib.parse import urlsplit
+
 from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+from pydantic import HttpUrl
 
-from intelligence_scraper.models import ScrapedArticle
 from intelligence_scraper.extractors.base import BaseScraper
+from intelligence_scraper.models import ScrapedArticle
+from intelligence_scraper.utils import telemetry
 from intelligence_scraper.utils.cleaner import clean_text, extract_title_from_content
+from intelligence_scraper.utils.extraction import extract_article, parse_publish_date
+from intelligence_scraper.utils.http import HtmlBody
 from intelligence_scraper.utils.logger import get_logger
+from intelligence_scraper.utils.network_capture import (
+    CapturedArticle,
+    PayloadCapture,
+    capture_article,
+)
+from intelligence_scraper.utils.page_load import PageLoadStats, ResourcePolicy, load_page
+from intelligence_scraper.utils.retry import (
+    HOST_FAILURES,
+    ExtractionError,
+    NavigationError,
+    RetryPolicy,
+    classify_error,
+)
+from intelligence_scraper.utils.strategy import TRAFILATURA
 
 logger = get_logger("intelligence.scraper.nvidia")
 
@@ -28,65 +49,137 @@ class NvidiaScraper(BaseScraper):
     for JavaScript-rendered content.
     """
 
+    BASE_URL = "https://nvidianews.nvidia.com"
     NEWSROOM_URL = "https://nvidianews.nvidia.com/news"
     MAX_RETRIES = 2
+    MAX_LISTING_PAGES = 50
+    # Sitemap and RSS feed paths tried before walking the HTML listing
+    FEED_PATHS = ("/sitemap.xml", "/releases.xml")
+    # Article body container; pages without one are extracted once the DOM is loaded
+    READY_SELECTOR = "article, main, .article-body"
+
+    def __init__(self, base_url: Optional[str] = None, **kwargs: Any):
+        """
+        Initialize the NVIDIA Newsroom scraper.
+
+        Args:
+            base_url: Override the newsroom origin (e.g. a fixture replay server)
+            **kwargs: Options passed to BaseScraper
+        """
+        super().__init__(**kwargs)
+        if base_url:
+            self.BASE_URL = base_url.rstrip("/")
+            self.NEWSROOM_URL = f"{self.BASE_URL}/news"
 
     def get_source_name(self) -> str:
         """Get the source name."""
         return "NVIDIA Newsroom"
 
-    async def scrape(self) -> List[ScrapedArticle]:
+    def default_resource_policy(self) -> ResourcePolicy:
+        """Block heavy resources and wait for the article body to render."""
+        return ResourcePolicy(ready_selector=self.READY_SELECTOR)
+
+    def default_retry_policy(self) -> RetryPolicy:
+        """Retry each article up to MAX_RETRIES attempts in total."""
+        return RetryPolicy(max_attempts=self.MAX_RETRIES)
+
+    async def scrape_iter(self, ordered: bool = False) -> AsyncIterator[ScrapedArticle]:
         """
-        Scrape articles from NVIDIA Newsroom.
+        Scrape articles from NVIDIA Newsroom, yielding each one as it completes.
 
-        Returns:
-            List[ScrapedArticle]: List of successfully scraped articles
+        Args:
+            ordered: Yield articles in listing order instead of completion order
+
+        Yields:
+            ScrapedArticle: Successfully scraped articles
 
         Raises:
             Exception: If scraping fails completely
         """
         logger.info(
             f"Starting scrape of {self.get_source_name()}",
-            extra={"max_articles": self.max_articles, "timeout": self.timeout},
+            extra={
+                "max_articles": self.max_articles,
+                "timeout": self.timeout,
+                "concurrency": self.concurrency,
+                "deadline": self.deadline,
+            },
         )
 
-        try:
-            # Step 1: Get list of article URLs
-            article_urls = await self._get_article_urls()
-            logger.info(
-                f"Found {len(article_urls)} article URLs",
-                extra={"url_count": len(article_urls)},
-            )
+        self._start_run()
 
-            # Step 2: Scrape each article
-            articles = []
-            for i, url in enumerate(article_urls[: self.max_articles]):
+        try:
+            async with self._session():
+                # Step 1: Get list of article URLs (from the journal when resuming)
+                article_urls = await self._journaled_discovery(
+                    lambda: self._run_before_deadline(
+                        self.NEWSROOM_URL, self._get_article_urls, track_duration=False
+                    )
+                )
                 logger.info(
-                    f"Scraping article {i + 1}/{min(len(article_urls), self.max_articles)}",
-                    extra={"url": url, "progress": f"{i + 1}/{self.max_articles}"},
+                    f"Found {len(article_urls)} article URLs",
+                    extra={"url_count": len(article_urls)},
                 )
 
-                try:
-                    article = await self._scrape_article_with_retry(url)
-                    if article:
-                        articles.append(article)
-                        logger.info(
-                            f"Successfully scraped article",
-                            extra={"url": url, "title": article.title},
-                        )
-                except Exception as e:
-                    logger.error(
-                        f"Failed to scrape article: {e}",
-                        extra={"url": url, "error": str(e)},
+                # Articles completed before an interrupted run are not fetched again;
+                # in listing order mode they are merged back in with the new ones
+                replay = self._resumed_articles(article_urls)
+                resumed = len(replay)
+                if not ordered or self.frontier is not None:
+                    for _, replayed in replay:
+                        yield replayed
+                    replay = []
+                position = {url: index for index, url in enumerate(article_urls)}
+                article_urls = self._pending_urls(article_urls)
+
+                # Step 2: Scrape articles concurrently, from the shared frontier if configured
+                if self.frontier is not None:
+                    targets = article_urls
+                    await self.frontier.seed(targets, source=self.get_source_name())
+                    results = self._iter_frontier(
+                        lambda i, url: self._scrape_listed_article(i, url, self.max_articles)
                     )
-                    continue
-
-            logger.info(
-                f"Scraping complete: {len(articles)} articles scraped successfully",
-                extra={"total_articles": len(articles), "failed": len(article_urls) - len(articles)},
-            )
+                else:
+                    targets = article_urls[: self.max_articles]
+                    results = self._iter_bounded(
+                        targets,
+                        lambda i, url: self._scrape_listed_article(i, url, len(targets)),
+                        ordered=ordered,
+                    )
+                attempted = 0
+                scraped = 0
+                async for article in results:
+                    # Ordered results arrive in target order
+                    while replay and replay[0][0] < position[targets[attempted]]:
+                        yield replay.pop(0)[1]
+                    attempted += 1
+                    if article:
+                        scraped += 1
+                        yield article
+                for _, replayed in replay:
+                    yield replayed
 
-            return articles
+                logger.info(
+                    f"Scraping complete: {scraped} articles scraped successfully",
+                    extra={
+                        "total_articles": scraped,
+                        "resumed": resumed,
+                        "unchanged": len(self.unchanged_urls),
+                        "skipped": len(self.skipped_urls),
+                        "skip_reasons": dict(Counter(self.skipped_urls.values())),
+                        "failed": attempted
+                        - scraped
+                        - len(self.unchanged_urls)
+                        - len(self.skipped_urls),
+                        "concurrency": self.concurrency,
+                        "connection_stats": self.connection_stats.to_dict(),
+                    },
+                )
+                self._commit_feed_watermark()
+                logger.info(
+                    "Run telemetry summary",
+                    extra={"telemetry": self.run_telemetry.summary()},
+                )
 
         except Exception as e:
             logger.error(
@@ -95,102 +188,295 @@ class NvidiaScraper(BaseScraper):
             )
             raise
 
+    async def _scrape_listed_article(
+        self, index: int, url: str, total: int
+    ) -> Optional[ScrapedArticle]:
+        """
+        Scrape one article from the listing, isolating its failures.
+
+        Args:
+            index: Position of the article in the listing
+            url: Article URL
+            total: Number of articles being scraped in this run
+
+        Returns:
+            Optional[ScrapedArticle]: Scraped article or None if failed
+        """
+        logger.info(
+            f"Scraping article {index + 1}/{total}",
+            extra={"url": url, "progress": f"{index + 1}/{total}"},
+        )
+
+        article = None
+        with telemetry.track_article() as article_telemetry:
+            try:
+                article = await self._run_before_deadline(
+                    url, lambda: self._scrape_article_with_retry(url)
+                )
+                if article:
+                    article = await self._tag_duplicate(article)
+                    logger.info(
+                        "Successfully scraped article",
+                        extra={"url": url, "title": article.title},
+                    )
+                elif url in self.unchanged_urls:
+                    logger.info("Article unchanged since last run, skipping", extra={"url": url})
+                elif self.skipped_urls.get(url) == "deadline":
+                    logger.warning("Run deadline reached, article skipped", extra={"url": url})
+                elif url in self.skipped_urls:
+                    logger.info(
+                        "Article skipped",
+                        extra={"url": url, "reason": self.skipped_urls[url]},
+                    )
+            except Exception as e:
+                logger.error(
+                    f"Failed to scrape article: {e}",
+                    extra={"url": url, "error": str(e)},
+                )
+
+        self._record_telemetry(url, article, article_telemetry)
+        self._record_outcome(url, article)
+        return article
+
+    def feed_urls(self) -> List[str]:
+        """Get the newsroom sitemap and RSS feed URLs."""
+        return [f"{self.BASE_URL}{path}" for path in self.FEED_PATHS]
+
+    def is_article_url(self, url: str) -> bool:
+        """Check whether a URL is a newsroom article (/news/<slug>)."""
+        parts = urlsplit(url)
+        if parts.netloc != urlsplit(self.BASE_URL).netloc:
+            return False
+        path = parts.path.rstrip("/")
+        return path.startswith("/news/") and path.count("/") == 2
+
     async def _get_article_urls(self) -> List[str]:
         """
-        Get list of article URLs from the newsroom main page.
+        Get article URLs from the newsroom sitemap or RSS feed, or by walking
+        the listing pages when neither exists.
+
+        Listing pages are fetched concurrently (up to `concurrency` at a time)
+        until `max_articles` URLs are collected or the listing runs out. In
+        incremental mode, already-known URLs are skipped and the walk stops at
+        the first page made up entirely of known URLs.
 
         Returns:
-            List[str]: List of article URLs (limited to top 5)
+            List[str]: Article URLs in listing order (at most max_articles)
         """
+        feed_urls = await self._discover_feed_urls()
+        if feed_urls is not None:
+            return self._finish_article_urls(feed_urls)
+
         logger.info("Fetching article URLs from newsroom")
 
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            try:
-                response = await client.get(self.NEWSROOM_URL)
-                response.raise_for_status()
+        known = self._get_known_urls() if self.incremental else set()
+        article_urls: List[str] = []
+        seen: Set[str] = set()
+        next_page = 1
+        per_page = 0
+
+        while len(article_urls) < self.max_articles and next_page <= self.MAX_LISTING_PAGES:
+            # Fetch only as many pages as are likely needed to reach max_articles
+            remaining = self.max_articles - len(article_urls)
+            window = 1 if not per_page else min(self.concurrency, ceil(remaining / per_page))
+            page_numbers = list(
+                range(next_page, min(next_page + window, self.MAX_LISTING_PAGES + 1))
+            )
+            pages = await asyncio.gather(*(self._fetch_listing_page(n) for n in page_numbers))
 
-                # Parse HTML with BeautifulSoup
-                soup = BeautifulSoup(response.text, 'lxml')
-
-                # Extract article URLs from <article> elements
-                # Each article contains: <article><h3><a href="...">
-                article_urls = []
-                articles = soup.find_all('article', limit=5)  # Get first 5 articles
-
-                for article in articles:
-                    # Find the link within the h3 tag
-                    h3 = article.find('h3')
-                    if h3:
-                        link = h3.find('a')
-                        if link and link.get('href'):
-                            url = link['href']
-                            # Handle relative URLs
-                            if url.startswith('/'):
-                                url = f"https://nvidianews.nvidia.com{url}"
-                            article_urls.append(url)
-                            logger.info(
-                                f"Found article URL",
-                                extra={"url": url, "title": link.get_text(strip=True)[:50]},
-                            )
+            for page_number, page_urls in zip(page_numbers, pages):
+                if not page_urls:
+                    logger.info(
+                        "Reached end of newsroom listing",
+                        extra={"page": page_number},
+                    )
+                    return self._finish_article_urls(article_urls)
 
-                logger.info(
-                    f"Extracted {len(article_urls)} article URLs",
-                    extra={"count": len(article_urls)},
-                )
-                return article_urls
+                if known and all(url in known for url in page_urls):
+                    logger.info(
+                        "Listing page contains only known articles, stopping crawl",
+                        extra={"page": page_number},
+                    )
+                    return self._finish_article_urls(article_urls)
+
+                per_page = max(per_page, len(page_urls))
+                for url in page_urls:
+                    if url not in seen and url not in known:
+                        seen.add(url)
+                        article_urls.append(url)
+
+            next_page += len(page_numbers)
+
+        return self._finish_article_urls(article_urls)
+
+    def _finish_article_urls(self, article_urls: List[str]) -> List[str]:
+        """Trim collected listing URLs to max_articles and log the result."""
+        article_urls = article_urls[: self.max_articles]
+        logger.info(
+            f"Extracted {len(article_urls)} article URLs",
+            extra={"count": len(article_urls), "incremental": self.incremental},
+        )
+        return article_urls
+
+    def _listing_page_url(self, page_number: int) -> str:
+        """Get the URL of a newsroom listing page (1-based)."""
+        if page_number == 1:
+            return self.NEWSROOM_URL
+        return f"{self.NEWSROOM_URL}?page={page_number}"
+
+    async def _fetch_listing_page(self, page_number: int) -> List[str]:
+        """
+        Fetch one newsroom listing page and extract its article URLs.
+
+        Args:
+            page_number: Listing page number (1-based)
+
+        Returns:
+            List[str]: Article URLs on the page (empty if the page failed or has none)
+        """
+        try:
+            response = await self.client.get(self._listing_page_url(page_number))
+            response.raise_for_status()
+
+            # Parse HTML with BeautifulSoup
+            soup = BeautifulSoup(response.text, "lxml")
+
+            # Extract article URLs from <article> elements
+            # Each article contains: <article><h3><a href="...">
+            article_urls = []
+            for article in soup.find_all("article"):
+                # Find the link within the h3 tag
+                h3 = article.find("h3")
+                if h3:
+                    link = h3.find("a")
+                    if link and link.get("href"):
+                        url = link["href"]
+                        # Handle relative URLs
+                        if url.startswith("/"):
+                            url = f"{self.BASE_URL}{url}"
+                        article_urls.append(url)
+                        logger.info(
+                            "Found article URL",
+                            extra={"url": url, "title": link.get_text(strip=True)[:50]},
+                        )
+
+            return article_urls
 
+        except Exception as e:
+            logger.warning(
+                f"Failed to fetch article URLs with httpx: {e}",
+                extra={"error": str(e), "page": page_number},
+            )
+            # Treat a failed page as the end of the listing
+            return []
+
+    async def _scrape_article_with_retry(self, url: str) -> Optional[ScrapedArticle]:
+        """
+        Scrape a single article, retrying according to the retry policy.
+
+        Articles on a host whose circuit breaker is open are skipped without
+        a request.
+
+        Args:
+            url: Article URL
+
+        Returns:
+            Optional[ScrapedArticle]: Scraped article or None if failed
+        """
+        attempt = 0
+        while True:
+            attempt += 1
+
+            if not self.circuit_breaker.allow(url):
+                logger.warning("Host circuit open, skipping article", extra={"url": url})
+                self._skip(url, "circuit_open")
+                return None
+
+            try:
+                article = await self._scrape_article(url)
+            except asyncio.CancelledError:
+                # Cancelled (e.g. by the run deadline) before an outcome was known
+                self.circuit_breaker.release(url)
+                raise
             except Exception as e:
+                kind = classify_error(e)
+                self.circuit_breaker.record(url, success=kind not in HOST_FAILURES)
+
+                if not self.retry_policy.should_retry(kind, attempt):
+                    logger.error(
+                        "All scraping attempts failed for article",
+                        extra={"url": url, "error": str(e), "kind": kind, "attempts": attempt},
+                    )
+                    return None
+
+                delay = self.retry_policy.backoff(attempt)
                 logger.warning(
-                    f"Failed to fetch article URLs with httpx: {e}",
-                    extra={"error": str(e)},
+                    f"Scraping attempt {attempt} failed, retrying...",
+                    extra={
+                        "url": url,
+                        "error": str(e),
+                        "kind": kind,
+                        "attempt": attempt,
+                        "delay": round(delay, 2),
+                    },
                 )
-                # Fallback to empty list
-                return []
+                telemetry.record_retry()
+                await asyncio.sleep(delay)
+                continue
 
-    async def _scrape_article_with_retry(
-        self, url: str, attempt: int = 1
-    ) -> Optional[ScrapedArticle]:
+            self.circuit_breaker.record(url, success=True)
+            return article
+
+    async def _scrape_article(self, url: str) -> Optional[ScrapedArticle]:
         """
-        Scrape a single article with retry logic.
+        Make one attempt at scraping an article.
 
         Args:
             url: Article URL
-            attempt: Current attempt number
 
         Returns:
-            Optional[ScrapedArticle]: Scraped article or None if failed
+            Optional[ScrapedArticle]: Scraped article, or None if it is unchanged
+
+        Raises:
+            httpx.HTTPError: If the page could not be fetched; Playwright is not
+                tried, since it would hit the same failing host
+            playwright.async_api.TimeoutError: If the browser timed out loading the page
+            NavigationError: If the browser could not reach the page
+            ExtractionError: If neither trafilatura nor Playwright produced an article
         """
-        try:
-            # Try trafilatura first
+        # Try trafilatura first unless this URL pattern is known to need JS rendering
+        if self.strategy.choose_method(url) == TRAFILATURA:
             article = await self._scrape_with_trafilatura(url)
             if article:
+                self._commit_fetch_state(url)
                 return article
 
+            # Unchanged pages were already emitted by a previous run, and skipped
+            # pages (not HTML, too large) would not render any better in a browser
+            if url in self.unchanged_urls or url in self.skipped_urls:
+                return None
+
             # Fallback to Playwright
             logger.info(
-                f"Trafilatura extraction failed, trying Playwright fallback",
+                "Trafilatura extraction failed, trying Playwright fallback",
                 extra={"url": url},
             )
-            article = await self._scrape_with_playwright(url)
-            if article:
-                return article
+        else:
+            logger.info(
+                "URL pattern needs JavaScript rendering, skipping trafilatura",
+                extra={"url": url},
+            )
+            # A conditional GET still finds unchanged pages before paying for a
+            # render, and leaves the validators to commit once the page renders
+            if self.fetch_state is not None and await self._fetch_changed_html(url) is None:
+                return None
 
-            raise Exception("Both trafilatura and Playwright extraction failed")
+        article = await self._scrape_with_playwright(url)
+        if article:
+            self._commit_fetch_state(url)
+            return article
 
-        except Exception as e:
-            if attempt < self.MAX_RETRIES:
-                logger.warning(
-                    f"Scraping attempt {attempt} failed, retrying...",
-                    extra={"url": url, "error": str(e), "attempt": attempt},
-                )
-                await asyncio.sleep(2 ** attempt)  # Exponential backoff
-                return await self._scrape_article_with_retry(url, attempt + 1)
-            else:
-                logger.error(
-                    f"All scraping attempts failed for article",
-                    extra={"url": url, "error": str(e), "attempts": self.MAX_RETRIES},
-                )
-                return None
+        raise ExtractionError("Both trafilatura and Playwright extraction failed")
 
     async def _scrape_with_trafilatura(self, url: str) -> Optional[ScrapedArticle]:
         """
@@ -201,111 +487,195 @@ class NvidiaScraper(BaseScraper):
 
         Returns:
             Optional[ScrapedArticle]: Scraped article or None
+
+        Raises:
+            httpx.HTTPError: If the request failed or returned an error status
         """
+        body = await self._fetch_changed_html(url)
+        if body is None:
+            return None
+
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url)
-                response.raise_for_status()
+            self._archive_html(url, body.text)
 
-                # Extract content with trafilatura
-                content = trafilatura.extract(
-                    response.text,
-                    include_comments=False,
-                    include_tables=False,
-                    no_fallback=False,
-                )
+            article = await self.extract_html(url, body.text)
+            self.strategy.record(url, TRAFILATURA, success=article is not None)
+            return article
 
-                if not content:
-                    logger.warning(
-                        "Trafilatura extraction returned no content",
-                        extra={"url": url},
-                    )
-                    return None
+        except Exception as e:
+            logger.warning(
+                f"Trafilatura scraping failed: {e}",
+                extra={"url": url, "error": str(e)},
+            )
+            return None
 
-                # Extract metadata
-                metadata_result = trafilatura.extract_metadata(response.text)
-                title = metadata_result.title if metadata_result and metadata_result.title else None
+    async def _fetch_changed_html(self, url: str) -> Optional[HtmlBody]:
+        """
+        Fetch an article page with a conditional GET.
 
-                if not title:
-                    title = extract_title_from_content(content)
+        Args:
+            url: Article URL
 
-                # Clean content
-                cleaned_content = clean_text(content)
+        Returns:
+            Optional[HtmlBody]: Page body, or None if the page is unchanged since
+                the last run or was skipped (not HTML, too large)
 
-                # Get publish date (simplified - would parse from metadata in production)
-                publish_date = datetime.utcnow()
+        Raises:
+            httpx.HTTPError: If the request failed or returned an error status
+        """
+        # Stream the body so non-HTML and oversized responses are dropped early
+        async with self.client.stream(
+            "GET", url, headers=self._conditional_headers(url)
+        ) as response:
+            body = None
+            if response.status_code != 304:
+                response.raise_for_status()
+                body = await self._read_html(url, response)
+                if body is None:
+                    return None
 
-                article = ScrapedArticle(
-                    url=url,
-                    title=title,
-                    content=cleaned_content,
-                    publishDate=publish_date,
-                    source=self.get_source_name(),
-                    metadata={"scraperMethod": "trafilatura", "contentTruncated": False},
-                )
+            # Skip extraction on 304 Not Modified or an identical body
+            if self._check_unchanged(url, response, body.body_hash if body else None):
+                return None
+            return body
 
-                return article
+    async def extract_html(self, url: str, html: str) -> Optional[ScrapedArticle]:
+        """
+        Build an article from page HTML using trafilatura.
 
-        except Exception as e:
+        Args:
+            url: Article URL
+            html: Raw page HTML
+
+        Returns:
+            Optional[ScrapedArticle]: Extracted article or None
+        """
+        # Extract content with trafilatura off the event loop
+        with telemetry.stage(telemetry.EXTRACT):
+            extracted = await self.extractor.run(extract_article, html, self.prune_rules)
+
+        if not extracted:
             logger.warning(
-                f"Trafilatura scraping failed: {e}",
-                extra={"url": url, "error": str(e)},
+                "Trafilatura extraction returned no content",
+                extra={"url": url},
             )
             return None
 
+        content = extracted.content
+        title = extracted.title
+
+        if not title:
+            title = extract_title_from_content(content)
+
+        # Clean content
+        with telemetry.stage(telemetry.CLEAN):
+            cleaned_content = clean_text(content)
+
+        # Get publish date from page metadata, falling back to scrape time
+        publish_date = parse_publish_date(extracted.publish_date) or datetime.utcnow()
+
+        metadata = {"scraperMethod": "trafilatura", "contentTruncated": False}
+        if extracted.author:
+            metadata["author"] = extracted.author
+        if extracted.description:
+            metadata["description"] = extracted.description
+        if extracted.keywords:
+            metadata["keywords"] = extracted.keywords
+
+        article = ScrapedArticle(
+            url=HttpUrl(url),
+            title=title,
+            content=cleaned_content,
+            publishDate=publish_date,
+            source=self.get_source_name(),
+            metadata=metadata,
+        )
+
+        return article
+
+    def _build_captured_article(
+        self, url: str, captured: CapturedArticle, load_stats: PageLoadStats
+    ) -> ScrapedArticle:
+        """
+        Build an article from a captured XHR/fetch payload.
+
+        Args:
+            url: Article URL
+            captured: Fields read from the payload
+            load_stats: What loading the page cost until the payload arrived
+
+        Returns:
+            ScrapedArticle: The article
+        """
+        logger.info(
+            "Article payload captured",
+            extra={
+                "url": url,
+                "payload_url": captured.payload_url,
+                "page_load": load_stats.to_dict(),
+            },
+        )
+        with telemetry.stage(telemetry.CLEAN):
+            cleaned_content = clean_text(captured.content)
+
+        return ScrapedArticle(
+            url=HttpUrl(url),
+            title=captured.title or extract_title_from_content(captured.content),
+            content=cleaned_content,
+            publishDate=parse_publish_date(captured.publish_date) or datetime.utcnow(),
+            source=self.get_source_name(),
+            metadata={
+                "scraperMethod": "playwright_capture",
+                "contentTruncated": False,
+                "payloadUrl": captured.payload_url,
+                "pageLoad": load_stats.to_dict(),
+            },
+        )
+
     async def _scrape_with_playwright(self, url: str) -> Optional[ScrapedArticle]:
         """
         Scrape article using Playwright (for JavaScript-rendered content).
 
+        With a payload capture configured, the article is first read from the
+        page's XHR/fetch JSON and the page is closed as soon as it arrives;
+        when no payload arrives within the capture's wait budget, the article
+        is rendered on a fresh page.
+
         Args:
             url: Article URL
 
         Returns:
             Optional[ScrapedArticle]: Scraped article or None
+
+        Raises:
+            playwright.async_api.TimeoutError: If the page did not load in time
+            NavigationError: If the browser could not reach the page
         """
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                context = await browser.new_context()
-                page = await context.new_page()
-
-                try:
-                    await page.goto(url, timeout=self.timeout * 1000, wait_until="networkidle")
-
-                    # Extract content
-                    content = await page.inner_text("body")
-                    title_element = await page.query_selector("h1")
-                    title = await title_element.inner_text() if title_element else None
-
-                    if not title:
-                        title = extract_title_from_content(content)
-
-                    # Clean content
-                    cleaned_content = clean_text(content)
-
-                    # Get publish date
-                    publish_date = datetime.utcnow()
-
-                    article = ScrapedArticle(
-                        url=url,
-                        title=title,
-                        content=cleaned_content,
-                        publishDate=publish_date,
-                        source=self.get_source_name(),
-                        metadata={"scraperMethod": "playwright", "contentTruncated": False},
-                    )
-
+            if self.payload_capture is not None:
+                article = await self._capture_with_playwright(url, self.payload_capture)
+                if article is not None:
                     return article
+                logger.info("No article payload captured, rendering page", extra={"url": url})
 
-                except PlaywrightTimeout as e:
-                    logger.warning(
-                        f"Playwright timeout: {e}",
-                        extra={"url": url, "timeout": self.timeout},
-                    )
-                    return None
+            return await self._render_with_playwright(url)
 
-                finally:
-                    await browser.close()
+        except PlaywrightTimeout as e:
+            # Raised so the retry policy and circuit breaker count a slow host
+            logger.warning(
+                f"Playwright timeout: {e}",
+                extra={"url": url, "timeout": self.timeout},
+            )
+            raise
+
+        except PlaywrightError as e:
+            if "net::ERR_" in e.message:
+                raise NavigationError(e.message) from e
+            logger.warning(
+                f"Playwright scraping failed: {e}",
+                extra={"url": url, "error": str(e)},
+            )
+            return None
 
         except Exception as e:
             logger.warning(
@@ -313,3 +683,79 @@ class NvidiaScraper(BaseScraper):
                 extra={"url": url, "error": str(e)},
             )
             return None
+
+    async def _capture_with_playwright(
+        self, url: str, capture: PayloadCapture
+    ) -> Optional[ScrapedArticle]:
+        """
+        Read an article from the JSON payload its page fetches.
+
+        Args:
+            url: Article URL
+            capture: Which responses carry the article and where its fields are
+
+        Returns:
+            Optional[ScrapedArticle]: The article, or None if no payload arrived in time
+        """
+        async with self.browser_pool.page() as page:
+            with telemetry.stage(telemetry.PLAYWRIGHT):
+                captured, load_stats = await capture_article(
+                    page, url, capture, self.resource_policy, self.timeout * 1000
+                )
+                telemetry.record_bytes(telemetry.PLAYWRIGHT, load_stats.bytes_downloaded)
+
+        if captured is None:
+            return None
+        return self._build_captured_article(url, captured, load_stats)
+
+    async def _render_with_playwright(self, url: str) -> ScrapedArticle:
+        """
+        Render an article page and read its visible text.
+
+        Args:
+            url: Article URL
+
+        Returns:
+            ScrapedArticle: The article
+
+        Raises:
+            playwright.async_api.TimeoutError: If the page does not load in time
+        """
+        async with self.browser_pool.page() as page:
+            with telemetry.stage(telemetry.PLAYWRIGHT):
+                load_stats = await load_page(page, url, self.resource_policy, self.timeout * 1000)
+                telemetry.record_bytes(telemetry.PLAYWRIGHT, load_stats.bytes_downloaded)
+                logger.info(
+                    "Playwright page loaded",
+                    extra={"url": url, "page_load": load_stats.to_dict()},
+                )
+
+                if self.html_archive is not None:
+                    self._archive_html(url, await page.content())
+
+                # Extract content
+                content = await page.inner_text("body")
+                title_element = await page.query_selector("h1")
+                title = await title_element.inner_text() if title_element else None
+
+        if not title:
+            title = extract_title_from_content(content)
+
+        # Clean content
+        cleaned_content = clean_text(content)
+
+        # Get publish date
+        publish_date = datetime.utcnow()
+
+        return ScrapedArticle(
+            url=HttpUrl(url),
+            title=title,
+            content=cleaned_content,
+            publishDate=publish_date,
+            source=self.get_source_name(),
+            metadata={
+                "scraperMethod": "playwright",
+                "contentTruncated": False,
+                "pageLoad": load_stats.to_dict(),
+            },
+        )
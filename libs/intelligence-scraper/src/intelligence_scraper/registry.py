@@ -0,0 +1,97 @@
+"""
+Scraper registry
+
+Maps source names to BaseScraper implementations. Built-in scrapers are always
+available; other packages can add sources through the
+"intelligence_scraper.scrapers" entry point group:
+
+    [project.entry-points."intelligence_scraper.scrapers"]
+    techcrunch = "my_package.scrapers:TechCrunchScraper"
+"""
+
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import Any, Dict, List, Optional, Type
+
+from intelligence_scraper.extractors.base import BaseScraper
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.registry")
+
+ENTRY_POINT_GROUP = "intelligence_scraper.scrapers"
+
+_BUILTIN_SCRAPERS = {
+    "nvidia": "intelligence_scraper.extractors.nvidia:NvidiaScraper",
+}
+
+_registry: Dict[str, Type[BaseScraper]] = {}
+_discovered = False
+
+
+def register_scraper(name: str, scraper_class: Type[BaseScraper]) -> None:
+    """
+    Register a scraper implementation under a source name.
+
+    Args:
+        name: Source name used on the command line (case-insensitive)
+        scraper_class: BaseScraper subclass
+
+    Raises:
+        TypeError: If scraper_class is not a BaseScraper subclass
+    """
+    if not (isinstance(scraper_class, type) and issubclass(scraper_class, BaseScraper)):
+        raise TypeError(f"Scraper for '{name}' must be a BaseScraper subclass")
+    _registry[name.lower()] = scraper_class
+
+
+def _load(target: str) -> Any:
+    """Import a 'module:attribute' reference (checked by register_scraper)."""
+    module_name, _, attribute = target.partition(":")
+    return getattr(import_module(module_name), attribute)
+
+
+def _discover() -> None:
+    """Register built-in scrapers and those published through entry points."""
+    global _discovered
+    if _discovered:
+        return
+    _discovered = True
+
+    for name, target in _BUILTIN_SCRAPERS.items():
+        _registry.setdefault(name, _load(target))
+
+    for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+        if entry_point.name.lower() in _registry:
+            continue
+        try:
+            register_scraper(entry_point.name, entry_point.load())
+        except Exception as e:
+            logger.warning(
+                f"Failed to load scraper entry point '{entry_point.name}': {e}",
+                extra={"entry_point": entry_point.value, "error": str(e)},
+            )
+
+
+def available_sources() -> List[str]:
+    """
+    List registered source names.
+
+    Returns:
+        List[str]: Sorted source names
+    """
+    _discover()
+    return sorted(_registry)
+
+
+def get_scraper_class(source: str) -> Optional[Type[BaseScraper]]:
+    """
+    Look up the scraper implementation for a source.
+
+    Args:
+        source: Source name (case-insensitive)
+
+    Returns:
+        Optional[Type[BaseScraper]]: Scraper class, or None if the source is unknown
+    """
+    _discover()
+    return _registry.get(source.lower())
@@ -0,0 +1,256 @@
+"""
+Multi-source scraper runner
+
+Runs several registered scrapers concurrently under one global concurrency budget
+and merges their articles into a single stream.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field, fields
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from intelligence_scraper.extractors.base import BaseScraper
+from intelligence_scraper.models import ScrapedArticle
+from intelligence_scraper.registry import available_sources, get_scraper_class
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.runner")
+
+DEFAULT_GLOBAL_CONCURRENCY = 8
+
+_SOURCE_DONE = object()
+
+
+@dataclass
+class SourceConfig:
+    """Settings for one source in a multi-source run."""
+
+    name: str
+    label: Optional[str] = None
+    max_articles: int = 100
+    timeout: int = 30
+    concurrency: int = BaseScraper.DEFAULT_CONCURRENCY
+    options: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> str:
+        """Name used to report this source (label if set, else source name)."""
+        return self.label or self.name
+
+
+@dataclass
+class RunConfig:
+    """Settings for a multi-source run, usually loaded from sources.yaml."""
+
+    sources: List[SourceConfig]
+    concurrency: int = DEFAULT_GLOBAL_CONCURRENCY
+    output: Optional[str] = None
+    format: str = "ndjson"
+
+
+_SOURCE_KEYS = frozenset(f.name for f in fields(SourceConfig))
+_RUN_KEYS = frozenset(f.name for f in fields(RunConfig))
+
+
+@dataclass
+class SourceResult:
+    """Outcome of one source in a multi-source run."""
+
+    scraped: int = 0
+    error: Optional[str] = None
+
+
+def load_run_config(path: str) -> RunConfig:
+    """
+    Load a multi-source run configuration.
+
+    YAML files need the optional PyYAML dependency (the "config" extra);
+    JSON files work without it. Example:
+
+        concurrency: 8
+        output: articles.ndjson
+        sources:
+          - name: nvidia
+            concurrency: 4
+            max_articles: 50
+            options:
+              state_dir: .scraper-state
+
+    Args:
+        path: Path to a .yaml/.yml or .json file
+
+    Returns:
+        RunConfig: Parsed configuration
+
+    Raises:
+        ValueError: If the file is invalid (malformed, unknown keys or entries
+            of the wrong type), names an unknown source or lists two sources
+            under the same name without distinct labels
+        ImportError: If a YAML file is given and PyYAML is not installed
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError as e:
+            raise ImportError(
+                "YAML configs need PyYAML: pip install 'intelligence-scraper[config]'"
+            ) from e
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"{path}: invalid YAML: {e}") from e
+    else:
+        data = json.loads(text)
+
+    if (
+        not isinstance(data, dict)
+        or not isinstance(data.get("sources"), list)
+        or not data["sources"]
+    ):
+        raise ValueError(f"{path}: expected a mapping with a non-empty 'sources' list")
+    unknown = sorted(set(data) - _RUN_KEYS)
+    if unknown:
+        raise ValueError(
+            f"{path}: unknown key(s) {', '.join(unknown)}; "
+            f"expected {', '.join(sorted(_RUN_KEYS))}"
+        )
+
+    sources: List[SourceConfig] = []
+    for index, entry in enumerate(data["sources"]):
+        where = f"{path}: sources[{index}]"
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        if not isinstance(entry, dict):
+            raise ValueError(
+                f"{where}: expected a source name or mapping, got {type(entry).__name__}"
+            )
+        unknown = sorted(set(entry) - _SOURCE_KEYS)
+        if unknown:
+            raise ValueError(
+                f"{where}: unknown key(s) {', '.join(unknown)}; "
+                f"expected {', '.join(sorted(_SOURCE_KEYS))}"
+            )
+        if not isinstance(entry.get("options", {}), dict):
+            raise ValueError(f"{where}: 'options' must be a mapping")
+        if get_scraper_class(str(entry.get("name", ""))) is None:
+            raise ValueError(
+                f"{where}: unknown source '{entry.get('name')}'. "
+                f"Available sources: {', '.join(available_sources())}"
+            )
+        source = SourceConfig(**entry)
+        if any(other.key == source.key for other in sources):
+            raise ValueError(
+                f"{path}: source '{source.key}' is listed more than once; "
+                "give each a distinct 'label'"
+            )
+        sources.append(source)
+
+    return RunConfig(
+        sources=sources,
+        concurrency=data.get("concurrency", DEFAULT_GLOBAL_CONCURRENCY),
+        output=data.get("output"),
+        format=data.get("format", "ndjson"),
+    )
+
+
+class MultiSourceRunner:
+    """
+    Run several scrapers concurrently with a shared concurrency budget.
+
+    Each source keeps its own `concurrency` limit, and all sources together
+    never have more than `global_concurrency` articles in flight. A failing
+    source is logged and reported in `results` without stopping the others.
+    """
+
+    def __init__(
+        self, sources: List[SourceConfig], global_concurrency: int = DEFAULT_GLOBAL_CONCURRENCY
+    ):
+        """
+        Initialize the runner.
+
+        Args:
+            sources: Sources to scrape
+            global_concurrency: Maximum articles in flight across all sources
+
+        Raises:
+            ValueError: If a source is unknown, two sources share a key or the
+                budget is below 1
+        """
+        if global_concurrency < 1:
+            raise ValueError("global_concurrency must be at least 1")
+
+        self.sources = sources
+        self.global_concurrency = global_concurrency
+        self.results: Dict[str, SourceResult] = {}
+        self.scrapers: Dict[str, BaseScraper] = {}
+
+        for source in sources:
+            scraper_class = get_scraper_class(source.name)
+            if scraper_class is None:
+                raise ValueError(f"Unknown source: {source.name}")
+            if source.key in self.scrapers:
+                raise ValueError(f"Duplicate source '{source.key}': give each a distinct label")
+            self.scrapers[source.key] = scraper_class(
+                max_articles=source.max_articles,
+                timeout=source.timeout,
+                concurrency=source.concurrency,
+                **source.options,
+            )
+            self.results[source.key] = SourceResult()
+
+    async def run_iter(self) -> AsyncIterator[ScrapedArticle]:
+        """
+        Scrape all sources concurrently, yielding articles as they complete.
+
+        Yields:
+            ScrapedArticle: Articles from any source, in completion order
+        """
+        limiter = asyncio.Semaphore(self.global_concurrency)
+        # Bounded so fast sources wait for the consumer instead of piling up in memory
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.global_concurrency * 2)
+
+        async def _pump(key: str, scraper: BaseScraper) -> None:
+            scraper.shared_limiter = limiter
+            try:
+                async with scraper:
+                    async for article in scraper.scrape_iter():
+                        self.results[key].scraped += 1
+                        await queue.put(article)
+            except Exception as e:
+                self.results[key].error = str(e)
+                logger.error(
+                    f"Source '{key}' failed: {e}",
+                    extra={"source": key, "error": str(e)},
+                )
+            finally:
+                await queue.put(_SOURCE_DONE)
+
+        logger.info(
+            f"Starting multi-source run of {len(self.scrapers)} sources",
+            extra={
+                "sources": list(self.scrapers),
+                "global_concurrency": self.global_concurrency,
+            },
+        )
+
+        tasks = [asyncio.create_task(_pump(key, s)) for key, s in self.scrapers.items()]
+        remaining = len(tasks)
+        try:
+            while remaining:
+                item = await queue.get()
+                if item is _SOURCE_DONE:
+                    remaining -= 1
+                    continue
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        logger.info(
+            "Multi-source run complete",
+            extra={"results": {key: vars(result) for key, result in self.results.items()}},
+        )
@@ -0,0 +1,144 @@
+"""
+Persistent Playwright browser pool
+
+Launches Chromium once per run and hands out isolated browser contexts and pages.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+
+from playwright.async_api import Browser, Page, Playwright, async_playwright
+
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.browser")
+
+
+class BrowserPool:
+    """
+    Pool of Playwright pages backed by a long-lived Chromium instance.
+
+    Chromium is launched lazily on the first page request, so runs that never
+    need JavaScript rendering pay nothing. Each page gets its own browser
+    context (separate cookies and storage). After `recycle_after` pages the
+    browser is replaced to contain memory growth; the old one is closed once
+    its in-flight pages are released.
+    """
+
+    def __init__(self, max_pages: int = 2, recycle_after: int = 50, headless: bool = True):
+        """
+        Initialize the browser pool.
+
+        Args:
+            max_pages: Maximum number of pages open at the same time
+            recycle_after: Number of pages served before the browser is relaunched
+            headless: Run Chromium in headless mode
+        """
+        if max_pages < 1:
+            raise ValueError("max_pages must be at least 1")
+        if recycle_after < 1:
+            raise ValueError("recycle_after must be at least 1")
+
+        self.max_pages = max_pages
+        self.recycle_after = recycle_after
+        self.headless = headless
+
+        self.browsers_launched = 0
+        self.pages_served = 0
+
+        self._semaphore = asyncio.Semaphore(max_pages)
+        self._lock = asyncio.Lock()
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._browser_pages = 0
+        self._active: Dict[Browser, int] = {}
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """
+        Borrow a page in a fresh browser context.
+
+        The context (and its page) is closed when the block exits.
+
+        Yields:
+            Page: Playwright page ready for navigation
+        """
+        async with self._semaphore:
+            browser = await self._acquire_browser()
+            try:
+                context = await browser.new_context()
+                try:
+                    yield await context.new_page()
+                finally:
+                    await context.close()
+            finally:
+                await self._release_browser(browser)
+
+    async def close(self) -> None:
+        """Close all browsers and stop Playwright."""
+        async with self._lock:
+            for browser in list(self._active):
+                await self._close_browser(browser)
+            self._browser = None
+
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+                logger.info(
+                    "Browser pool closed",
+                    extra={
+                        "browsers_launched": self.browsers_launched,
+                        "pages_served": self.pages_served,
+                    },
+                )
+
+    async def _acquire_browser(self) -> Browser:
+        """Get the current browser, launching or recycling it as needed."""
+        async with self._lock:
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            browser = self._browser
+            if (
+                browser is None
+                or not browser.is_connected()
+                or self._browser_pages >= self.recycle_after
+            ):
+                if browser is not None and self._active.get(browser, 0) == 0:
+                    await self._close_browser(browser)
+
+                browser = await self._playwright.chromium.launch(headless=self.headless)
+                self._browser = browser
+                self._browser_pages = 0
+                self._active[browser] = 0
+                self.browsers_launched += 1
+                logger.info(
+                    "Launched Chromium for browser pool",
+                    extra={"browsers_launched": self.browsers_launched},
+                )
+
+            self._browser_pages += 1
+            self.pages_served += 1
+            self._active[browser] += 1
+            return browser
+
+    async def _release_browser(self, browser: Browser) -> None:
+        """Return a page slot and close retired browsers that are now idle."""
+        async with self._lock:
+            active = self._active.get(browser)
+            if active is None:
+                # Already closed by close() while the page was in flight
+                return
+            self._active[browser] = active - 1
+            if browser is not self._browser and active == 1:
+                await self._close_browser(browser)
+
+    async def _close_browser(self, browser: Browser) -> None:
+        """Close a browser and forget about it, ignoring already-dead browsers."""
+        self._active.pop(browser, None)
+        try:
+            await browser.close()
+        except Exception as e:
+            logger.warning(f"Failed to close browser: {e}", extra={"error": str(e)})
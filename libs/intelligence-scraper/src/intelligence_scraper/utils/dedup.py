@@ -0,0 +1,204 @@
+"""
+Near-duplicate article detection
+
+Computes 64-bit SimHash signatures of article content and keeps a banded LSH
+index of them, so syndicated or lightly edited copies of an article can be
+tagged with the URL of the first copy seen.
+"""
+
+import hashlib
+import re
+import sqlite3
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.dedup")
+
+DEDUP_DB_NAME = "dedup.sqlite3"
+SIGNATURE_BITS = 64
+SHINGLE_SIZE = 3
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def simhash(text: str) -> int:
+    """
+    Compute the SimHash signature of a text.
+
+    Uses the set of word 3-gram shingles, so small edits only flip a few bits.
+
+    Args:
+        text: Cleaned article content
+
+    Returns:
+        int: Unsigned 64-bit signature
+    """
+    tokens = _TOKEN_RE.findall(text.lower())
+    if len(tokens) <= SHINGLE_SIZE:
+        shingles = {" ".join(tokens)}
+    else:
+        windows = zip(*(tokens[offset:] for offset in range(SHINGLE_SIZE)))
+        shingles = {" ".join(window) for window in windows}
+
+    # Count set bits column-wise on binary strings; str.count runs in C
+    digests = [
+        format(
+            int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "big"),
+            "064b",
+        )
+        for s in shingles
+    ]
+    half = len(digests) / 2
+    signature = 0
+    for column in zip(*digests):
+        signature = (signature << 1) | (column.count("1") > half)
+    return signature
+
+
+def _to_signed(value: int) -> int:
+    """Map an unsigned 64-bit signature into SQLite's signed INTEGER range."""
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+
+def _to_unsigned(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
+
+
+class DuplicateIndex:
+    """
+    Banded LSH index of SimHash signatures.
+
+    The 64-bit signature is split into `bands` equal bands, and each band
+    value maps to the documents that share it. With `bands` greater than
+    `max_distance`, any two signatures within `max_distance` bits share at
+    least one band, so lookups only compare the few documents in matching
+    buckets instead of scanning the index.
+
+    Signatures are kept in memory and persisted to SQLite in `state_dir`,
+    so duplicates are detected across runs.
+    """
+
+    def __init__(self, state_dir: Optional[str] = None, max_distance: int = 3, bands: int = 4):
+        """
+        Open the duplicate index.
+
+        Args:
+            state_dir: Directory for the SQLite database (None = in-memory for this run)
+            max_distance: Largest Hamming distance still treated as a duplicate
+            bands: Number of LSH bands; must divide 64 and exceed max_distance
+
+        Raises:
+            ValueError: If the band layout cannot guarantee finding max_distance matches
+        """
+        if SIGNATURE_BITS % bands or bands <= max_distance:
+            raise ValueError("bands must divide 64 and be greater than max_distance")
+
+        self.max_distance = max_distance
+        self.bands = bands
+        self._band_bits = SIGNATURE_BITS // bands
+        self._band_mask = (1 << self._band_bits) - 1
+
+        self._signatures: Dict[str, int] = {}
+        self._buckets: List[Dict[int, Set[str]]] = [defaultdict(set) for _ in range(bands)]
+
+        if state_dir:
+            directory = Path(state_dir)
+            directory.mkdir(parents=True, exist_ok=True)
+            database = str(directory / DEDUP_DB_NAME)
+        else:
+            database = ":memory:"
+
+        self._conn = sqlite3.connect(database, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS signatures (
+                url TEXT PRIMARY KEY,
+                simhash INTEGER NOT NULL,
+                added_at TEXT NOT NULL
+            )
+            """)
+        self._conn.commit()
+        for url, signature in self._conn.execute("SELECT url, simhash FROM signatures"):
+            self._insert(url, _to_unsigned(signature))
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _band_values(self, signature: int) -> List[int]:
+        return [
+            (signature >> (band * self._band_bits)) & self._band_mask for band in range(self.bands)
+        ]
+
+    def _insert(self, url: str, signature: int) -> None:
+        previous = self._signatures.get(url)
+        if previous is not None:
+            for bucket, value in zip(self._buckets, self._band_values(previous)):
+                bucket[value].discard(url)
+        self._signatures[url] = signature
+        for bucket, value in zip(self._buckets, self._band_values(signature)):
+            bucket[value].add(url)
+
+    def find(self, signature: int, exclude_url: Optional[str] = None) -> Optional[Tuple[str, int]]:
+        """
+        Find the closest indexed document within `max_distance` bits.
+
+        Args:
+            signature: SimHash signature to look up
+            exclude_url: URL to ignore (e.g. the document itself when re-scraped)
+
+        Returns:
+            Optional[Tuple[str, int]]: (canonical URL, Hamming distance), or None
+        """
+        best: Optional[Tuple[str, int]] = None
+        seen: Set[str] = set()
+        for bucket, value in zip(self._buckets, self._band_values(signature)):
+            for url in bucket.get(value, ()):
+                if url == exclude_url or url in seen:
+                    continue
+                seen.add(url)
+                distance = (signature ^ self._signatures[url]).bit_count()
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (url, distance)
+        return best
+
+    def add(self, url: str, signature: int) -> None:
+        """
+        Index a document as canonical.
+
+        Args:
+            url: Document URL
+            signature: Its SimHash signature
+        """
+        self._insert(url, signature)
+        self._conn.execute(
+            """
+            INSERT INTO signatures (url, simhash, added_at) VALUES (?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET simhash = excluded.simhash
+            """,
+            (url, _to_signed(signature), datetime.utcnow().isoformat()),
+        )
+        self._conn.commit()
+
+    def check(self, url: str, signature: int) -> Optional[Tuple[str, int]]:
+        """
+        Look up a document and index it if it is not a near-duplicate.
+
+        Args:
+            url: Document URL
+            signature: Its SimHash signature
+
+        Returns:
+            Optional[Tuple[str, int]]: (canonical URL, Hamming distance) if the
+                document duplicates an indexed one, else None
+        """
+        match = self.find(signature, exclude_url=url)
+        if match is None:
+            self.add(url, signature)
+        return match
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,188 @@
+"""
+Off-loop content extraction for scrapers
+
+Runs CPU-heavy trafilatura extraction in a process pool (or a thread pool)
+so the event loop keeps downloading while pages are parsed.
+"""
+
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+import trafilatura
+
+from intelligence_scraper.utils.logger import get_logger
+from intelligence_scraper.utils.pruning import PruneRules, prune_html
+
+logger = get_logger("intelligence.scraper.extraction")
+
+R = TypeVar("R")
+
+
+@dataclass
+class ExtractedContent:
+    """Raw extraction result returned from an extraction worker."""
+
+    content: str
+    title: Optional[str] = None
+    publish_date: Optional[str] = None
+    author: Optional[str] = None
+    description: Optional[str] = None
+    keywords: List[str] = field(default_factory=list)
+
+
+def extract_article(
+    html: str, prune_rules: Optional[PruneRules] = None
+) -> Optional[ExtractedContent]:
+    """
+    Extract article body and metadata from an HTML page with trafilatura.
+
+    The page is parsed once: body text and metadata (title, date, author,
+    description, tags) come from a single `bare_extraction` pass instead of
+    separate `extract` and `extract_metadata` calls that each re-parse the HTML.
+    Runs inside extraction workers, so it only takes and returns picklable data.
+
+    Args:
+        html: Raw HTML of the article page
+        prune_rules: Markup removed before extraction (None = extract the page as is)
+
+    Returns:
+        Optional[ExtractedContent]: Extracted content, or None if no body text was found
+    """
+    document_input: Any = html
+    if prune_rules is not None and prune_rules.enabled:
+        tree = prune_html(html, prune_rules)
+        # Fall back to the raw page if it cannot be parsed for pruning
+        if tree is not None:
+            document_input = tree
+
+    document = trafilatura.bare_extraction(
+        document_input,
+        include_comments=False,
+        include_tables=False,
+        no_fallback=False,
+        with_metadata=True,
+    )
+    if document is None:
+        return None
+
+    # trafilatura < 2.0 returns a dict, newer versions a Document object
+    data: Dict[str, Any] = document if isinstance(document, dict) else document.as_dict()
+
+    content = data.get("text")
+    if not content:
+        return None
+
+    keywords: List[str] = []
+    for value in (data.get("tags") or []) + (data.get("categories") or []):
+        keywords.extend(k.strip() for k in value.split(",") if k.strip())
+
+    return ExtractedContent(
+        content=content,
+        title=data.get("title") or None,
+        publish_date=data.get("date") or None,
+        author=data.get("author") or None,
+        description=data.get("description") or None,
+        keywords=list(dict.fromkeys(keywords)),
+    )
+
+
+def extract_article_two_pass(html: str) -> Optional[ExtractedContent]:
+    """
+    Extract article body and title with separate trafilatura calls.
+
+    Parses the HTML twice (once for the body, once for metadata). Kept as the
+    baseline for extraction benchmarks.
+
+    Args:
+        html: Raw HTML of the article page
+
+    Returns:
+        Optional[ExtractedContent]: Extracted content, or None if no body text was found
+    """
+    content = trafilatura.extract(
+        html,
+        include_comments=False,
+        include_tables=False,
+        no_fallback=False,
+    )
+    if not content:
+        return None
+
+    metadata_result = trafilatura.extract_metadata(html)
+    title = metadata_result.title if metadata_result and metadata_result.title else None
+
+    return ExtractedContent(content=content, title=title)
+
+
+def parse_publish_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a publish date extracted from page metadata.
+
+    Args:
+        value: ISO 8601 date or datetime string (e.g. "2024-03-18")
+
+    Returns:
+        Optional[datetime]: Parsed datetime, or None if missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+class ExtractionExecutor:
+    """
+    Executor for CPU-bound extraction work.
+
+    With `workers > 0` extraction runs in a process pool of that size and
+    scales across cores; with `workers == 0` it runs in a thread pool, which
+    keeps the event loop responsive without the process start-up cost.
+    """
+
+    def __init__(self, workers: int = 0, thread_workers: Optional[int] = None):
+        """
+        Initialize the executor.
+
+        Args:
+            workers: Number of extraction processes (0 = use a thread pool)
+            thread_workers: Thread pool size when workers is 0 (default: Python's default)
+        """
+        if workers < 0:
+            raise ValueError("workers must be 0 or greater")
+
+        self.workers = workers
+        self._executor: Executor
+        if workers > 0:
+            # Spawn fresh interpreters rather than forking a process with a running loop
+            self._executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=thread_workers, thread_name_prefix="extract"
+            )
+
+    async def run(self, func: Callable[..., R], *args: Any) -> R:
+        """
+        Run a function in the executor without blocking the event loop.
+
+        Args:
+            func: Module-level function (must be picklable for process pools)
+            *args: Picklable arguments
+
+        Returns:
+            The function's return value
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+
+    def close(self) -> None:
+        """Shut down the executor, waiting for running extractions to finish."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        logger.info("Extraction executor closed", extra={"workers": self.workers})
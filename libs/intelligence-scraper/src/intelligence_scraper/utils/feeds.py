@@ -0,0 +1,359 @@
+"""
+Sitemap and RSS/Atom feed discovery
+
+Finds article URLs and their last-modified dates from a site's sitemaps and
+feeds, so scrapers can list new articles without rendering HTML listings.
+Documents are parsed incrementally as they stream in, and each entry is
+released as soon as it has been read, so large sitemaps stay cheap.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, List, Optional, Set
+from urllib.parse import urljoin
+
+import httpx
+from lxml import etree
+
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.feeds")
+
+# Feed kinds, from the document's root element
+SITEMAP = "sitemap"
+SITEMAP_INDEX = "sitemapindex"
+RSS = "rss"
+ATOM = "atom"
+
+_ROOT_KINDS = {
+    "urlset": SITEMAP,
+    "sitemapindex": SITEMAP_INDEX,
+    "rss": RSS,
+    "RDF": RSS,
+    "feed": ATOM,
+}
+
+# Entry element of each feed kind
+_ENTRY_TAGS = {SITEMAP: "url", SITEMAP_INDEX: "sitemap", RSS: "item", ATOM: "entry"}
+
+# Date elements of each feed kind's entries, in order of preference
+_DATE_TAGS = {
+    SITEMAP: ("publication_date", "lastmod"),
+    SITEMAP_INDEX: ("lastmod",),
+    RSS: ("pubDate", "date", "updated"),
+    ATOM: ("updated", "published"),
+}
+
+DEFAULT_MAX_FEED_BYTES = 50 * 1024 * 1024
+DEFAULT_MAX_SITEMAPS = 10
+
+
+class FeedError(Exception):
+    """Raised when a document is not a sitemap or feed."""
+
+
+def parse_feed_date(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a sitemap (W3C datetime) or RSS (RFC 822) date.
+
+    Args:
+        value: Date text from a lastmod, pubDate, updated or similar element
+
+    Returns:
+        Optional[datetime]: Timezone-aware UTC datetime, or None if missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        try:
+            parsed = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+@dataclass
+class FeedEntry:
+    """One URL listed by a sitemap or feed."""
+
+    url: str
+    updated: Optional[datetime] = None
+
+
+@dataclass
+class Feed:
+    """Parsed sitemap or feed."""
+
+    url: str
+    kind: str
+    entries: List[FeedEntry] = field(default_factory=list)
+    # Child sitemaps listed by a sitemap index
+    sitemaps: List[FeedEntry] = field(default_factory=list)
+
+
+def _local_name(element: etree._Element) -> str:
+    name: str = etree.QName(element).localname
+    return name
+
+
+class FeedParser:
+    """
+    Incremental parser for sitemaps, sitemap indexes, RSS and Atom feeds.
+
+    Bytes are fed as they arrive; entries are collected when their closing
+    tag is read and the parsed elements are dropped straight away.
+    """
+
+    def __init__(self, url: str):
+        """
+        Initialize the parser.
+
+        Args:
+            url: Document URL, used to resolve relative links
+        """
+        self.url = url
+        self.feed: Optional[Feed] = None
+        self._parser = etree.XMLPullParser(
+            events=("start", "end"),
+            resolve_entities=False,
+            no_network=True,
+            remove_comments=True,
+            remove_pis=True,
+        )
+
+    def feed_bytes(self, data: bytes) -> None:
+        """
+        Parse the next chunk of the document.
+
+        Args:
+            data: Raw document bytes
+
+        Raises:
+            FeedError: If the document is not XML or its root is not a known feed type
+        """
+        try:
+            self._parser.feed(data)
+        except etree.XMLSyntaxError as e:
+            raise FeedError(f"invalid XML: {e}") from e
+        self._read_events()
+
+    def close(self) -> Feed:
+        """
+        Finish parsing.
+
+        Returns:
+            Feed: The parsed document
+
+        Raises:
+            FeedError: If the document is incomplete or not a feed
+        """
+        try:
+            self._parser.close()
+        except etree.XMLSyntaxError as e:
+            raise FeedError(f"invalid XML: {e}") from e
+        self._read_events()
+        if self.feed is None:
+            raise FeedError("empty document")
+        return self.feed
+
+    def _read_events(self) -> None:
+        for event, element in self._parser.read_events():
+            if not isinstance(element.tag, str):
+                continue
+            name = _local_name(element)
+
+            if self.feed is None:
+                kind = _ROOT_KINDS.get(name)
+                if kind is None:
+                    raise FeedError(f"not a sitemap or feed (root element <{name}>)")
+                self.feed = Feed(url=self.url, kind=kind)
+                continue
+
+            if event != "end" or name != _ENTRY_TAGS[self.feed.kind]:
+                continue
+
+            entry = self._entry(element, self.feed.kind)
+            if entry is not None:
+                if self.feed.kind == SITEMAP_INDEX:
+                    self.feed.sitemaps.append(entry)
+                else:
+                    self.feed.entries.append(entry)
+
+            # Drop the entry and any earlier siblings so memory stays flat
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+    def _entry(self, element: etree._Element, kind: str) -> Optional[FeedEntry]:
+        texts = {}
+        link = None
+        for child in element.iter():
+            if child is element or not isinstance(child.tag, str):
+                continue
+            child_name = _local_name(child)
+            if child_name == "link" and kind == ATOM:
+                # Atom links carry the URL in href; prefer the alternate (HTML) link
+                rel = child.get("rel", "alternate")
+                if child.get("href") and (link is None or rel == "alternate"):
+                    link = child.get("href")
+            elif child.text and child_name not in texts:
+                texts[child_name] = child.text.strip()
+
+        if kind in (SITEMAP, SITEMAP_INDEX):
+            link = texts.get("loc")
+        elif kind == RSS:
+            link = texts.get("link") or texts.get("guid")
+        if not link:
+            return None
+
+        updated = None
+        for tag in _DATE_TAGS[kind]:
+            updated = parse_feed_date(texts.get(tag))
+            if updated is not None:
+                break
+        return FeedEntry(url=urljoin(self.url, link), updated=updated)
+
+
+async def fetch_feed(
+    client: httpx.AsyncClient, url: str, max_bytes: int = DEFAULT_MAX_FEED_BYTES
+) -> Optional[Feed]:
+    """
+    Fetch and parse a sitemap or feed while it streams in.
+
+    Args:
+        client: HTTP client
+        url: Sitemap or feed URL
+        max_bytes: Largest document read
+
+    Returns:
+        Optional[Feed]: Parsed document, or None if it is missing, too large
+            or not a sitemap/feed (e.g. an HTML error page)
+    """
+    parser = FeedParser(url)
+    size = 0
+    try:
+        async with client.stream("GET", url) as response:
+            if response.status_code != 200:
+                logger.info(
+                    "Feed not available",
+                    extra={"url": url, "status_code": response.status_code},
+                )
+                return None
+
+            async for chunk in response.aiter_bytes():
+                size += len(chunk)
+                if size > max_bytes:
+                    logger.warning(
+                        "Feed too large, ignoring it", extra={"url": url, "max_bytes": max_bytes}
+                    )
+                    return None
+                parser.feed_bytes(chunk)
+            feed = parser.close()
+
+    except FeedError as e:
+        logger.info(f"Not a usable feed: {e}", extra={"url": url})
+        return None
+    except httpx.HTTPError as e:
+        logger.warning(f"Failed to fetch feed: {e}", extra={"url": url, "error": str(e)})
+        return None
+
+    logger.info(
+        "Parsed feed",
+        extra={
+            "url": url,
+            "kind": feed.kind,
+            "entries": len(feed.entries),
+            "sitemaps": len(feed.sitemaps),
+            "bytes": size,
+        },
+    )
+    return feed
+
+
+def newest_first(entries: List[FeedEntry]) -> List[FeedEntry]:
+    """Sort entries by date, newest first, with undated entries last."""
+    return sorted(
+        entries, key=lambda e: e.updated or datetime.min.replace(tzinfo=timezone.utc), reverse=True
+    )
+
+
+def _is_newer(entry: FeedEntry, watermark: Optional[datetime]) -> bool:
+    # Undated entries cannot be ruled out, so they are kept
+    return watermark is None or entry.updated is None or entry.updated > watermark
+
+
+async def discover_feed_entries(
+    client: httpx.AsyncClient,
+    feed_urls: List[str],
+    watermark: Optional[datetime] = None,
+    accept: Optional[Callable[[str], bool]] = None,
+    max_bytes: int = DEFAULT_MAX_FEED_BYTES,
+    max_sitemaps: int = DEFAULT_MAX_SITEMAPS,
+) -> Optional[List[FeedEntry]]:
+    """
+    List entries from the first candidate sitemap or feed that lists articles.
+
+    Sitemap indexes are followed into their child sitemaps (the newest
+    `max_sitemaps` by lastmod, undated ones last), skipping children whose
+    lastmod is not newer than the watermark.
+
+    Args:
+        client: HTTP client
+        feed_urls: Candidate sitemap and feed URLs, in order of preference
+        watermark: Only return entries updated after this time (undated entries are kept)
+        accept: Predicate selecting article URLs among the entries
+        max_bytes: Largest document read
+        max_sitemaps: Most child sitemaps fetched from a sitemap index
+
+    Returns:
+        Optional[List[FeedEntry]]: Newer entries, newest first with undated
+            entries last, or None if no candidate is a sitemap or feed with
+            accepted entries
+    """
+    for feed_url in feed_urls:
+        feed = await fetch_feed(client, feed_url, max_bytes)
+        if feed is None:
+            continue
+
+        entries = list(feed.entries)
+        children = newest_first([child for child in feed.sitemaps if _is_newer(child, watermark)])
+        fetched: Set[str] = {feed_url}
+        for child in children[:max_sitemaps]:
+            if child.url in fetched:
+                continue
+            fetched.add(child.url)
+            child_feed = await fetch_feed(client, child.url, max_bytes)
+            if child_feed is not None:
+                entries.extend(child_feed.entries)
+
+        seen: Set[str] = set()
+        accepted = []
+        for entry in entries:
+            if entry.url in seen or (accept is not None and not accept(entry.url)):
+                continue
+            seen.add(entry.url)
+            accepted.append(entry)
+
+        if not accepted:
+            logger.info("Feed lists no articles", extra={"feed_url": feed_url})
+            continue
+
+        selected = newest_first([entry for entry in accepted if _is_newer(entry, watermark)])
+        logger.info(
+            "Discovered articles from feed",
+            extra={
+                "feed_url": feed_url,
+                "entries": len(accepted),
+                "selected": len(selected),
+                "watermark": watermark.isoformat() if watermark else None,
+            },
+        )
+        return selected
+
+    return None
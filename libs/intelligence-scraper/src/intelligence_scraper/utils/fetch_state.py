@@ -0,0 +1,202 @@
+"""
+Per-URL fetch state store
+
+Persists HTTP validators and content hashes in SQLite so re-runs can send
+conditional requests and skip pages that have not changed, plus per-source
+feed watermarks so re-runs only list articles published since the last run.
+"""
+
+import hashlib
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.fetch_state")
+
+STATE_DB_NAME = "fetch_state.sqlite3"
+
+
+@dataclass
+class FetchState:
+    """Stored fetch information for a single URL."""
+
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_hash: Optional[str]
+    status: str
+    fetched_at: str
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Build conditional request headers from the stored validators.
+
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since headers (may be empty)
+        """
+        headers: Dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def content_hash(body: bytes) -> str:
+    """
+    Compute the hash used to detect unchanged page content.
+
+    Args:
+        body: Raw response body
+
+    Returns:
+        str: Hex-encoded SHA-256 digest
+    """
+    return hashlib.sha256(body).hexdigest()
+
+
+class FetchStateStore:
+    """
+    SQLite-backed store of per-URL fetch state.
+
+    Each URL keeps its last ETag, Last-Modified header, content hash and
+    whether the last fetch found it "changed" or "unchanged".
+    """
+
+    def __init__(self, state_dir: str):
+        """
+        Open (or create) the fetch state database.
+
+        Args:
+            state_dir: Directory holding the SQLite database
+        """
+        directory = Path(state_dir)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.path = directory / STATE_DB_NAME
+
+        # Accessed only from the event loop thread, but allow use across threads
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS fetch_state (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                content_hash TEXT,
+                status TEXT NOT NULL,
+                fetched_at TEXT NOT NULL
+            )
+            """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS feed_watermarks (
+                source TEXT PRIMARY KEY,
+                watermark TEXT NOT NULL
+            )
+            """)
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[FetchState]:
+        """
+        Get the stored state for a URL.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Optional[FetchState]: Stored state or None if the URL was never fetched
+        """
+        row = self._conn.execute("SELECT * FROM fetch_state WHERE url = ?", (url,)).fetchone()
+        return FetchState(**dict(row)) if row else None
+
+    def record(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body_hash: Optional[str],
+    ) -> None:
+        """
+        Record a successful fetch of new or changed content.
+
+        Args:
+            url: Page URL
+            etag: ETag response header, if any
+            last_modified: Last-Modified response header, if any
+            body_hash: Content hash of the response body
+        """
+        self._conn.execute(
+            """
+            INSERT INTO fetch_state (url, etag, last_modified, content_hash, status, fetched_at)
+            VALUES (?, ?, ?, ?, 'changed', ?)
+            ON CONFLICT(url) DO UPDATE SET
+                etag = excluded.etag,
+                last_modified = excluded.last_modified,
+                content_hash = excluded.content_hash,
+                status = excluded.status,
+                fetched_at = excluded.fetched_at
+            """,
+            (url, etag, last_modified, body_hash, datetime.utcnow().isoformat()),
+        )
+        self._conn.commit()
+
+    def mark_unchanged(self, url: str) -> None:
+        """
+        Record that a fetch found the URL unchanged.
+
+        Args:
+            url: Page URL
+        """
+        self._conn.execute(
+            "UPDATE fetch_state SET status = 'unchanged', fetched_at = ? WHERE url = ?",
+            (datetime.utcnow().isoformat(), url),
+        )
+        self._conn.commit()
+
+    def known_urls(self) -> Set[str]:
+        """
+        Get every URL that has stored fetch state.
+
+        Returns:
+            Set[str]: Known URLs
+        """
+        return {row["url"] for row in self._conn.execute("SELECT url FROM fetch_state")}
+
+    def get_watermark(self, source: str) -> Optional[datetime]:
+        """
+        Get the newest feed entry date handled by the last completed run.
+
+        Args:
+            source: Scraper source name
+
+        Returns:
+            Optional[datetime]: Watermark, or None if the source has none yet
+        """
+        row = self._conn.execute(
+            "SELECT watermark FROM feed_watermarks WHERE source = ?", (source,)
+        ).fetchone()
+        return datetime.fromisoformat(row["watermark"]) if row else None
+
+    def set_watermark(self, source: str, watermark: datetime) -> None:
+        """
+        Store a source's feed watermark.
+
+        Args:
+            source: Scraper source name
+            watermark: Newest feed entry date handled
+        """
+        self._conn.execute(
+            """
+            INSERT INTO feed_watermarks (source, watermark) VALUES (?, ?)
+            ON CONFLICT(source) DO UPDATE SET watermark = excluded.watermark
+            """,
+            (source, watermark.isoformat()),
+        )
+        self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
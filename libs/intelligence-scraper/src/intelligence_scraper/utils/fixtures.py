@@ -0,0 +1,282 @@
+"""
+HTTP fixture recording and replay for scrapers
+
+Records listing and article responses into a fixture archive, and replays them
+from a local HTTP server with configurable latency for offline runs and benchmarks.
+"""
+
+import base64
+import gzip
+import json
+import random
+import threading
+import time
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, Iterable, List, Optional, Type
+from urllib.parse import urlsplit
+
+import httpx
+
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.fixtures")
+
+# Headers that describe the wire encoding rather than the decoded body we store
+_HOP_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+
+@dataclass
+class FixtureEntry:
+    """One recorded HTTP response."""
+
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: str  # base64-encoded decoded body
+
+    @property
+    def content(self) -> bytes:
+        """Decoded response body."""
+        return base64.b64decode(self.body)
+
+
+class FixtureArchive:
+    """
+    Archive of recorded responses, stored as gzip-compressed JSON lines.
+
+    Later recordings of the same URL replace earlier ones.
+    """
+
+    def __init__(self, entries: Optional[Iterable[FixtureEntry]] = None):
+        """
+        Initialize the archive.
+
+        Args:
+            entries: Initial entries
+        """
+        self._entries: Dict[str, FixtureEntry] = {}
+        for entry in entries or ():
+            self._entries[entry.url] = entry
+
+    @property
+    def entries(self) -> List[FixtureEntry]:
+        """All recorded entries."""
+        return list(self._entries.values())
+
+    def add(self, url: str, status: int, headers: Dict[str, str], content: bytes) -> None:
+        """
+        Record a response.
+
+        Args:
+            url: Request URL
+            status: Response status code
+            headers: Response headers
+            content: Decoded response body
+        """
+        headers = {k: v for k, v in headers.items() if k.lower() not in _HOP_HEADERS}
+        self._entries[url] = FixtureEntry(
+            url=url,
+            status=status,
+            headers=headers,
+            body=base64.b64encode(content).decode("ascii"),
+        )
+
+    def save(self, path: str) -> None:
+        """
+        Write the archive to disk.
+
+        Args:
+            path: Archive file path (conventionally *.jsonl.gz)
+        """
+        output_path = Path(path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(output_path, "wt", encoding="utf-8") as f:
+            for entry in self._entries.values():
+                f.write(json.dumps(asdict(entry)) + "\n")
+        logger.info(
+            f"Saved {len(self._entries)} fixtures to {path}",
+            extra={"fixture_count": len(self._entries), "path": path},
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "FixtureArchive":
+        """
+        Read an archive from disk.
+
+        Args:
+            path: Archive file path
+
+        Returns:
+            FixtureArchive: Loaded archive
+        """
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return cls(FixtureEntry(**json.loads(line)) for line in f if line.strip())
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """httpx transport that records every response into a fixture archive."""
+
+    def __init__(self, archive: FixtureArchive, transport: httpx.AsyncBaseTransport):
+        """
+        Initialize the recording transport.
+
+        Args:
+            archive: Archive receiving recorded responses
+            transport: Transport that performs the real requests
+        """
+        self._archive = archive
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Forward the request and record the decoded response."""
+        response = await self._transport.handle_async_request(request)
+        content = await response.aread()
+        await response.aclose()
+
+        self._archive.add(str(request.url), response.status_code, dict(response.headers), content)
+
+        headers = [(k, v) for k, v in response.headers.items() if k.lower() not in _HOP_HEADERS]
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=headers,
+            content=content,
+            extensions=response.extensions,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
+
+
+class ReplayServer:
+    """
+    Local HTTP stand-in that serves recorded responses.
+
+    Requests are matched on path and query string. Absolute links to the
+    recorded origins inside text bodies are rewritten to the server's own
+    address, so crawls (including Playwright navigation) stay local.
+    """
+
+    def __init__(
+        self,
+        archive: FixtureArchive,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """
+        Initialize the replay server.
+
+        Args:
+            archive: Recorded responses to serve
+            latency: Delay in seconds added before each response
+            jitter: Random extra delay in seconds (uniform 0..jitter)
+            host: Interface to bind
+            port: Port to bind (0 = pick a free port)
+        """
+        self.archive = archive
+        self.latency = latency
+        self.jitter = jitter
+        self.hits = 0
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self.base_url = f"http://{host}:{self._server.server_port}"
+
+        self._origins = sorted(
+            {f"{urlsplit(e.url).scheme}://{urlsplit(e.url).netloc}" for e in archive.entries},
+            key=len,
+            reverse=True,
+        )
+        self._routes: Dict[str, FixtureEntry] = {}
+        for entry in archive.entries:
+            parts = urlsplit(entry.url)
+            self._routes[parts.path + (f"?{parts.query}" if parts.query else "")] = entry
+
+    def url_for(self, recorded_url: str) -> str:
+        """
+        Map a recorded URL to its address on the replay server.
+
+        Args:
+            recorded_url: URL as recorded
+
+        Returns:
+            str: Equivalent URL on this server
+        """
+        for origin in self._origins:
+            if recorded_url.startswith(origin):
+                return self.base_url + recorded_url.removeprefix(origin)
+        return recorded_url
+
+    def start(self) -> "ReplayServer":
+        """Start serving in a background thread."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Replay server listening on {self.base_url}",
+            extra={"routes": len(self._routes), "latency": self.latency},
+        )
+        return self
+
+    def stop(self) -> None:
+        """Stop the server."""
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.stop()
+
+    def _render(self, entry: FixtureEntry) -> bytes:
+        """Get an entry's body with recorded origins pointed at this server."""
+        content = entry.content
+        content_type = entry.headers.get("content-type", entry.headers.get("Content-Type", ""))
+        if not content_type.startswith("text/") and "xml" not in content_type:
+            return content
+        text = content.decode("utf-8", errors="replace")
+        for origin in self._origins:
+            text = text.replace(origin, self.base_url)
+        return text.encode("utf-8")
+
+    def _make_handler(self) -> Type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                server.hits += 1
+                delay = server.latency + random.uniform(0, server.jitter)
+                if delay:
+                    time.sleep(delay)
+
+                entry = server._routes.get(self.path)
+                if entry is None:
+                    body = b"not recorded"
+                    self.send_response(404)
+                    self.send_header("Content-Type", "text/plain")
+                else:
+                    body = server._render(entry)
+                    self.send_response(entry.status)
+                    for name, value in entry.headers.items():
+                        self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return Handler
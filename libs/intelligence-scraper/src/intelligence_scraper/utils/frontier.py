@@ -0,0 +1,442 @@
+"""
+Distributed crawl frontier in MongoDB
+
+Stores the URLs to fetch in a MongoDB collection so any number of scraper
+workers, in any number of containers, can share one crawl. Workers claim
+batches of due URLs under a time-limited lease, renew the lease while they
+work and then mark each URL done or failed. A URL whose lease expires because
+its worker crashed or was killed can be claimed again.
+
+Needs the optional Motor driver (the "mongo" extra).
+"""
+
+import os
+import socket
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.frontier")
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+DEFAULT_COLLECTION = "crawl_frontier"
+DEFAULT_DATABASE = "intelligence"
+DEFAULT_LEASE_SECONDS = 300.0
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_RETRY_DELAY = 600.0
+
+# Highest priority first, then the URL that has been due the longest
+CLAIM_SORT = [("priority", -1), ("nextFetchAt", 1)]
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def default_worker_id() -> str:
+    """Get a worker ID unique to this process (host, PID and a random suffix)."""
+    return f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+
+
+@dataclass
+class FrontierItem:
+    """A URL claimed from the frontier."""
+
+    url: str
+    source: Optional[str]
+    priority: int
+    # Claims so far, including this one
+    attempts: int
+    lease_expires_at: datetime
+
+
+def seed_update(
+    url: str, source: Optional[str], priority: int, next_fetch_at: datetime, now: datetime
+) -> Dict[str, Any]:
+    """
+    Build the upsert that adds a URL to the frontier.
+
+    URLs already in the frontier keep their state and schedule, so seeding is
+    idempotent and workers can all seed the same discovered URLs; only their
+    priority is raised if the new one is higher.
+
+    Returns:
+        Dict[str, Any]: Update document for {"_id": url}
+    """
+    return {
+        "$setOnInsert": {
+            "url": url,
+            "source": source,
+            "state": PENDING,
+            "nextFetchAt": next_fetch_at,
+            "leaseOwner": None,
+            "leaseExpiresAt": None,
+            "attempts": 0,
+            "lastError": None,
+            "createdAt": now,
+        },
+        "$max": {"priority": priority},
+    }
+
+
+def claim_query(now: datetime, source: Optional[str], max_attempts: int) -> Dict[str, Any]:
+    """
+    Build the filter matching URLs a worker may claim.
+
+    A URL is claimable when it is pending, due, has attempts left and is
+    either unleased or its lease has expired.
+
+    Args:
+        now: Current time
+        source: Only match URLs of this source (None = any source)
+        max_attempts: Claims allowed per URL before it is given up on
+
+    Returns:
+        Dict[str, Any]: Query document
+    """
+    query: Dict[str, Any] = {
+        "state": PENDING,
+        "nextFetchAt": {"$lte": now},
+        "attempts": {"$lt": max_attempts},
+        "$or": [{"leaseExpiresAt": None}, {"leaseExpiresAt": {"$lte": now}}],
+    }
+    if source is not None:
+        query["source"] = source
+    return query
+
+
+def claim_update(owner: str, now: datetime, lease_seconds: float) -> Dict[str, Any]:
+    """Build the update that leases a claimed URL to a worker."""
+    return {
+        "$set": {
+            "leaseOwner": owner,
+            "leaseExpiresAt": now + timedelta(seconds=lease_seconds),
+            "updatedAt": now,
+        },
+        "$inc": {"attempts": 1},
+    }
+
+
+def retry_delay(attempts: int, base_delay: float) -> float:
+    """Get the delay before a failed URL is due again (doubles with each attempt)."""
+    return base_delay * 2.0 ** max(0, attempts - 1)
+
+
+class CrawlFrontier:
+    """
+    MongoDB-backed queue of URLs shared by scraper workers.
+
+    Each document is one URL (its _id) with priority, nextFetchAt, state,
+    leaseOwner, leaseExpiresAt and attempts. Claiming uses one atomic
+    find-and-modify per URL, so two workers never hold the same URL; a batch
+    is claimed one URL at a time.
+
+    Lease times come from each worker's clock, so worker clocks should agree
+    to well within the lease length.
+
+        frontier = CrawlFrontier.connect("mongodb://mongodb:27017/intelligence")
+        await frontier.ensure_indexes()
+        async with NvidiaScraper(frontier=frontier) as scraper:
+            async for article in scraper.scrape_iter():
+                ...
+    """
+
+    def __init__(
+        self,
+        collection: Any,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        retry_delay: float = DEFAULT_RETRY_DELAY,
+        recrawl_after: Optional[float] = None,
+        client: Any = None,
+    ):
+        """
+        Initialize the frontier.
+
+        Args:
+            collection: Motor collection holding the frontier
+            worker_id: Lease owner name of this worker (default: host, PID and a
+                random suffix)
+            lease_seconds: How long a claim is held before other workers may take it
+            max_attempts: Claims per URL before it is marked failed
+            retry_delay: Seconds before a failed URL is due again, doubled after
+                each further failure
+            recrawl_after: Seconds after which a done URL is due again
+                (None = fetch each URL once)
+            client: Motor client to close with the frontier, if it owns one
+
+        Raises:
+            ValueError: If the lease length or attempt limit is not positive
+        """
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive")
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.collection = collection
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.recrawl_after = recrawl_after
+        self._client = client
+
+    @classmethod
+    def connect(
+        cls, url: str, collection: str = DEFAULT_COLLECTION, **kwargs: Any
+    ) -> "CrawlFrontier":
+        """
+        Open a frontier in the database named by a MongoDB connection string.
+
+        Args:
+            url: MongoDB connection string (database from its path, default
+                "intelligence")
+            collection: Collection name
+            **kwargs: Options passed to CrawlFrontier
+
+        Returns:
+            CrawlFrontier: Frontier that closes its client on close()
+
+        Raises:
+            ImportError: If Motor is not installed
+        """
+        try:
+            from motor.motor_asyncio import AsyncIOMotorClient
+        except ImportError as e:
+            raise ImportError(
+                "The crawl frontier needs Motor: pip install 'intelligence-scraper[mongo]'"
+            ) from e
+
+        client = AsyncIOMotorClient(url, tz_aware=True)
+        database = client.get_default_database(DEFAULT_DATABASE)
+        return cls(database[collection], client=client, **kwargs)
+
+    def close(self) -> None:
+        """Close the MongoDB client if the frontier opened it."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
+    async def ensure_indexes(self) -> None:
+        """Create the indexes used to claim URLs and find expired leases."""
+        await self.collection.create_index(
+            [("source", 1), ("state", 1), ("priority", -1), ("nextFetchAt", 1)]
+        )
+        await self.collection.create_index([("state", 1), ("leaseExpiresAt", 1)])
+
+    async def seed(
+        self,
+        urls: Iterable[str],
+        source: Optional[str] = None,
+        priority: int = 0,
+        next_fetch_at: Optional[datetime] = None,
+    ) -> int:
+        """
+        Add URLs to the frontier.
+
+        Args:
+            urls: URLs to fetch
+            source: Source name the URLs belong to
+            priority: Higher priorities are claimed first
+            next_fetch_at: Earliest time to fetch them (default: now)
+
+        Returns:
+            int: Number of URLs that were not already in the frontier
+        """
+        from pymongo import UpdateOne
+
+        now = _now()
+        due = next_fetch_at or now
+        operations = [
+            UpdateOne({"_id": url}, seed_update(url, source, priority, due, now), upsert=True)
+            for url in dict.fromkeys(urls)
+        ]
+        if not operations:
+            return 0
+        result = await self.collection.bulk_write(operations, ordered=False)
+        return int(result.upserted_count)
+
+    async def claim(self, batch_size: int, source: Optional[str] = None) -> List[FrontierItem]:
+        """
+        Lease up to batch_size due URLs to this worker.
+
+        Args:
+            batch_size: Maximum number of URLs to claim
+            source: Only claim URLs of this source (None = any source)
+
+        Returns:
+            List[FrontierItem]: Claimed URLs, highest priority first (empty when
+                nothing is due)
+        """
+        from pymongo import ReturnDocument
+
+        items = []
+        for _ in range(batch_size):
+            now = _now()
+            document = await self.collection.find_one_and_update(
+                claim_query(now, source, self.max_attempts),
+                claim_update(self.worker_id, now, self.lease_seconds),
+                sort=CLAIM_SORT,
+                return_document=ReturnDocument.AFTER,
+            )
+            if document is None:
+                break
+            items.append(
+                FrontierItem(
+                    url=document["_id"],
+                    source=document.get("source"),
+                    priority=document.get("priority", 0),
+                    attempts=document["attempts"],
+                    lease_expires_at=document["leaseExpiresAt"],
+                )
+            )
+        return items
+
+    async def renew(self, items: Iterable[FrontierItem]) -> int:
+        """
+        Extend this worker's leases on claimed URLs.
+
+        Args:
+            items: Claimed URLs still being worked on
+
+        Returns:
+            int: Number of leases renewed (fewer if some were lost to other workers)
+        """
+        items = list(items)
+        if not items:
+            return 0
+        now = _now()
+        expires_at = now + timedelta(seconds=self.lease_seconds)
+        result = await self.collection.update_many(
+            {"_id": {"$in": [item.url for item in items]}, "leaseOwner": self.worker_id},
+            {"$set": {"leaseExpiresAt": expires_at, "updatedAt": now}},
+        )
+        for item in items:
+            item.lease_expires_at = expires_at
+        if result.modified_count < len(items):
+            logger.warning(
+                "Frontier leases lost",
+                extra={"held": len(items), "renewed": result.modified_count},
+            )
+        return int(result.modified_count)
+
+    async def complete(self, item: FrontierItem) -> bool:
+        """
+        Mark a claimed URL done (or schedule its recrawl when recrawl_after is set).
+
+        Returns:
+            bool: False if this worker no longer held the lease
+        """
+        now = _now()
+        fields: Dict[str, Any] = {"lastError": None, "fetchedAt": now}
+        if self.recrawl_after is None:
+            fields["state"] = DONE
+        else:
+            fields["nextFetchAt"] = now + timedelta(seconds=self.recrawl_after)
+            fields["attempts"] = 0
+        return await self._finish(item, now, fields)
+
+    async def fail(self, item: FrontierItem, error: str) -> bool:
+        """
+        Record a failed attempt on a claimed URL.
+
+        The URL is due again after a backoff, or marked failed once it has
+        used up max_attempts.
+
+        Returns:
+            bool: False if this worker no longer held the lease
+        """
+        now = _now()
+        fields: Dict[str, Any] = {"lastError": error}
+        if item.attempts >= self.max_attempts:
+            fields["state"] = FAILED
+        else:
+            delay = retry_delay(item.attempts, self.retry_delay)
+            fields["nextFetchAt"] = now + timedelta(seconds=delay)
+        return await self._finish(item, now, fields)
+
+    async def release(self, item: FrontierItem, delay: float = 0.0) -> bool:
+        """
+        Give a claimed URL back without counting the attempt.
+
+        Args:
+            item: Claimed URL that was not fetched
+            delay: Seconds before it is due again
+
+        Returns:
+            bool: False if this worker no longer held the lease
+        """
+        now = _now()
+        fields: Dict[str, Any] = {"attempts": max(0, item.attempts - 1)}
+        if delay > 0:
+            fields["nextFetchAt"] = now + timedelta(seconds=delay)
+        return await self._finish(item, now, fields)
+
+    async def _finish(self, item: FrontierItem, now: datetime, fields: Dict[str, Any]) -> bool:
+        """Clear this worker's lease on a URL and apply the outcome fields."""
+        result = await self.collection.update_one(
+            {"_id": item.url, "leaseOwner": self.worker_id},
+            {"$set": {**fields, "leaseOwner": None, "leaseExpiresAt": None, "updatedAt": now}},
+        )
+        if result.modified_count == 0:
+            logger.warning(
+                "Frontier lease lost before the URL was finished",
+                extra={"url": item.url, "worker": self.worker_id},
+            )
+            return False
+        return True
+
+    async def reclaim_expired(self) -> int:
+        """
+        Clear expired leases, marking URLs that have used up their attempts failed.
+
+        Expired URLs with attempts left can be claimed without this; clearing
+        them keeps leaseOwner accurate and stops crash-looping URLs from
+        staying pending forever.
+
+        Returns:
+            int: Number of expired leases cleared
+        """
+        now = _now()
+        expired = {"state": PENDING, "leaseExpiresAt": {"$lte": now}}
+        cleared = {"leaseOwner": None, "leaseExpiresAt": None, "updatedAt": now}
+        exhausted = await self.collection.update_many(
+            {**expired, "attempts": {"$gte": self.max_attempts}},
+            {"$set": {**cleared, "state": FAILED, "lastError": "lease expired"}},
+        )
+        reclaimed = await self.collection.update_many(expired, {"$set": cleared})
+        total = int(exhausted.modified_count + reclaimed.modified_count)
+        if total:
+            logger.info(
+                "Reclaimed expired frontier leases",
+                extra={"reclaimed": reclaimed.modified_count, "failed": exhausted.modified_count},
+            )
+        return total
+
+    async def stats(self, source: Optional[str] = None) -> Dict[str, int]:
+        """
+        Count URLs by state.
+
+        Args:
+            source: Only count URLs of this source (None = all)
+
+        Returns:
+            Dict[str, int]: Count per state, plus "leased"
+        """
+        match = {"source": source} if source is not None else {}
+        counts = {PENDING: 0, DONE: 0, FAILED: 0}
+        async for row in self.collection.aggregate(
+            [{"$match": match}, {"$group": {"_id": "$state", "count": {"$sum": 1}}}]
+        ):
+            counts[row["_id"]] = row["count"]
+        counts["leased"] = await self.collection.count_documents(
+            {**match, "leaseExpiresAt": {"$gt": _now()}}
+        )
+        return counts
@@ -0,0 +1,291 @@
+"""
+Raw HTML archive
+
+Append-only store of fetched pages so content can be re-extracted after
+cleaning or extraction changes without re-crawling. Pages are written as
+WARC-like records to compressed segment files, and a SQLite index maps each
+(URL, fetch time) to the record's segment, offset and length.
+"""
+
+import gzip
+import importlib.util
+import sqlite3
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, List, Optional
+
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.html_archive")
+
+INDEX_DB_NAME = "index.sqlite3"
+DEFAULT_SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+CODEC_EXTENSIONS = {"zstd": ".warc.zst", "gzip": ".warc.gz"}
+
+
+def zstd_available() -> bool:
+    """Check whether the optional `zstandard` package used for archive segments is installed."""
+    return importlib.util.find_spec("zstandard") is not None
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    # Each record is its own frame so it can be read back with a single seek
+    if codec == "zstd":
+        import zstandard
+
+        compressed: bytes = zstandard.ZstdCompressor(level=3).compress(data)
+        return compressed
+    return gzip.compress(data)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        import zstandard
+
+        decompressed: bytes = zstandard.ZstdDecompressor().decompress(data)
+        return decompressed
+    return gzip.decompress(data)
+
+
+def _segment_codec(segment: str) -> str:
+    for codec, extension in CODEC_EXTENSIONS.items():
+        if segment.endswith(extension):
+            return codec
+    raise ValueError(f"Unknown archive segment type: {segment}")
+
+
+@dataclass
+class ArchiveEntry:
+    """Index entry pointing at one archived page."""
+
+    record_id: str
+    url: str
+    source: str
+    fetched_at: str
+    segment: str
+    offset: int
+    length: int
+
+
+class HtmlArchive:
+    """
+    Append-only, compressed archive of raw page HTML.
+
+    Records are compressed independently and appended to the current segment
+    file; a new segment is started once it grows past `segment_max_bytes`.
+    Segments are never rewritten, so an interrupted run can at worst leave
+    an unindexed record at the end of a segment.
+    """
+
+    def __init__(
+        self,
+        archive_dir: str,
+        codec: Optional[str] = None,
+        segment_max_bytes: int = DEFAULT_SEGMENT_MAX_BYTES,
+    ):
+        """
+        Open (or create) an archive directory.
+
+        Args:
+            archive_dir: Directory holding segment files and the index
+            codec: "zstd" or "gzip" for new records (default: zstd when the
+                'archive' extra is installed, otherwise gzip)
+            segment_max_bytes: Size after which a new segment file is started
+
+        Raises:
+            ValueError: If the codec is unknown or zstd is requested but not installed
+        """
+        if codec is None:
+            codec = "zstd" if zstd_available() else "gzip"
+        if codec not in CODEC_EXTENSIONS:
+            raise ValueError(f"Unknown archive codec: {codec}")
+        if codec == "zstd" and not zstd_available():
+            raise ValueError(
+                "zstd archives need zstandard: pip install 'intelligence-scraper[archive]'"
+            )
+
+        self.directory = Path(archive_dir)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.codec = codec
+        self.segment_max_bytes = segment_max_bytes
+
+        self._conn = sqlite3.connect(self.directory / INDEX_DB_NAME, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS records (
+                record_id TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                source TEXT NOT NULL,
+                fetched_at TEXT NOT NULL,
+                segment TEXT NOT NULL,
+                offset INTEGER NOT NULL,
+                length INTEGER NOT NULL
+            )
+            """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS records_url ON records (url, fetched_at)")
+        self._conn.commit()
+
+        self._segment_file: Optional[BinaryIO] = None
+        self._readers: Dict[str, BinaryIO] = {}
+
+    def _segment_number(self, path: Path) -> int:
+        return int(path.name.split(".", 1)[0].rsplit("-", 1)[1])
+
+    def _open_segment(self) -> BinaryIO:
+        """Return the segment file to append to, starting a new one when full."""
+        if self._segment_file is not None and self._segment_file.tell() < self.segment_max_bytes:
+            return self._segment_file
+
+        if self._segment_file is not None:
+            self._segment_file.close()
+
+        extension = CODEC_EXTENSIONS[self.codec]
+        segments = sorted(self.directory.glob(f"segment-*{extension}"), key=self._segment_number)
+        if segments and segments[-1].stat().st_size < self.segment_max_bytes:
+            path = segments[-1]
+        else:
+            existing = [self._segment_number(p) for p in self.directory.glob("segment-*.warc.*")]
+            path = self.directory / f"segment-{max(existing, default=0) + 1:05d}{extension}"
+
+        self._segment_file = open(path, "ab")
+        return self._segment_file
+
+    def append(
+        self, url: str, html: str, source: str, fetched_at: Optional[datetime] = None
+    ) -> ArchiveEntry:
+        """
+        Append a fetched page to the archive.
+
+        Args:
+            url: Page URL
+            html: Raw page HTML
+            source: Name of the scraper that fetched the page
+            fetched_at: Fetch time (default: now, UTC)
+
+        Returns:
+            ArchiveEntry: Index entry for the new record
+        """
+        record_id = f"urn:uuid:{uuid.uuid4()}"
+        fetched = (fetched_at or datetime.utcnow()).isoformat()
+        body = html.encode("utf-8")
+        header = (
+            "WARC/1.0\r\n"
+            "WARC-Type: response\r\n"
+            f"WARC-Record-ID: <{record_id}>\r\n"
+            f"WARC-Target-URI: {url}\r\n"
+            f"WARC-Date: {fetched}\r\n"
+            f"X-Scraper-Source: {source}\r\n"
+            "Content-Type: text/html; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "\r\n"
+        ).encode("utf-8")
+        frame = _compress(header + body + b"\r\n\r\n", self.codec)
+
+        segment_file = self._open_segment()
+        offset = segment_file.tell()
+        segment_file.write(frame)
+        segment_file.flush()
+
+        entry = ArchiveEntry(
+            record_id=record_id,
+            url=url,
+            source=source,
+            fetched_at=fetched,
+            segment=Path(segment_file.name).name,
+            offset=offset,
+            length=len(frame),
+        )
+        self._conn.execute(
+            "INSERT INTO records VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                entry.record_id,
+                entry.url,
+                entry.source,
+                entry.fetched_at,
+                entry.segment,
+                entry.offset,
+                entry.length,
+            ),
+        )
+        self._conn.commit()
+        return entry
+
+    def read(self, entry: ArchiveEntry) -> str:
+        """
+        Read the HTML of an archived page.
+
+        Args:
+            entry: Index entry from `entries()` or `append()`
+
+        Returns:
+            str: Page HTML
+        """
+        if self._segment_file is not None:
+            self._segment_file.flush()
+
+        reader = self._readers.get(entry.segment)
+        if reader is None:
+            reader = self._readers[entry.segment] = open(self.directory / entry.segment, "rb")
+        reader.seek(entry.offset)
+        record = _decompress(reader.read(entry.length), _segment_codec(entry.segment))
+
+        header, _, rest = record.partition(b"\r\n\r\n")
+        length = next(
+            int(line.split(b":", 1)[1])
+            for line in header.split(b"\r\n")
+            if line.lower().startswith(b"content-length:")
+        )
+        return rest[:length].decode("utf-8")
+
+    def entries(self, source: Optional[str] = None, latest_only: bool = True) -> List[ArchiveEntry]:
+        """
+        List archived pages.
+
+        Args:
+            source: Only return pages fetched by this scraper
+            latest_only: Return only the most recent fetch of each URL
+
+        Returns:
+            List[ArchiveEntry]: Entries ordered by segment and offset
+        """
+        query = "SELECT * FROM records"
+        params: List[str] = []
+        conditions = []
+        if source:
+            conditions.append("source = ?")
+            params.append(source)
+        if latest_only:
+            conditions.append(
+                "fetched_at = (SELECT MAX(fetched_at) FROM records AS r WHERE r.url = records.url)"
+            )
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY segment, offset"
+        return [ArchiveEntry(**dict(row)) for row in self._conn.execute(query, params)]
+
+    def latest(self, url: str) -> Optional[str]:
+        """
+        Get the most recently archived HTML for a URL.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            Optional[str]: Page HTML, or None if the URL was never archived
+        """
+        row = self._conn.execute(
+            "SELECT * FROM records WHERE url = ? ORDER BY fetched_at DESC LIMIT 1", (url,)
+        ).fetchone()
+        return self.read(ArchiveEntry(**dict(row))) if row else None
+
+    def close(self) -> None:
+        """Close segment files and the index."""
+        if self._segment_file is not None:
+            self._segment_file.close()
+            self._segment_file = None
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+        self._conn.close()
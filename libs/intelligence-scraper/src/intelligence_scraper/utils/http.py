@@ -0,0 +1,191 @@
+"""
+Shared HTTP client utilities for scrapers
+
+Builds a long-lived, keep-alive httpx client, tracks connection reuse and
+reads HTML bodies incrementally with size and content-type limits.
+"""
+
+import codecs
+import hashlib
+import importlib.util
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional
+
+import httpx
+
+from intelligence_scraper.utils.fixtures import FixtureArchive, RecordingTransport
+from intelligence_scraper.utils.logger import get_logger
+from intelligence_scraper.utils.politeness import PolitenessScheduler, PoliteTransport
+from intelligence_scraper.utils.telemetry import CONNECT, DOWNLOAD, WAIT, record_bytes, record_stage
+
+logger = get_logger("intelligence.scraper.http")
+
+DEFAULT_MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+HTML_CONTENT_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+
+# Skip reasons
+SKIP_CONTENT_TYPE = "content_type"
+SKIP_TOO_LARGE = "too_large"
+
+
+@dataclass
+class ConnectionStats:
+    """Counters describing how HTTP connections were used during a run."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    connections_reused: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Serialize the counters."""
+        return asdict(self)
+
+
+def http2_available() -> bool:
+    """Check whether the optional `h2` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def create_http_client(
+    timeout: float,
+    stats: ConnectionStats,
+    max_connections: int = 10,
+    max_keepalive_connections: int = 10,
+    keepalive_expiry: float = 30.0,
+    http2: bool = False,
+    record_archive: Optional[FixtureArchive] = None,
+    scheduler: Optional[PolitenessScheduler] = None,
+) -> httpx.AsyncClient:
+    """
+    Create a pooled async HTTP client shared by all requests of a scraper run.
+
+    Args:
+        timeout: Request timeout in seconds
+        stats: Counters updated as requests are sent and connections opened
+        max_connections: Maximum number of concurrent connections in the pool
+        max_keepalive_connections: Maximum number of idle connections kept open
+        keepalive_expiry: Seconds an idle connection is kept before closing
+        http2: Enable HTTP/2 (requires the `h2` package, falls back to HTTP/1.1)
+        record_archive: Record every response into this fixture archive
+        scheduler: Pace requests per host through this politeness scheduler
+
+    Returns:
+        httpx.AsyncClient: Configured client; the caller is responsible for closing it
+    """
+    if http2 and not http2_available():
+        logger.warning("HTTP/2 requested but 'h2' is not installed, using HTTP/1.1")
+        http2 = False
+
+    async def _on_request(request: httpx.Request) -> None:
+        stats.requests += 1
+        opened = False
+        started: Dict[str, float] = {}
+
+        async def _trace(event_name: str, info: Dict[str, Any]) -> None:
+            nonlocal opened
+            # httpcore only emits connect events when a new connection is established
+            if event_name == "connection.connect_tcp.complete":
+                opened = True
+                stats.connections_opened += 1
+            elif event_name.endswith(".send_request_headers.started") and not opened:
+                stats.connections_reused += 1
+
+            # Time DNS + TCP + TLS setup and the wait for response headers
+            now = time.perf_counter()
+            if event_name in ("connection.connect_tcp.started", "connection.start_tls.started"):
+                started[CONNECT] = now
+            elif event_name in ("connection.connect_tcp.complete", "connection.start_tls.complete"):
+                record_stage(CONNECT, now - started.pop(CONNECT, now))
+            elif event_name.endswith(".send_request_headers.started"):
+                started[WAIT] = now
+            elif event_name.endswith(".receive_response_headers.complete"):
+                record_stage(WAIT, now - started.pop(WAIT, now))
+
+        request.extensions["trace"] = _trace
+
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    transport: Optional[httpx.AsyncBaseTransport] = None
+    if record_archive is not None or scheduler is not None:
+        transport = httpx.AsyncHTTPTransport(http2=http2, limits=limits)
+        if record_archive is not None:
+            transport = RecordingTransport(record_archive, transport)
+        if scheduler is not None:
+            transport = PoliteTransport(scheduler, transport)
+
+    return httpx.AsyncClient(
+        timeout=timeout,
+        http2=http2,
+        limits=limits,
+        transport=transport,
+        event_hooks={"request": [_on_request]},
+    )
+
+
+class ResponseSkipped(Exception):
+    """Raised when a response body is not read because it is not a usable HTML page."""
+
+    def __init__(self, reason: str, detail: str):
+        super().__init__(f"{reason}: {detail}")
+        self.reason = reason
+        self.detail = detail
+
+
+@dataclass
+class HtmlBody:
+    """HTML body read from a streamed response."""
+
+    text: str
+    body_hash: str
+    size: int
+
+
+async def read_html_body(
+    response: httpx.Response, max_bytes: int = DEFAULT_MAX_RESPONSE_BYTES
+) -> HtmlBody:
+    """
+    Read an HTML body from a streamed response, giving up early on unusable pages.
+
+    Checks the Content-Type and Content-Length headers before reading, then
+    decodes and hashes the body chunk by chunk, stopping as soon as it grows
+    past `max_bytes`. Responses without a Content-Type are read as HTML.
+
+    Args:
+        response: Response opened with `client.stream()`
+        max_bytes: Largest decoded body accepted
+
+    Returns:
+        HtmlBody: Decoded text, content hash and size in bytes
+
+    Raises:
+        ResponseSkipped: With reason SKIP_CONTENT_TYPE or SKIP_TOO_LARGE
+    """
+    content_type = response.headers.get("content-type", "")
+    mime_type = content_type.split(";", 1)[0].strip().lower()
+    if mime_type and mime_type not in HTML_CONTENT_TYPES:
+        raise ResponseSkipped(SKIP_CONTENT_TYPE, mime_type)
+
+    declared = response.headers.get("content-length", "")
+    if declared.isdigit() and int(declared) > max_bytes:
+        raise ResponseSkipped(SKIP_TOO_LARGE, f"Content-Length {declared} > {max_bytes}")
+
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    hasher = hashlib.sha256()
+    parts = []
+    size = 0
+    started = time.perf_counter()
+    async for chunk in response.aiter_bytes():
+        size += len(chunk)
+        if size > max_bytes:
+            raise ResponseSkipped(SKIP_TOO_LARGE, f"body exceeded {max_bytes} bytes")
+        hasher.update(chunk)
+        parts.append(decoder.decode(chunk))
+    parts.append(decoder.decode(b"", final=True))
+    record_stage(DOWNLOAD, time.perf_counter() - started)
+    record_bytes(DOWNLOAD, size)
+
+    return HtmlBody(text="".join(parts), body_hash=hasher.hexdigest(), size=size)
@@ -0,0 +1,169 @@
+"""
+Run journal for checkpoint and resume
+
+Appends what a scrape run has done to a JSON-lines file: the discovered
+article URLs, every completed article and every failure. Each record is
+flushed as soon as it is written, so a run whose process is killed can be
+resumed from the journal without repeating listing crawls, fetches or
+Playwright renders that already completed.
+"""
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Dict, Iterable, List, Optional
+
+from intelligence_scraper.models import ScrapedArticle
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.journal")
+
+# Record types
+RUN = "run"
+DISCOVERED = "discovered"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+class RunJournal:
+    """
+    Append-only journal of one scrape run.
+
+    Records are JSON lines with a "type" of run (a run or resume started),
+    discovered (the URLs to scrape), completed (a URL that needs no more work,
+    with its article if one was extracted) or failed (a URL to retry on resume).
+    """
+
+    def __init__(self, path: str, resume: bool = False):
+        """
+        Open a journal.
+
+        Args:
+            path: Journal file
+            resume: Load and append to an existing journal instead of starting
+                a new one
+
+        Raises:
+            FileNotFoundError: If resuming and the journal does not exist
+        """
+        self.path = Path(path)
+        self.source: Optional[str] = None
+        # URLs the run set out to scrape, in listing order (None = not yet discovered)
+        self.discovered: Optional[List[str]] = None
+        # Completed URLs with their article as JSON (None = nothing to output, e.g. unchanged)
+        self.completed: Dict[str, Optional[dict]] = {}
+        self.failed: Dict[str, str] = {}
+        self.resumed = resume
+
+        if resume:
+            self._load()
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: Optional[IO[str]] = open(self.path, "a" if resume else "w", encoding="utf-8")
+
+    def _load(self) -> None:
+        """Read an existing journal, dropping a record cut off by a crash."""
+        data = self.path.read_bytes()
+        end = data.rfind(b"\n") + 1
+        if end < len(data):
+            # The process died mid-write; drop the partial line so appends stay valid
+            logger.warning(
+                "Dropping incomplete last journal record",
+                extra={"path": str(self.path), "bytes": len(data) - end},
+            )
+            with open(self.path, "r+b") as f:
+                f.truncate(end)
+
+        for line in data[:end].decode("utf-8").splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            kind = record.get("type")
+            if kind == RUN:
+                self.source = self.source or record.get("source")
+            elif kind == DISCOVERED:
+                self.discovered = record["urls"]
+            elif kind == COMPLETED:
+                self.completed[record["url"]] = record.get("article")
+                self.failed.pop(record["url"], None)
+            elif kind == FAILED:
+                self.failed[record["url"]] = record.get("reason", "failed")
+
+        logger.info(
+            "Run journal loaded",
+            extra={
+                "path": str(self.path),
+                "discovered": len(self.discovered or ()),
+                "completed": len(self.completed),
+                "failed": len(self.failed),
+            },
+        )
+
+    def _append(self, record: Dict) -> None:
+        """Write one record and flush it to the OS."""
+        if self._file is None:
+            raise RuntimeError("Run journal is closed")
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+
+    def record_run(self, source: str) -> None:
+        """
+        Record the start (or resumption) of a run.
+
+        Args:
+            source: Source being scraped
+
+        Raises:
+            ValueError: If a resumed journal belongs to another source
+        """
+        if self.source is not None and self.source != source:
+            raise ValueError(f"Journal {self.path} is for '{self.source}', not '{source}'")
+        self.source = source
+        self._append(
+            {
+                "type": RUN,
+                "source": source,
+                "resumed": self.resumed,
+                "at": datetime.now(timezone.utc).isoformat(),
+            }
+        )
+
+    def record_discovered(self, urls: Iterable[str]) -> None:
+        """Record the article URLs the run will scrape."""
+        self.discovered = list(urls)
+        self._append({"type": DISCOVERED, "urls": self.discovered})
+
+    def record_completed(self, url: str, article: Optional[ScrapedArticle]) -> None:
+        """
+        Record a URL that needs no more work.
+
+        Args:
+            url: Article URL
+            article: Scraped article, or None if the URL was done without one
+                (unchanged since the last run, not HTML, too large)
+        """
+        data = article.model_dump(mode="json") if article is not None else None
+        self.completed[url] = data
+        self.failed.pop(url, None)
+        self._append({"type": COMPLETED, "url": url, "article": data})
+
+    def record_failed(self, url: str, reason: str) -> None:
+        """Record a URL that failed and should be retried on resume."""
+        self.failed[url] = reason
+        self._append({"type": FAILED, "url": url, "reason": reason})
+
+    def pending(self, urls: Iterable[str]) -> List[str]:
+        """Get the URLs not yet completed, keeping their order."""
+        return [url for url in urls if url not in self.completed]
+
+    def articles(self) -> Dict[str, ScrapedArticle]:
+        """Get the articles completed so far by URL, in the order they were recorded."""
+        return {
+            url: ScrapedArticle.model_validate(data) for url, data in self.completed.items() if data
+        }
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
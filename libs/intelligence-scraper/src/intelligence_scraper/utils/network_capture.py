@@ -0,0 +1,258 @@
+"""
+Network-capture extraction for JavaScript-rendered pages
+
+Instead of rendering a page and scraping its visible text, listens to the
+XHR/fetch responses the page makes and reads the article from the JSON
+payload the site uses to hydrate it. The page can be closed as soon as that
+payload arrives, and navigation chrome never ends up in the article text.
+"""
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import Any, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+import lxml.html
+from lxml import etree
+from playwright.async_api import Page, Response
+
+from intelligence_scraper.utils.logger import get_logger
+from intelligence_scraper.utils.page_load import PageLoadStats, ResourcePolicy, watch_page
+
+logger = get_logger("intelligence.scraper.network_capture")
+
+CAPTURE_RESOURCE_TYPES = frozenset({"xhr", "fetch"})
+# How long to wait for the payload once navigation has committed
+DEFAULT_CAPTURE_WAIT_MS = 5000.0
+
+# Elements whose text starts a new paragraph when an HTML body is flattened
+_BLOCK_TAGS = frozenset(
+    {
+        "p",
+        "div",
+        "section",
+        "article",
+        "li",
+        "h1",
+        "h2",
+        "h3",
+        "h4",
+        "h5",
+        "h6",
+        "blockquote",
+        "pre",
+    }
+)
+
+
+@dataclass(frozen=True)
+class PayloadCapture:
+    """
+    Where a site's article JSON is and which fields hold the article.
+
+    Field paths are dot-separated keys and list indexes into the JSON
+    payload, e.g. "data.article.title" or "items.0.body".
+    """
+
+    url_pattern: str
+    title_path: str = "title"
+    content_path: str = "body"
+    date_path: Optional[str] = "date"
+    # Treat the content field as HTML and flatten it to text
+    content_is_html: bool = True
+    # Milliseconds to wait for the payload after navigation commits
+    wait_ms: float = DEFAULT_CAPTURE_WAIT_MS
+
+    def __post_init__(self) -> None:
+        if self.wait_ms <= 0:
+            raise ValueError("wait_ms must be positive")
+
+    def matches(self, url: str) -> bool:
+        """Check whether a response URL may carry the article payload."""
+        return re.search(self.url_pattern, url) is not None
+
+
+@dataclass
+class CapturedArticle:
+    """Article fields read from a captured payload."""
+
+    title: Optional[str]
+    content: str
+    publish_date: Optional[str]
+    payload_url: str
+
+
+def json_path(data: Any, path: Optional[str]) -> Any:
+    """
+    Resolve a dot-separated path in decoded JSON.
+
+    Args:
+        data: Decoded JSON value
+        path: Keys and list indexes separated by dots (None = no value)
+
+    Returns:
+        Any: The value, or None if any step is missing
+    """
+    if not path:
+        return None
+    for key in path.split("."):
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and key.lstrip("-").isdigit():
+            index = int(key)
+            data = data[index] if -len(data) <= index < len(data) else None
+        else:
+            return None
+        if data is None:
+            return None
+    return data
+
+
+def html_to_text(fragment: str) -> str:
+    """
+    Flatten an HTML fragment to text, one paragraph per block element.
+
+    Args:
+        fragment: HTML of the article body
+
+    Returns:
+        str: Text with paragraphs separated by blank lines
+    """
+    try:
+        root = lxml.html.fragment_fromstring(fragment, create_parent="div")
+    except (etree.ParserError, ValueError):
+        return fragment
+    etree.strip_elements(root, "script", "style", with_tail=False)
+    etree.strip_tags(root, etree.Comment)
+
+    paragraphs: List[str] = []
+    current: List[str] = []
+
+    def _flush() -> None:
+        if current:
+            paragraphs.append("".join(current))
+            current.clear()
+
+    for event, element in etree.iterwalk(root, events=("start", "end")):
+        if element.tag in _BLOCK_TAGS:
+            _flush()
+        if event == "start" and element.tag == "br":
+            current.append(" ")
+        if event == "start" and element.text:
+            current.append(element.text)
+        elif event == "end" and element.tail and element is not root:
+            current.append(element.tail)
+    _flush()
+
+    return "\n\n".join(" ".join(p.split()) for p in paragraphs if p.strip())
+
+
+def article_from_payload(
+    payload: Any, capture: PayloadCapture, payload_url: str
+) -> Optional[CapturedArticle]:
+    """
+    Read article fields from a decoded JSON payload.
+
+    Args:
+        payload: Decoded JSON
+        capture: Field paths
+        payload_url: URL the payload was fetched from
+
+    Returns:
+        Optional[CapturedArticle]: The article, or None if the payload has no body text
+    """
+    content = json_path(payload, capture.content_path)
+    if not isinstance(content, str) or not content.strip():
+        return None
+    if capture.content_is_html:
+        content = html_to_text(content)
+
+    title = json_path(payload, capture.title_path)
+    date = json_path(payload, capture.date_path)
+    return CapturedArticle(
+        title=title.strip() if isinstance(title, str) and title.strip() else None,
+        content=content,
+        publish_date=str(date) if date is not None else None,
+        payload_url=payload_url,
+    )
+
+
+async def capture_article(
+    page: Page,
+    url: str,
+    capture: PayloadCapture,
+    policy: ResourcePolicy,
+    timeout_ms: float,
+) -> Tuple[Optional[CapturedArticle], PageLoadStats]:
+    """
+    Navigate to a page and wait for its article payload.
+
+    Navigation only waits for the response to commit; the function returns
+    as soon as a matching XHR/fetch response yields an article, so the caller
+    can close the page without waiting for the rest of it to load. Sites that
+    never send a matching payload cost at most `capture.wait_ms` after commit.
+
+    Args:
+        page: Fresh Playwright page
+        url: Article URL
+        capture: Which responses carry the article, where its fields are and
+            how long to wait for them
+        policy: Resource blocking policy (its wait settings are not used);
+            requests matching the capture's URL pattern are never blocked
+        timeout_ms: Navigation timeout in milliseconds
+
+    Returns:
+        Tuple[Optional[CapturedArticle], PageLoadStats]: The article (None if
+            no payload arrived in time) and what the load cost
+
+    Raises:
+        playwright.async_api.TimeoutError: If navigation times out
+    """
+    stats = PageLoadStats()
+    found: asyncio.Future = asyncio.get_running_loop().create_future()
+    inspecting: Set[asyncio.Task] = set()
+
+    async def _inspect(response: Response) -> None:
+        if found.done():
+            return
+        try:
+            payload = await response.json()
+        except Exception:
+            return
+        article = article_from_payload(payload, capture, response.url)
+        if article is not None and not found.done():
+            found.set_result(article)
+
+    def _on_response(response: Response) -> None:
+        if (
+            not found.done()
+            and response.request.resource_type in CAPTURE_RESOURCE_TYPES
+            and response.ok
+            and capture.matches(response.url)
+        ):
+            task = asyncio.ensure_future(_inspect(response))
+            inspecting.add(task)
+            task.add_done_callback(inspecting.discard)
+
+    # The article API is often on another site, which third-party blocking would abort
+    await watch_page(page, policy, stats, urlsplit(url).hostname or "", keep=capture.matches)
+    page.on("response", _on_response)
+
+    start = time.perf_counter()
+    await page.goto(url, timeout=timeout_ms, wait_until="commit")
+    try:
+        article = await asyncio.wait_for(found, capture.wait_ms / 1000)
+    except asyncio.TimeoutError:
+        article = None
+        logger.info(
+            "No article payload captured",
+            extra={"url": url, "url_pattern": capture.url_pattern, "wait_ms": capture.wait_ms},
+        )
+    finally:
+        for task in list(inspecting):
+            task.cancel()
+    stats.load_ms = (time.perf_counter() - start) * 1000
+
+    return article, stats
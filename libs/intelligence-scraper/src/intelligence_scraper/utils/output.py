@@ -0,0 +1,170 @@
+"""
+Article output writers for the scraper CLI
+
+Writes scraped articles as a JSON array or as streaming NDJSON.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from types import TracebackType
+from typing import IO, List, Optional, Type
+
+from intelligence_scraper.models import ScrapedArticle
+
+OUTPUT_FORMATS = ("json", "ndjson")
+STDOUT = "-"
+
+
+class ArticleWriter:
+    """
+    Base writer for scraped articles.
+
+    Writers are used as context managers; `output_file` of "-" means stdout.
+    """
+
+    def __init__(self, output_file: str):
+        """
+        Initialize the writer.
+
+        Args:
+            output_file: Output path, or "-" for stdout
+        """
+        self.output_file = output_file
+        self.count = 0
+        self._stream: Optional[IO[str]] = None
+
+    @property
+    def to_stdout(self) -> bool:
+        """Whether articles are written to stdout."""
+        return self.output_file == STDOUT
+
+    def __enter__(self) -> "ArticleWriter":
+        if self.to_stdout:
+            self._stream = sys.stdout
+        else:
+            output_path = Path(self.output_file)
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            self._stream = open(output_path, "w", encoding="utf-8")
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def write(self, article: ScrapedArticle) -> None:
+        """
+        Write one article.
+
+        Args:
+            article: Scraped article
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Finish the output and close the file (stdout is left open)."""
+        if self._stream is not None:
+            self._stream.flush()
+            if not self.to_stdout:
+                self._stream.close()
+            self._stream = None
+
+
+class JsonArrayWriter(ArticleWriter):
+    """
+    Writes all articles as one pretty-printed JSON array when closed.
+
+    Nothing is written if the `with` block raises. Files are written to a
+    temporary file next to the target and moved into place, so a failed run
+    leaves any previous output untouched.
+    """
+
+    def __init__(self, output_file: str):
+        super().__init__(output_file)
+        self._articles: List[dict] = []
+        self._open = False
+
+    def __enter__(self) -> "ArticleWriter":
+        if self.to_stdout:
+            self._stream = sys.stdout
+        self._open = True
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is not None:
+            self._articles = []
+            self._open = False
+        self.close()
+
+    def write(self, article: ScrapedArticle) -> None:
+        """Buffer an article until the array is written on close."""
+        self._articles.append(article.model_dump(mode="json"))
+        self.count += 1
+
+    def close(self) -> None:
+        """Write the JSON array (replacing the file in one step) and close."""
+        if self._open:
+            self._open = False
+            if self._stream is not None:
+                json.dump(self._articles, self._stream, indent=2, ensure_ascii=False, default=str)
+            else:
+                self._write_file()
+            self._articles = []
+        super().close()
+
+    def _write_file(self) -> None:
+        """Write the buffered array to a temporary file and move it over the output."""
+        output_path = Path(self.output_file)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._articles, f, indent=2, ensure_ascii=False, default=str)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+
+class NdjsonWriter(ArticleWriter):
+    """Writes each article as one JSON line, flushed immediately."""
+
+    def write(self, article: ScrapedArticle) -> None:
+        """Write and flush an article as a single JSON line."""
+        if self._stream is None:
+            raise RuntimeError("Article writer is not open")
+        line = json.dumps(article.model_dump(mode="json"), ensure_ascii=False, default=str)
+        self._stream.write(line + "\n")
+        self._stream.flush()
+        self.count += 1
+
+
+def create_writer(output_file: str, output_format: str = "json") -> ArticleWriter:
+    """
+    Create an article writer for an output format.
+
+    Args:
+        output_file: Output path, or "-" for stdout
+        output_format: "json" (single array) or "ndjson" (one article per line)
+
+    Returns:
+        ArticleWriter: Writer to use as a context manager
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if output_format == "json":
+        return JsonArrayWriter(output_file)
+    if output_format == "ndjson":
+        return NdjsonWriter(output_file)
+    raise ValueError(f"Unsupported output format: {output_format}")
@@ -0,0 +1,192 @@
+"""
+Playwright page-load policy
+
+Blocks heavy resource types and third-party hosts during navigation, waits only as
+long as needed for the article, and measures what each page load cost.
+"""
+
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, FrozenSet, Literal, Optional, get_args
+from urllib.parse import urlsplit
+
+from playwright.async_api import Page, Request, Response, Route
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.page_load")
+
+WaitUntil = Literal["commit", "domcontentloaded", "load", "networkidle"]
+WAIT_MODES = get_args(WaitUntil)
+DEFAULT_BLOCKED_TYPES = frozenset({"image", "media", "font"})
+
+
+def _site(host: str) -> str:
+    """Approximate the registrable domain of a host (e.g. 'nvidia.com')."""
+    labels = host.lower().rstrip(".").split(".")
+    return ".".join(labels[-2:])
+
+
+@dataclass(frozen=True)
+class ResourcePolicy:
+    """
+    How Playwright loads article pages.
+
+    Stylesheets are not blocked by default because `inner_text` honours CSS
+    visibility; without them hidden menus and dialogs leak into the text.
+    """
+
+    blocked_resource_types: FrozenSet[str] = DEFAULT_BLOCKED_TYPES
+    block_third_party: bool = True
+    allowed_hosts: FrozenSet[str] = frozenset()
+    wait_until: WaitUntil = "domcontentloaded"
+    ready_selector: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.wait_until not in WAIT_MODES:
+            raise ValueError(f"wait_until must be one of {', '.join(WAIT_MODES)}")
+
+    @classmethod
+    def full(cls) -> "ResourcePolicy":
+        """Load every resource and wait for network idle (the original behaviour)."""
+        return cls(
+            blocked_resource_types=frozenset(),
+            block_third_party=False,
+            wait_until="networkidle",
+        )
+
+    @property
+    def intercepts(self) -> bool:
+        """Whether requests need to be routed through the policy at all."""
+        return bool(self.blocked_resource_types) or self.block_third_party
+
+    def should_block(self, resource_type: str, url: str, page_host: str) -> bool:
+        """
+        Decide whether a request made by the page should be aborted.
+
+        Args:
+            resource_type: Playwright resource type (e.g. "image", "script")
+            url: Request URL
+            page_host: Host of the page being loaded
+
+        Returns:
+            bool: True if the request should be aborted
+        """
+        # Never block the navigation itself
+        if resource_type == "document":
+            return False
+        if resource_type in self.blocked_resource_types:
+            return True
+        if self.block_third_party:
+            host = urlsplit(url).hostname or ""
+            if host in self.allowed_hosts:
+                return False
+            return _site(host) != _site(page_host)
+        return False
+
+
+@dataclass
+class PageLoadStats:
+    """Requests, bytes and time spent loading one page."""
+
+    requests: int = 0
+    blocked: int = 0
+    blocked_by_type: Dict[str, int] = field(default_factory=dict)
+    bytes_downloaded: int = 0
+    load_ms: float = 0.0
+    ready_timed_out: bool = False
+
+    def to_dict(self) -> Dict:
+        """Serialize the stats for article metadata."""
+        data = asdict(self)
+        data["load_ms"] = round(self.load_ms, 1)
+        return data
+
+
+async def watch_page(
+    page: Page,
+    policy: ResourcePolicy,
+    stats: PageLoadStats,
+    page_host: str,
+    keep: Optional[Callable[[str], bool]] = None,
+) -> None:
+    """
+    Apply a resource policy to a page and count its requests and bytes.
+
+    Args:
+        page: Fresh Playwright page, before navigation
+        policy: Blocking policy
+        stats: Counters to update as the page loads
+        page_host: Host of the page being loaded
+        keep: Predicate on request URLs that must never be blocked (e.g. a
+            cross-site API serving the article)
+    """
+
+    async def _route(route: Route) -> None:
+        request = route.request
+        if (keep is None or not keep(request.url)) and policy.should_block(
+            request.resource_type, request.url, page_host
+        ):
+            stats.blocked += 1
+            stats.blocked_by_type[request.resource_type] = (
+                stats.blocked_by_type.get(request.resource_type, 0) + 1
+            )
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _on_request(request: Request) -> None:
+        stats.requests += 1
+
+    def _on_response(response: Response) -> None:
+        # Content-Length is an approximation: chunked responses report nothing
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            stats.bytes_downloaded += int(length)
+
+    if policy.intercepts:
+        await page.route("**/*", _route)
+    page.on("request", _on_request)
+    page.on("response", _on_response)
+
+
+async def load_page(
+    page: Page, url: str, policy: ResourcePolicy, timeout_ms: float
+) -> PageLoadStats:
+    """
+    Navigate a page under a resource policy.
+
+    If the readiness selector does not appear in time, the page is used as it
+    stands after DOMContentLoaded (or the policy's wait_until) rather than
+    failing the load; `ready_timed_out` records that it happened.
+
+    Args:
+        page: Fresh Playwright page
+        url: Article URL
+        policy: Blocking and wait policy
+        timeout_ms: Navigation and readiness timeout in milliseconds
+
+    Returns:
+        PageLoadStats: What the load cost, including blocked requests
+
+    Raises:
+        playwright.async_api.TimeoutError: If navigation times out
+    """
+    stats = PageLoadStats()
+    await watch_page(page, policy, stats, urlsplit(url).hostname or "")
+
+    start = time.perf_counter()
+    await page.goto(url, timeout=timeout_ms, wait_until=policy.wait_until)
+    if policy.ready_selector:
+        try:
+            await page.wait_for_selector(policy.ready_selector, timeout=timeout_ms)
+        except PlaywrightTimeout:
+            stats.ready_timed_out = True
+            logger.warning(
+                "Ready selector not found, extracting the page as loaded",
+                extra={"url": url, "selector": policy.ready_selector},
+            )
+    stats.load_ms = (time.perf_counter() - start) * 1000
+
+    return stats
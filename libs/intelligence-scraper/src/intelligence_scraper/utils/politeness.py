@@ -0,0 +1,341 @@
+"""
+Per-host politeness scheduler
+
+Paces requests to each host with a token bucket, honours robots.txt
+Crawl-delay / Request-rate, and slows down adaptively when a host answers
+429 or 503 (including any Retry-After it sends).
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+from urllib.robotparser import RobotFileParser
+
+import httpx
+
+from intelligence_scraper.utils.logger import get_logger
+from intelligence_scraper.utils.telemetry import QUEUE, record_stage
+
+logger = get_logger("intelligence.scraper.politeness")
+
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP-date
+        now: Current Unix time (default: time.time())
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at - (now if now is not None else time.time()))
+
+
+@dataclass
+class HostStats:
+    """Queue wait and throttling counters for one host."""
+
+    requests: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+    throttled: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the counters, with the mean queue wait in milliseconds."""
+        return {
+            "requests": self.requests,
+            "mean_wait_ms": (
+                round(1000 * self.total_wait / self.requests, 1) if self.requests else 0.0
+            ),
+            "max_wait_ms": round(1000 * self.max_wait, 1),
+            "throttled": self.throttled,
+        }
+
+
+@dataclass
+class HostState:
+    """Pacing state of one host."""
+
+    rate: Optional[float]
+    burst: int
+    tokens: float
+    updated: float
+    crawl_delay: float = 0.0
+    last_start: float = 0.0
+    blocked_until: float = 0.0
+    robots_loaded: bool = False
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    robots_lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    stats: HostStats = field(default_factory=HostStats)
+
+
+class PolitenessScheduler:
+    """
+    Per-host request pacing.
+
+    Each host gets a token bucket of `burst` tokens refilled at
+    `requests_per_second` (None = no fixed limit). Requests to the same host
+    queue in FIFO order; other hosts are unaffected. On 429/503 the host's rate
+    is halved (or set to `throttled_rate` if it had no limit) and Retry-After is
+    honoured; each successful response then raises the rate by
+    `recovery_factor` until it is back at the configured limit.
+    """
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: int = 1,
+        respect_robots: bool = False,
+        throttled_rate: float = 2.0,
+        min_rate: float = 0.05,
+        recovery_factor: float = 1.05,
+        max_retry_after: float = 300.0,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            requests_per_second: Steady request rate allowed per host (None = unlimited)
+            burst: Requests that may start back to back before pacing applies
+            respect_robots: Fetch each host's robots.txt and honour its
+                Crawl-delay / Request-rate
+            throttled_rate: Rate an unlimited host drops to on its first 429/503
+            min_rate: Lowest rate adaptive slow-down can reach
+            recovery_factor: Rate multiplier applied after each successful response
+            max_retry_after: Upper bound on a Retry-After delay, in seconds
+
+        Raises:
+            ValueError: If a rate or burst is not positive
+        """
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+
+        self.requests_per_second = requests_per_second
+        self.burst = burst
+        self.respect_robots = respect_robots
+        self.throttled_rate = throttled_rate
+        self.min_rate = min_rate
+        self.recovery_factor = recovery_factor
+        self.max_retry_after = max_retry_after
+        self.hosts: Dict[str, HostState] = {}
+
+    @staticmethod
+    def host_key(url: Any) -> str:
+        """Get the scheme://host[:port] origin a URL is paced under."""
+        parts = urlsplit(str(url))
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def host(self, url: Any) -> HostState:
+        """Get (or create) the pacing state for a URL's host."""
+        key = self.host_key(url)
+        state = self.hosts.get(key)
+        if state is None:
+            state = self.hosts[key] = HostState(
+                rate=self.requests_per_second,
+                burst=self.burst,
+                tokens=float(self.burst),
+                updated=time.monotonic(),
+            )
+        return state
+
+    def set_crawl_delay(self, url: Any, delay: float) -> None:
+        """
+        Require at least `delay` seconds between request starts to a host.
+
+        Args:
+            url: Any URL on the host
+            delay: Minimum interval in seconds
+        """
+        state = self.host(url)
+        state.crawl_delay = max(0.0, delay)
+        logger.info(
+            "Using robots.txt crawl delay",
+            extra={"host": self.host_key(url), "crawl_delay": state.crawl_delay},
+        )
+
+    async def acquire(self, url: Any) -> float:
+        """
+        Wait until a request to the URL's host may start.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            float: Seconds spent queued
+        """
+        state = self.host(url)
+        queued = time.monotonic()
+
+        # asyncio.Lock wakes waiters in FIFO order, so requests keep their queue position
+        async with state.lock:
+            while True:
+                now = time.monotonic()
+                delay = max(state.blocked_until, state.last_start + state.crawl_delay) - now
+
+                if state.rate is not None:
+                    state.tokens = min(
+                        state.burst, state.tokens + (now - state.updated) * state.rate
+                    )
+                    state.updated = now
+                    if state.tokens < 1:
+                        delay = max(delay, (1 - state.tokens) / state.rate)
+
+                if delay <= 0:
+                    break
+                await asyncio.sleep(delay)
+
+            if state.rate is not None:
+                state.tokens -= 1
+            state.last_start = time.monotonic()
+
+        waited = state.last_start - queued
+        state.stats.requests += 1
+        state.stats.total_wait += waited
+        state.stats.max_wait = max(state.stats.max_wait, waited)
+        return waited
+
+    def record_response(self, url: Any, status_code: int, retry_after: Optional[str]) -> None:
+        """
+        Adapt a host's pace to its response.
+
+        Args:
+            url: Request URL
+            status_code: Response status code
+            retry_after: Retry-After header value, if any
+        """
+        state = self.host(url)
+
+        if status_code in THROTTLE_STATUSES:
+            state.stats.throttled += 1
+            state.rate = max(
+                self.min_rate,
+                state.rate / 2 if state.rate is not None else self.throttled_rate,
+            )
+            state.tokens = min(state.tokens, 0.0)
+
+            wait = parse_retry_after(retry_after)
+            if wait is not None:
+                state.blocked_until = max(
+                    state.blocked_until, time.monotonic() + min(wait, self.max_retry_after)
+                )
+
+            logger.warning(
+                f"Host throttled request with {status_code}, slowing down",
+                extra={
+                    "host": self.host_key(url),
+                    "rate": state.rate,
+                    "retry_after": retry_after,
+                },
+            )
+            return
+
+        if state.rate is None or status_code >= 500:
+            return
+
+        state.rate *= self.recovery_factor
+        if self.requests_per_second is not None:
+            state.rate = min(state.rate, self.requests_per_second)
+        elif state.rate >= self.throttled_rate * 10:
+            # Far above the throttled pace again: lift the limit entirely
+            state.rate = None
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-host queue wait and throttling counters.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Counters keyed by host origin
+        """
+        return {key: state.stats.to_dict() for key, state in self.hosts.items()}
+
+
+class PoliteTransport(httpx.AsyncBaseTransport):
+    """Transport wrapper that paces every request through a PolitenessScheduler."""
+
+    def __init__(self, scheduler: PolitenessScheduler, transport: httpx.AsyncBaseTransport):
+        """
+        Initialize the transport.
+
+        Args:
+            scheduler: Scheduler deciding when each request may start
+            transport: Transport that sends the requests
+        """
+        self.scheduler = scheduler
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Wait for the host's turn, send the request and report the outcome."""
+        if self.scheduler.respect_robots:
+            await self._load_robots(request)
+
+        record_stage(QUEUE, await self.scheduler.acquire(request.url))
+        response = await self._transport.handle_async_request(request)
+        self.scheduler.record_response(
+            request.url, response.status_code, response.headers.get("retry-after")
+        )
+        return response
+
+    async def _load_robots(self, request: httpx.Request) -> None:
+        """Fetch a host's robots.txt once and apply its crawl delay."""
+        state = self.scheduler.host(request.url)
+        if state.robots_loaded:
+            return
+
+        async with state.robots_lock:
+            if state.robots_loaded:
+                return
+            state.robots_loaded = True
+
+            origin = self.scheduler.host_key(request.url)
+            user_agent = request.headers.get("user-agent", "*")
+            robots_request = httpx.Request(
+                "GET", f"{origin}/robots.txt", headers={"user-agent": user_agent}
+            )
+            try:
+                response = await self._transport.handle_async_request(robots_request)
+                try:
+                    body = await response.aread()
+                finally:
+                    await response.aclose()
+            except Exception as e:
+                logger.warning(
+                    f"Failed to fetch robots.txt: {e}", extra={"host": origin, "error": str(e)}
+                )
+                return
+
+            if response.status_code != 200:
+                return
+
+            parser = RobotFileParser()
+            parser.parse(body.decode("utf-8", errors="replace").splitlines())
+
+            # typeshed declares crawl_delay as str, though the parser stores a number
+            crawl_delay = parser.crawl_delay(user_agent)
+            delay = float(crawl_delay) if crawl_delay is not None else 0.0
+            request_rate = parser.request_rate(user_agent)
+            if request_rate is not None and request_rate.requests:
+                delay = max(delay, request_rate.seconds / request_rate.requests)
+            if delay:
+                self.scheduler.set_crawl_delay(request.url, delay)
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport."""
+        await self._transport.aclose()
@@ -0,0 +1,271 @@
+"""
+Retry policy and per-host circuit breaker
+
+Classifies scraping failures, decides whether and when to retry them, and
+stops sending requests to a host whose recent requests mostly failed.
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.retry")
+
+# Failure kinds
+TIMEOUT = "timeout"
+CONNECT = "connect"
+SERVER_ERROR = "server_error"
+THROTTLED = "throttled"
+CLIENT_ERROR = "client_error"
+EXTRACTION = "extraction"
+OTHER = "other"
+
+# Failures that say the host is unhealthy rather than the page being bad
+HOST_FAILURES = frozenset({TIMEOUT, CONNECT, SERVER_ERROR, THROTTLED})
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class ExtractionError(Exception):
+    """Raised when a page was fetched but no extraction method produced an article."""
+
+
+class NavigationError(Exception):
+    """Raised when the browser could not reach a page (DNS failure, refused or reset connection)."""
+
+
+def classify_error(error: BaseException) -> str:
+    """
+    Classify a scraping failure.
+
+    Args:
+        error: Exception raised while scraping an article
+
+    Returns:
+        str: One of TIMEOUT, CONNECT, SERVER_ERROR, THROTTLED, CLIENT_ERROR,
+            EXTRACTION or OTHER
+    """
+    if isinstance(error, (httpx.TimeoutException, asyncio.TimeoutError)):
+        return TIMEOUT
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        if status in (408, 429):
+            return THROTTLED if status == 429 else TIMEOUT
+        return SERVER_ERROR if status >= 500 else CLIENT_ERROR
+    if isinstance(error, (httpx.TransportError, NavigationError)):
+        return CONNECT
+    if isinstance(error, ExtractionError):
+        return EXTRACTION
+    # Playwright timeouts are not imported here to keep this module browser-free
+    if type(error).__name__ == "TimeoutError":
+        return TIMEOUT
+    return OTHER
+
+
+@dataclass
+class RetryPolicy:
+    """
+    When to retry a failed article and how long to wait first.
+
+    Client errors (4xx other than 408/429) are never retried. Everything else
+    is retried until `max_attempts`, waiting a random delay between 0 and
+    `base_delay * 2 ** (attempt - 1)` (capped at `max_delay`) so workers that
+    failed together do not retry together.
+    """
+
+    max_attempts: int = 2
+    base_delay: float = 2.0
+    max_delay: float = 30.0
+    non_retryable: frozenset = frozenset({CLIENT_ERROR})
+
+    def should_retry(self, kind: str, attempt: int) -> bool:
+        """
+        Decide whether to retry after a failed attempt.
+
+        Args:
+            kind: Failure kind from classify_error()
+            attempt: Number of the attempt that just failed (1-based)
+
+        Returns:
+            bool: True to try again
+        """
+        return attempt < self.max_attempts and kind not in self.non_retryable
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Get the jittered delay before the next attempt.
+
+        Args:
+            attempt: Number of the attempt that just failed (1-based)
+
+        Returns:
+            float: Seconds to wait
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+@dataclass
+class HostCircuit:
+    """Circuit state of one host."""
+
+    state: str = CLOSED
+    outcomes: Deque[bool] = field(default_factory=deque)
+    opened_at: float = 0.0
+    probing: bool = False
+    rejected: int = 0
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    Tracks the last `window` outcomes of each host. Once at least `min_calls`
+    are recorded and the failure share reaches `failure_threshold`, the
+    circuit opens and requests to that host are rejected immediately. After
+    `reset_timeout` seconds it half-opens and lets one probe through: success
+    closes the circuit, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: float = 0.5,
+        window: int = 20,
+        min_calls: int = 5,
+        reset_timeout: float = 30.0,
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_threshold: Failure share (0-1) that opens the circuit
+            window: Number of recent outcomes considered per host
+            min_calls: Outcomes needed before the circuit can open
+            reset_timeout: Seconds an open circuit waits before probing
+
+        Raises:
+            ValueError: If the threshold is not in (0, 1] or window/min_calls are invalid
+        """
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be in (0, 1]")
+        if window < 1 or not 1 <= min_calls <= window:
+            raise ValueError("min_calls must be between 1 and window")
+
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self.hosts: Dict[str, HostCircuit] = {}
+
+    def _circuit(self, url: str) -> HostCircuit:
+        host = urlsplit(url).netloc
+        circuit = self.hosts.get(host)
+        if circuit is None:
+            circuit = self.hosts[host] = HostCircuit(outcomes=deque(maxlen=self.window))
+        return circuit
+
+    def state(self, url: str) -> str:
+        """Get the circuit state (CLOSED, OPEN or HALF_OPEN) of a URL's host."""
+        return self._circuit(url).state
+
+    def allow(self, url: str) -> bool:
+        """
+        Check whether a request to the URL's host may be sent.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            bool: False while the circuit is open or a half-open probe is in flight
+        """
+        circuit = self._circuit(url)
+
+        if circuit.state == OPEN:
+            if time.monotonic() - circuit.opened_at < self.reset_timeout:
+                circuit.rejected += 1
+                return False
+            circuit.state = HALF_OPEN
+            circuit.probing = False
+            logger.info("Circuit half-open, probing host", extra={"url": url})
+
+        if circuit.state == HALF_OPEN:
+            if circuit.probing:
+                circuit.rejected += 1
+                return False
+            circuit.probing = True
+
+        return True
+
+    def record(self, url: str, success: bool) -> None:
+        """
+        Record the outcome of a request to the URL's host.
+
+        Args:
+            url: Request URL
+            success: False if the host failed (timeout, connection error, 5xx, 429)
+        """
+        circuit = self._circuit(url)
+
+        if circuit.state == HALF_OPEN:
+            circuit.probing = False
+            if success:
+                circuit.state = CLOSED
+                circuit.outcomes.clear()
+                logger.info("Circuit closed, host recovered", extra={"url": url})
+            else:
+                self._open(circuit, url)
+            return
+
+        circuit.outcomes.append(success)
+        failures = circuit.outcomes.count(False)
+        if (
+            circuit.state == CLOSED
+            and len(circuit.outcomes) >= self.min_calls
+            and failures / len(circuit.outcomes) >= self.failure_threshold
+        ):
+            self._open(circuit, url)
+
+    def release(self, url: str) -> None:
+        """
+        Give up a request's slot without recording an outcome.
+
+        Call when a request allowed by allow() is abandoned (e.g. cancelled),
+        so a half-open circuit lets another probe through.
+
+        Args:
+            url: Request URL
+        """
+        circuit = self._circuit(url)
+        if circuit.state == HALF_OPEN:
+            circuit.probing = False
+
+    def _open(self, circuit: HostCircuit, url: str) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        logger.warning(
+            "Circuit opened, failing fast for host",
+            extra={"url": url, "reset_timeout": self.reset_timeout},
+        )
+
+    def rejected(self, url: Optional[str] = None) -> int:
+        """
+        Count requests rejected by open circuits.
+
+        Args:
+            url: Only count rejections for this URL's host
+
+        Returns:
+            int: Rejected requests
+        """
+        if url is not None:
+            return self._circuit(url).rejected
+        return sum(circuit.rejected for circuit in self.hosts.values())
@@ -0,0 +1,203 @@
+"""
+Extraction strategy memory
+
+Tracks which extraction method works for each domain and URL pattern so scrapers
+can go straight to the browser for pages that trafilatura cannot handle.
+"""
+
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+from intelligence_scraper.utils.logger import get_logger
+
+logger = get_logger("intelligence.scraper.strategy")
+
+STRATEGY_DB_NAME = "strategy.sqlite3"
+
+TRAFILATURA = "trafilatura"
+PLAYWRIGHT = "playwright"
+
+
+def url_pattern(url: str) -> str:
+    """
+    Reduce a URL to the pattern its extraction statistics are grouped by.
+
+    Keeps the host and first path segment, e.g.
+    "https://nvidianews.nvidia.com/news/some-title" -> "nvidianews.nvidia.com/news/*".
+
+    Args:
+        url: Page URL
+
+    Returns:
+        str: URL pattern
+    """
+    parts = urlsplit(url)
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if len(segments) > 1:
+        return f"{parts.netloc}/{segments[0]}/*"
+    return f"{parts.netloc}/{segments[0] if segments else ''}"
+
+
+@dataclass
+class MethodStats:
+    """Decayed trafilatura success rate for one domain or URL pattern."""
+
+    key: str
+    samples: int = 0
+    trafilatura_rate: float = 1.0
+    browser_runs_since_probe: int = 0
+    updated_at: str = ""
+
+
+class StrategyMemory:
+    """
+    Per-domain and per-URL-pattern memory of which extraction method succeeds.
+
+    The trafilatura success rate is an exponentially weighted average, so a
+    site that changes is picked up after a few observations. Once a pattern
+    has `min_samples` observations and its rate drops below `threshold`, URLs
+    matching it go straight to the browser, except that every
+    `reprobe_every`-th one still tries trafilatura in case the site changed.
+    Domain statistics are used for patterns that have too few samples.
+    """
+
+    def __init__(
+        self,
+        state_dir: Optional[str] = None,
+        min_samples: int = 3,
+        threshold: float = 0.2,
+        reprobe_every: int = 20,
+        decay: float = 0.3,
+    ):
+        """
+        Open the strategy memory.
+
+        Args:
+            state_dir: Directory for the SQLite database (None = in-memory for this run)
+            min_samples: Observations needed before skipping trafilatura
+            threshold: Trafilatura success rate below which it is skipped
+            reprobe_every: Re-try trafilatura after this many browser-only URLs
+            decay: Weight of the newest observation in the success rate
+        """
+        self.min_samples = min_samples
+        self.threshold = threshold
+        self.reprobe_every = reprobe_every
+        self.decay = decay
+
+        if state_dir:
+            directory = Path(state_dir)
+            directory.mkdir(parents=True, exist_ok=True)
+            database = str(directory / STRATEGY_DB_NAME)
+        else:
+            database = ":memory:"
+
+        self._conn = sqlite3.connect(database, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS method_stats (
+                key TEXT PRIMARY KEY,
+                samples INTEGER NOT NULL,
+                trafilatura_rate REAL NOT NULL,
+                browser_runs_since_probe INTEGER NOT NULL,
+                updated_at TEXT NOT NULL
+            )
+            """)
+        self._conn.commit()
+        self._cache: Dict[str, MethodStats] = {
+            row["key"]: MethodStats(**dict(row))
+            for row in self._conn.execute("SELECT * FROM method_stats")
+        }
+
+    def choose_method(self, url: str) -> str:
+        """
+        Pick the first extraction method to try for a URL.
+
+        Args:
+            url: Page URL
+
+        Returns:
+            str: TRAFILATURA or PLAYWRIGHT
+        """
+        stats = self._decisive_stats(url)
+        if stats is None or stats.trafilatura_rate >= self.threshold:
+            return TRAFILATURA
+
+        stats.browser_runs_since_probe += 1
+        if stats.browser_runs_since_probe >= self.reprobe_every:
+            # Periodically give trafilatura another chance in case the site changed
+            stats.browser_runs_since_probe = 0
+            self._save(stats)
+            logger.info("Re-probing trafilatura", extra={"url": url, "pattern": stats.key})
+            return TRAFILATURA
+
+        self._save(stats)
+        return PLAYWRIGHT
+
+    def record(self, url: str, method: str, success: bool) -> None:
+        """
+        Record the outcome of an extraction attempt.
+
+        Only trafilatura outcomes change the decision; a browser success only
+        confirms the browser works, so it is not tracked separately.
+
+        Args:
+            url: Page URL
+            method: TRAFILATURA or PLAYWRIGHT
+            success: Whether the method extracted an article
+        """
+        if method != TRAFILATURA:
+            return
+
+        for key in (url_pattern(url), urlsplit(url).netloc):
+            stats = self._cache.get(key) or MethodStats(key=key)
+            observation = 1.0 if success else 0.0
+            stats.trafilatura_rate = (
+                observation
+                if stats.samples == 0
+                else self.decay * observation + (1 - self.decay) * stats.trafilatura_rate
+            )
+            stats.samples += 1
+            if success:
+                stats.browser_runs_since_probe = 0
+            self._save(stats)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def _decisive_stats(self, url: str) -> Optional[MethodStats]:
+        """Get pattern statistics, or domain statistics if the pattern is too new."""
+        for key in (url_pattern(url), urlsplit(url).netloc):
+            stats = self._cache.get(key)
+            if stats is not None and stats.samples >= self.min_samples:
+                return stats
+        return None
+
+    def _save(self, stats: MethodStats) -> None:
+        """Write statistics to the cache and database."""
+        stats.updated_at = datetime.utcnow().isoformat()
+        self._cache[stats.key] = stats
+        self._conn.execute(
+            """
+            INSERT INTO method_stats (key, samples, trafilatura_rate,
+                                      browser_runs_since_probe, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                samples = excluded.samples,
+                trafilatura_rate = excluded.trafilatura_rate,
+                browser_runs_since_probe = excluded.browser_runs_since_probe,
+                updated_at = excluded.updated_at
+            """,
+            (
+                stats.key,
+                stats.samples,
+                stats.trafilatura_rate,
+                stats.browser_runs_since_probe,
+                stats.updated_at,
+            ),
+        )
+        self._conn.commit()
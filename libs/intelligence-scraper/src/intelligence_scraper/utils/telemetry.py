@@ -0,0 +1,215 @@
+"""
+Per-article stage timing and run summaries
+
+Measures where each article's time and bytes go (connect, queueing, download,
+extraction, cleaning, Playwright, ...) and aggregates them into a run summary
+with percentiles and histograms.
+
+Stage measurements find the article they belong to through a context
+variable, so code deep in the HTTP client or extraction helpers can record
+into it without the telemetry object being passed around.
+"""
+
+import math
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+# Stage names
+QUEUE = "queue"
+CONNECT = "connect"
+WAIT = "wait"
+DOWNLOAD = "download"
+EXTRACT = "extract"
+CLEAN = "clean"
+PLAYWRIGHT = "playwright"
+DEDUP = "dedup"
+
+# Upper bounds (ms) of the histogram buckets in run summaries
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of a list of values (q in 0..100)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def histogram(values: Sequence[float]) -> Dict[str, int]:
+    """
+    Count values into the fixed HISTOGRAM_BUCKETS_MS buckets.
+
+    Args:
+        values: Durations in milliseconds
+
+    Returns:
+        Dict[str, int]: Counts keyed "<=N" per bucket plus ">N" for the overflow bucket
+    """
+    counts = {f"<={bound}": 0 for bound in HISTOGRAM_BUCKETS_MS}
+    overflow = f">{HISTOGRAM_BUCKETS_MS[-1]}"
+    counts[overflow] = 0
+    for value in values:
+        for bound in HISTOGRAM_BUCKETS_MS:
+            if value <= bound:
+                counts[f"<={bound}"] += 1
+                break
+        else:
+            counts[overflow] += 1
+    return counts
+
+
+@dataclass
+class ArticleTelemetry:
+    """Stage timings, byte counts and retries of one article."""
+
+    stages_ms: Dict[str, float] = field(default_factory=lambda: defaultdict(float))
+    bytes: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    retries: int = 0
+    total_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for article metadata."""
+        return {
+            "totalMs": round(self.total_ms, 1),
+            "stagesMs": {stage: round(ms, 1) for stage, ms in self.stages_ms.items()},
+            "bytes": dict(self.bytes),
+            "retries": self.retries,
+        }
+
+
+_current: ContextVar[Optional[ArticleTelemetry]] = ContextVar("article_telemetry", default=None)
+
+
+@contextmanager
+def track_article() -> Iterator[ArticleTelemetry]:
+    """
+    Collect stage measurements of the code run inside the block.
+
+    Each asyncio task has its own context, so concurrent articles do not
+    mix their measurements.
+
+    Yields:
+        ArticleTelemetry: Measurements of the current article
+    """
+    telemetry = ArticleTelemetry()
+    token = _current.set(telemetry)
+    started = time.perf_counter()
+    try:
+        yield telemetry
+    finally:
+        telemetry.total_ms = (time.perf_counter() - started) * 1000
+        _current.reset(token)
+
+
+def record_stage(stage: str, seconds: float) -> None:
+    """Add time spent in a stage to the current article, if one is tracked."""
+    telemetry = _current.get()
+    if telemetry is not None:
+        telemetry.stages_ms[stage] += seconds * 1000
+
+
+def record_bytes(stage: str, count: int) -> None:
+    """Add bytes transferred in a stage to the current article, if one is tracked."""
+    telemetry = _current.get()
+    if telemetry is not None:
+        telemetry.bytes[stage] += count
+
+
+def record_retry() -> None:
+    """Count a retry of the current article, if one is tracked."""
+    telemetry = _current.get()
+    if telemetry is not None:
+        telemetry.retries += 1
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Time the block as a stage of the current article."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(name, time.perf_counter() - started)
+
+
+class RunTelemetry:
+    """Aggregates article telemetry into a run summary."""
+
+    def __init__(self) -> None:
+        self.started = time.monotonic()
+        self.outcomes: Counter = Counter()
+        self.methods: Counter = Counter()
+        self.retries = 0
+        self._stages: Dict[str, List[float]] = defaultdict(list)
+        self._bytes: Dict[str, List[int]] = defaultdict(list)
+        self._totals: List[float] = []
+
+    def record(
+        self, telemetry: ArticleTelemetry, outcome: str, method: Optional[str] = None
+    ) -> None:
+        """
+        Add one article to the run.
+
+        Args:
+            telemetry: The article's measurements
+            outcome: "scraped", "unchanged", "failed" or a skip reason
+            method: Extraction method of a scraped article
+        """
+        self.outcomes[outcome] += 1
+        if method:
+            self.methods[method] += 1
+        self.retries += telemetry.retries
+        for name, ms in telemetry.stages_ms.items():
+            self._stages[name].append(ms)
+        for name, count in telemetry.bytes.items():
+            self._bytes[name].append(count)
+        self._totals.append(telemetry.total_ms)
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Build the run summary.
+
+        Returns:
+            Dict[str, Any]: Outcome, method and retry counts, article wall time
+                percentiles, count, p50, p95, mean, max and a histogram for
+                each stage, and byte totals and percentiles per stage
+        """
+        stages = {}
+        for name, values in sorted(self._stages.items()):
+            stages[name] = {
+                "count": len(values),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+                "mean_ms": round(sum(values) / len(values), 1),
+                "max_ms": round(max(values), 1),
+                "histogram": histogram(values),
+            }
+
+        byte_counts = {
+            name: {
+                "total": sum(values),
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+            }
+            for name, values in sorted(self._bytes.items())
+        }
+
+        return {
+            "elapsed_s": round(time.monotonic() - self.started, 2),
+            "articles": sum(self.outcomes.values()),
+            "outcomes": dict(self.outcomes),
+            "methods": dict(self.methods),
+            "retries": self.retries,
+            "article_ms": {
+                "p50": round(percentile(self._totals, 50), 1),
+                "p95": round(percentile(self._totals, 95), 1),
+            },
+            "stages": stages,
+            "bytes": byte_counts,
+        }
@@ -0,0 +1,78 @@
+"""
+Contract tests for scraper CLI output formats
+
+Verifies the JSON array and NDJSON output written by the article writers.
+"""
+
+import json
+
+import pytest
+
+from intelligence_scraper.models import ScrapedArticle
+from intelligence_scraper.utils.output import create_writer
+
+
+def make_article(index: int) -> ScrapedArticle:
+    return ScrapedArticle(
+        url=f"https://example.com/article{index}",
+        title=f"Article {index}",
+        content="This is test content.",
+        publishDate="2024-01-15T10:00:00Z",
+        source="Example News",
+    )
+
+
+class TestOutputFormats:
+    """Contract tests for json and ndjson output."""
+
+    def test_json_output_is_single_array(self, tmp_path):
+        """Test that json output is one array of articles."""
+        output = tmp_path / "articles.json"
+
+        with create_writer(str(output), "json") as writer:
+            writer.write(make_article(1))
+            writer.write(make_article(2))
+
+        data = json.loads(output.read_text(encoding="utf-8"))
+        assert [item["title"] for item in data] == ["Article 1", "Article 2"]
+
+    def test_ndjson_output_is_flushed_per_article(self, tmp_path):
+        """Test that each ndjson article is readable before the writer closes."""
+        output = tmp_path / "articles.ndjson"
+
+        with create_writer(str(output), "ndjson") as writer:
+            writer.write(make_article(1))
+            lines = output.read_text(encoding="utf-8").splitlines()
+            assert len(lines) == 1
+            assert json.loads(lines[0])["url"] == "https://example.com/article1"
+
+            writer.write(make_article(2))
+
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["title"] for line in lines] == ["Article 1", "Article 2"]
+
+    def test_ndjson_to_stdout(self, capsys):
+        """Test that '-' writes ndjson to stdout."""
+        with create_writer("-", "ndjson") as writer:
+            writer.write(make_article(1))
+
+        assert json.loads(capsys.readouterr().out)["title"] == "Article 1"
+
+    def test_unsupported_format_rejected(self):
+        """Test that unknown formats are rejected."""
+        with pytest.raises(ValueError):
+            create_writer("out.csv", "csv")
+
+    def test_json_output_kept_when_run_fails(self, tmp_path):
+        """Test that a failed run leaves the previous json output untouched."""
+        output = tmp_path / "articles.json"
+        output.write_text('[{"title": "Previous"}]', encoding="utf-8")
+
+        with pytest.raises(RuntimeError):
+            with create_writer(str(output), "json") as writer:
+                writer.write(make_article(1))
+                assert json.loads(output.read_text(encoding="utf-8")) == [{"title": "Previous"}]
+                raise RuntimeError("scrape failed")
+
+        assert json.loads(output.read_text(encoding="utf-8")) == [{"title": "Previous"}]
+        assert [p.name for p in tmp_path.iterdir()] == ["articles.json"]
@@ -0,0 +1,93 @@
+"""
+Shared fixtures for scraper integration tests
+
+Provides a local keep-alive HTTP server serving configurable pages.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+
+import pytest
+
+ARTICLE_HTML = """<!DOCTYPE html>
+<html>
+<head><title>NVIDIA Announces New GPU Architecture</title></head>
+<body>
+<nav><a href="/">Home</a> <a href="/news">News</a></nav>
+<article>
+<h1>NVIDIA Announces New GPU Architecture</h1>
+<p>NVIDIA today announced a new GPU architecture designed to accelerate generative AI
+training and inference workloads across data centers around the world.</p>
+<p>The architecture delivers significant improvements in energy efficiency and memory
+bandwidth, enabling larger models to be trained faster and at lower cost.</p>
+<p>Cloud providers and server manufacturers are expected to offer systems based on the
+new architecture later this year, with broad availability planned for next year.</p>
+</article>
+<footer>Copyright NVIDIA Corporation</footer>
+</body>
+</html>
+"""
+
+
+class PageServer:
+    """In-memory page registry served by a local HTTP/1.1 server."""
+
+    def __init__(self):
+        self.pages: Dict[str, Dict] = {}
+        self.hits: Dict[str, int] = {}
+        self.base_url = ""
+
+    def add(self, path: str, body: str, status: int = 200, headers: Dict[str, str] = None):
+        """Register a page body and response headers for a path."""
+        self.pages[path] = {"body": body.encode(), "status": status, "headers": headers or {}}
+
+    def url(self, path: str) -> str:
+        """Get the absolute URL for a path."""
+        return f"{self.base_url}{path}"
+
+
+def _make_handler(registry: PageServer):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            registry.hits[self.path] = registry.hits.get(self.path, 0) + 1
+            page = registry.pages.get(self.path)
+            if page is None:
+                self._respond(404, b"not found", {})
+                return
+
+            etag = page["headers"].get("ETag")
+            if etag and self.headers.get("If-None-Match") == etag:
+                self._respond(304, b"", {"ETag": etag})
+                return
+
+            self._respond(page["status"], page["body"], page["headers"])
+
+        def _respond(self, status, body, headers):
+            self.send_response(status)
+            headers = {"Content-Type": "text/html; charset=utf-8", **headers}
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+@pytest.fixture
+def page_server():
+    """Run a local HTTP server on a random port serving registered pages."""
+    registry = PageServer()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _make_handler(registry))
+    registry.base_url = f"http://127.0.0.1:{server.server_port}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield registry
+    server.shutdown()
+    server.server_close()
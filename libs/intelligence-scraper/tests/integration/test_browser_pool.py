@@ -0,0 +1,183 @@
+"""
+Integration tests for the Playwright browser pool
+
+Runs BrowserPool against a fake Playwright so launching, the page limit and
+browser recycling are exercised without Chromium.
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from intelligence_scraper.utils import browser_pool
+from intelligence_scraper.utils.browser_pool import BrowserPool
+
+
+class FakeContext:
+    def __init__(self, browser: "FakeBrowser"):
+        self.browser = browser
+        self.closed = False
+
+    async def new_page(self) -> "FakeContext":
+        return self
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self):
+        self.contexts: List[FakeContext] = []
+        self.closed = False
+
+    def is_connected(self) -> bool:
+        return not self.closed
+
+    async def new_context(self) -> FakeContext:
+        context = FakeContext(self)
+        self.contexts.append(context)
+        return context
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class FakeChromium:
+    def __init__(self):
+        self.browsers: List[FakeBrowser] = []
+
+    async def launch(self, headless: bool) -> FakeBrowser:
+        browser = FakeBrowser()
+        self.browsers.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    """Stand-in for both async_playwright() and the Playwright it starts."""
+
+    def __init__(self):
+        self.chromium = FakeChromium()
+        self.starts = 0
+        self.stopped = False
+
+    async def start(self) -> "FakePlaywright":
+        self.starts += 1
+        return self
+
+    async def stop(self) -> None:
+        self.stopped = True
+
+
+@pytest.fixture
+def playwright(monkeypatch) -> FakePlaywright:
+    fake = FakePlaywright()
+    monkeypatch.setattr(browser_pool, "async_playwright", lambda: fake)
+    return fake
+
+
+class TestBrowserPool:
+    """Tests for BrowserPool."""
+
+    @pytest.mark.asyncio
+    async def test_launches_lazily_and_reuses_browser(self, playwright):
+        """Test that Chromium starts on the first page and serves later pages too."""
+        pool = BrowserPool()
+        assert playwright.starts == 0
+
+        for _ in range(3):
+            async with pool.page() as page:
+                assert not page.closed
+            assert page.closed
+
+        assert playwright.starts == 1
+        assert pool.browsers_launched == 1
+        assert pool.pages_served == 3
+        assert len(playwright.chromium.browsers[0].contexts) == 3
+
+        await pool.close()
+        assert playwright.chromium.browsers[0].closed
+        assert playwright.stopped
+
+    @pytest.mark.asyncio
+    async def test_page_limit(self, playwright):
+        """Test that no more than max_pages pages are open at once."""
+        pool = BrowserPool(max_pages=2)
+        open_pages = 0
+        peak = 0
+
+        async def _use_page() -> None:
+            nonlocal open_pages, peak
+            async with pool.page():
+                open_pages += 1
+                peak = max(peak, open_pages)
+                await asyncio.sleep(0.01)
+                open_pages -= 1
+
+        await asyncio.gather(*(_use_page() for _ in range(5)))
+        await pool.close()
+
+        assert peak == 2
+        assert pool.pages_served == 5
+
+    @pytest.mark.asyncio
+    async def test_relaunch_after_recycle_after_pages(self, playwright):
+        """Test that the browser is replaced once it has served recycle_after pages."""
+        pool = BrowserPool(recycle_after=2)
+
+        for _ in range(5):
+            async with pool.page():
+                pass
+
+        browsers = playwright.chromium.browsers
+        assert pool.browsers_launched == 3
+        assert [len(b.contexts) for b in browsers] == [2, 2, 1]
+        assert [b.closed for b in browsers] == [True, True, False]
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_retired_browser_closed_after_in_flight_pages(self, playwright):
+        """Test that a recycled browser stays open until its last page is released."""
+        pool = BrowserPool(max_pages=2, recycle_after=1)
+        release = asyncio.Event()
+        opened = asyncio.Event()
+
+        async def _hold_page() -> None:
+            async with pool.page():
+                opened.set()
+                await release.wait()
+
+        holder = asyncio.create_task(_hold_page())
+        await opened.wait()
+        async with pool.page():
+            pass
+
+        old, new = playwright.chromium.browsers
+        assert not old.closed
+        assert not new.closed
+
+        release.set()
+        await holder
+
+        assert old.closed
+        assert not new.closed
+        await pool.close()
+        assert new.closed
+
+    @pytest.mark.asyncio
+    async def test_close_with_page_in_flight(self, playwright):
+        """Test that a page released after the pool was closed does not fail."""
+        pool = BrowserPool()
+
+        async with pool.page() as page:
+            await pool.close()
+            assert playwright.chromium.browsers[0].closed
+
+        assert page.closed
+        assert playwright.stopped
+
+        # The pool can be used again after a close
+        async with pool.page():
+            pass
+        assert pool.browsers_launched == 2
+        await pool.close()
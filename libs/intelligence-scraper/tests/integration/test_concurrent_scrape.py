@@ -0,0 +1,87 @@
+"""
+Integration tests for concurrent article scraping
+
+Verifies bounded parallelism, listing order and failure isolation in NvidiaScraper.
+"""
+
+import asyncio
+from datetime import datetime
+from typing import List, Optional
+
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.models import ScrapedArticle
+
+
+class FakeNvidiaScraper(NvidiaScraper):
+    """NvidiaScraper with network access replaced by in-memory fakes."""
+
+    def __init__(self, urls: List[str], failing: set, **kwargs):
+        super().__init__(**kwargs)
+        self.urls = urls
+        self.failing = failing
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def _get_article_urls(self) -> List[str]:
+        return self.urls
+
+    async def _scrape_article_with_retry(self, url: str) -> Optional[ScrapedArticle]:
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            # Later articles finish first to prove ordering is preserved
+            await asyncio.sleep(0.01 * (len(self.urls) - self.urls.index(url)))
+            if url in self.failing:
+                raise RuntimeError("boom")
+            return ScrapedArticle(
+                url=url,
+                title=f"Article {url[-1]}",
+                content="Article content for testing.",
+                publishDate=datetime(2024, 1, 15),
+                source=self.get_source_name(),
+            )
+        finally:
+            self.in_flight -= 1
+
+
+class TestConcurrentScrape:
+    """Tests for NvidiaScraper concurrent scrape mode."""
+
+    @pytest.mark.asyncio
+    async def test_scrape_keeps_listing_order_and_isolates_failures(self):
+        """Test that results follow listing order and one failure doesn't stop the run."""
+        urls = [f"https://example.com/news/{i}" for i in range(6)]
+        scraper = FakeNvidiaScraper(urls, failing={urls[2]}, concurrency=3)
+
+        articles = await scraper.scrape()
+
+        assert [str(a.url) for a in articles] == [u for u in urls if u != urls[2]]
+        assert scraper.peak_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_scrape_respects_max_articles(self):
+        """Test that only max_articles URLs are scraped."""
+        urls = [f"https://example.com/news/{i}" for i in range(6)]
+        scraper = FakeNvidiaScraper(urls, failing=set(), max_articles=2, concurrency=4)
+
+        articles = await scraper.scrape()
+
+        assert len(articles) == 2
+
+    def test_invalid_concurrency_rejected(self):
+        """Test that a concurrency below 1 is rejected."""
+        with pytest.raises(ValueError):
+            NvidiaScraper(concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_scrape_iter_yields_in_completion_order(self):
+        """Test that scrape_iter streams articles as soon as each completes."""
+        urls = [f"https://example.com/news/{i}" for i in range(4)]
+        scraper = FakeNvidiaScraper(urls, failing=set(), concurrency=4)
+
+        streamed = [str(article.url) async for article in scraper.scrape_iter()]
+
+        # Later articles finish first in the fake, so they are yielded first
+        assert streamed == list(reversed(urls))
@@ -0,0 +1,69 @@
+"""
+Integration tests for the run deadline
+
+Verifies that a run stops on time, keeps completed articles and reports skipped URLs.
+"""
+
+import asyncio
+import time
+from datetime import datetime
+from typing import Optional
+
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.models import ScrapedArticle
+from tests.integration.test_concurrent_scrape import FakeNvidiaScraper
+
+
+class SlowScraper(FakeNvidiaScraper):
+    """Fake scraper where every article takes the same time."""
+
+    article_seconds = 0.1
+
+    async def _scrape_article_with_retry(self, url: str) -> Optional[ScrapedArticle]:
+        await asyncio.sleep(self.article_seconds)
+        return ScrapedArticle(
+            url=url,
+            title=f"Article {url[-1]}",
+            content=f"Article content for testing {url}.",
+            publishDate=datetime(2024, 1, 15),
+            source=self.get_source_name(),
+        )
+
+
+class TestDeadline:
+    """Tests for the deadline option."""
+
+    @pytest.mark.asyncio
+    async def test_run_stops_at_deadline_with_partial_results(self):
+        """Test that completed articles are kept and the rest reported as skipped."""
+        urls = [f"https://example.com/news/{i}" for i in range(10)]
+        scraper = SlowScraper(urls, failing=set(), concurrency=2, deadline=0.35)
+
+        started = time.monotonic()
+        articles = [a async for a in scraper.scrape_iter()]
+        elapsed = time.monotonic() - started
+
+        assert elapsed < 0.6
+        assert 4 <= len(articles) <= 6
+        assert scraper.deadline_reached
+        scraped = {str(a.url) for a in articles}
+        assert set(scraper.skipped_urls) == set(urls) - scraped
+        assert set(scraper.skipped_urls.values()) == {"deadline"}
+
+    @pytest.mark.asyncio
+    async def test_run_within_deadline_is_complete(self):
+        """Test that a generous deadline changes nothing."""
+        urls = [f"https://example.com/news/{i}" for i in range(4)]
+        scraper = SlowScraper(urls, failing=set(), concurrency=4, deadline=5)
+
+        articles = await scraper.scrape()
+
+        assert len(articles) == 4
+        assert not scraper.deadline_reached
+
+    def test_invalid_deadline_rejected(self):
+        """Test that a non-positive deadline is rejected."""
+        with pytest.raises(ValueError):
+            NvidiaScraper(deadline=0)
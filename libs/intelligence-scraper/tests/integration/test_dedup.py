@@ -0,0 +1,94 @@
+"""
+Integration tests for near-duplicate detection
+
+Verifies SimHash stability, the persistent LSH index and article tagging.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.models import ScrapedArticle
+from intelligence_scraper.utils.dedup import DuplicateIndex, simhash
+
+PRESS_RELEASE = (
+    "NVIDIA today announced a new data center GPU built for large language model "
+    "training and inference. The chip delivers twice the memory bandwidth of the "
+    "previous generation and is available from major cloud providers starting next "
+    "quarter. Partners including server makers and system integrators will ship "
+    "systems based on the new platform, and software support arrives with the next "
+    "release of the CUDA toolkit and the company's inference microservices."
+)
+
+
+def article(url: str, content: str) -> ScrapedArticle:
+    return ScrapedArticle(
+        url=url,
+        title="NVIDIA Announces GPU",
+        content=content,
+        publishDate=datetime(2024, 1, 15),
+        source="NVIDIA Newsroom",
+    )
+
+
+class TestSimhash:
+    """Tests for SimHash signatures."""
+
+    def test_small_edit_changes_few_bits(self):
+        """Test that a lightly edited copy stays close and unrelated text does not."""
+        original = simhash(PRESS_RELEASE)
+        edited = simhash(PRESS_RELEASE.replace("twice", "2x") + " Republished with permission.")
+        unrelated = simhash("Quarterly earnings rose on strong gaming and automotive demand.")
+
+        assert (original ^ edited).bit_count() <= 12
+        assert (original ^ unrelated).bit_count() > 12
+        assert simhash(PRESS_RELEASE) == original
+
+
+class TestDuplicateIndex:
+    """Tests for DuplicateIndex."""
+
+    def test_finds_signatures_within_max_distance(self):
+        """Test that close signatures match and far ones do not."""
+        index = DuplicateIndex(max_distance=3, bands=4)
+        index.add("https://a.example/1", 0xFFFF_0000_FFFF_0000)
+
+        assert index.find(0xFFFF_0000_FFFF_0007) == ("https://a.example/1", 3)
+        assert index.find(0xFFFF_0000_FFFF_000F) is None
+        assert index.find(0xFFFF_0000_FFFF_0000, exclude_url="https://a.example/1") is None
+
+    def test_index_persists_across_runs(self, tmp_path):
+        """Test that signatures from a previous run are found after reopening."""
+        first = DuplicateIndex(str(tmp_path))
+        first.add("https://a.example/1", (1 << 63) | 5)
+        first.close()
+
+        second = DuplicateIndex(str(tmp_path))
+        assert second.check("https://b.example/1", (1 << 63) | 4) == ("https://a.example/1", 1)
+        assert len(second) == 1
+        second.close()
+
+    def test_band_layout_validated(self):
+        """Test that bands must exceed the allowed distance."""
+        with pytest.raises(ValueError):
+            DuplicateIndex(max_distance=4, bands=4)
+
+
+class TestDuplicateTagging:
+    """Tests for tagging scraped articles."""
+
+    @pytest.mark.asyncio
+    async def test_syndicated_copy_tagged_with_canonical_url(self):
+        """Test that the second copy points at the first and the first is untouched."""
+        async with NvidiaScraper(max_articles=5) as scraper:
+            canonical = await scraper._tag_duplicate(
+                article("https://nvidianews.nvidia.com/news/gpu", PRESS_RELEASE)
+            )
+            copy = await scraper._tag_duplicate(
+                article("https://partner.example.com/gpu", PRESS_RELEASE + " Reprinted.")
+            )
+
+        assert "duplicateOf" not in canonical.metadata
+        assert copy.metadata["duplicateOf"] == "https://nvidianews.nvidia.com/news/gpu"
+        assert len(copy.metadata["contentSimhash"]) == 16
@@ -0,0 +1,49 @@
+"""
+Integration tests for off-loop content extraction
+
+Verifies that trafilatura extraction works in both thread and process pools.
+"""
+
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from tests.integration.conftest import ARTICLE_HTML
+
+
+class TestExtractionWorkers:
+    """Tests for the extraction executor integration."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("extract_workers", [0, 1])
+    async def test_article_extracted_in_executor(self, page_server, extract_workers):
+        """Test that articles are extracted with a thread pool and a process pool."""
+        page_server.add("/news/gpu", ARTICLE_HTML)
+
+        async with NvidiaScraper(extract_workers=extract_workers) as scraper:
+            article = await scraper._scrape_with_trafilatura(page_server.url("/news/gpu"))
+
+        assert article is not None
+        assert article.title == "NVIDIA Announces New GPU Architecture"
+        assert "energy efficiency" in article.content
+
+    def test_negative_extract_workers_rejected(self):
+        """Test that a negative worker count is rejected."""
+        with pytest.raises(ValueError):
+            NvidiaScraper(extract_workers=-1)
+
+    def test_single_parse_extracts_metadata(self):
+        """Test that body text and metadata come from one extraction pass."""
+        from intelligence_scraper.utils.extraction import extract_article
+
+        html = ARTICLE_HTML.replace(
+            "<head>",
+            '<head><meta property="article:published_time" content="2024-03-18T13:00:00Z">'
+            '<meta name="keywords" content="AI, GPU">',
+        )
+
+        extracted = extract_article(html)
+
+        assert extracted.title == "NVIDIA Announces New GPU Architecture"
+        assert extracted.publish_date == "2024-03-18"
+        assert extracted.keywords == ["AI", "GPU"]
+        assert "memory bandwidth" in extracted.content
@@ -0,0 +1,226 @@
+"""
+Integration tests for sitemap and RSS feed discovery
+
+Verifies streaming feed parsing, the watermark filter and the fallback to
+listing pages when a site has no feed.
+"""
+
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.utils.feeds import (
+    ATOM,
+    RSS,
+    SITEMAP_INDEX,
+    FeedError,
+    FeedParser,
+    discover_feed_entries,
+    parse_feed_date,
+)
+from intelligence_scraper.utils.retry import RetryPolicy
+from tests.integration.conftest import ARTICLE_HTML
+from tests.integration.test_listing_crawl import listing_html
+from tests.integration.test_playwright_fallback import FakeBrowserPool
+
+XML = {"Content-Type": "application/xml"}
+
+
+def sitemap_xml(entries) -> str:
+    """Build a sitemap from (URL, lastmod) pairs."""
+    urls = "".join(
+        f"<url><loc>{loc}</loc>{f'<lastmod>{lastmod}</lastmod>' if lastmod else ''}</url>"
+        for loc, lastmod in entries
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{urls}</urlset>'
+    )
+
+
+def parse(document: str, chunk_size: int = 7):
+    """Feed a document to a FeedParser in small chunks."""
+    parser = FeedParser("https://example.com/feed")
+    data = document.encode("utf-8")
+    for start in range(0, len(data), chunk_size):
+        end = start + chunk_size
+        parser.feed_bytes(data[start:end])
+    return parser.close()
+
+
+class TestFeedParser:
+    """Tests for FeedParser."""
+
+    def test_sitemap_parsed_across_chunks(self):
+        """Test that entries split over many chunks are read with their dates."""
+        feed = parse(
+            sitemap_xml([("https://example.com/news/a", "2024-03-01T10:00:00Z"), ("/news/b", None)])
+        )
+
+        assert [e.url for e in feed.entries] == [
+            "https://example.com/news/a",
+            "https://example.com/news/b",
+        ]
+        assert feed.entries[0].updated == datetime(2024, 3, 1, 10, tzinfo=timezone.utc)
+        assert feed.entries[1].updated is None
+
+    def test_rss_and_atom(self):
+        """Test RSS pubDate and Atom alternate links and updated dates."""
+        rss = parse(
+            "<rss><channel><title>News</title><link>https://example.com/</link>"
+            "<item><title>A</title><link>https://example.com/news/a</link>"
+            "<pubDate>Fri, 01 Mar 2024 10:00:00 +0100</pubDate></item></channel></rss>"
+        )
+        atom = parse(
+            '<feed xmlns="http://www.w3.org/2005/Atom"><link href="https://example.com/"/>'
+            '<entry><link rel="self" href="https://example.com/api/a"/>'
+            '<link rel="alternate" href="https://example.com/news/a"/>'
+            "<updated>2024-03-01T09:00:00+00:00</updated></entry></feed>"
+        )
+
+        assert rss.kind == RSS
+        assert [(e.url, e.updated.hour) for e in rss.entries] == [("https://example.com/news/a", 9)]
+        assert atom.kind == ATOM
+        assert [e.url for e in atom.entries] == ["https://example.com/news/a"]
+
+    def test_sitemap_index_lists_child_sitemaps(self):
+        """Test that a sitemap index yields child sitemaps, not entries."""
+        feed = parse(
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            "<sitemap><loc>/sitemap-news.xml</loc><lastmod>2024-03-01</lastmod></sitemap>"
+            "</sitemapindex>"
+        )
+
+        assert feed.kind == SITEMAP_INDEX
+        assert feed.entries == []
+        assert feed.sitemaps[0].url == "https://example.com/sitemap-news.xml"
+
+    def test_html_rejected(self):
+        """Test that an HTML page served at the feed URL is not a feed."""
+        with pytest.raises(FeedError):
+            parse("<html><body>Not found</body></html>")
+
+    def test_parse_feed_date(self):
+        """Test W3C, RFC 822 and invalid dates."""
+        assert parse_feed_date("2024-03-01") == datetime(2024, 3, 1, tzinfo=timezone.utc)
+        assert parse_feed_date("Fri, 01 Mar 2024 10:00:00 GMT").hour == 10
+        assert parse_feed_date("yesterday") is None
+
+
+class TestFeedDiscovery:
+    """Tests for NvidiaScraper article discovery through feeds."""
+
+    @pytest.mark.asyncio
+    async def test_newest_child_sitemaps_fetched(self, page_server):
+        """Test that an index listed oldest first still yields its newest sitemaps."""
+        children = "".join(
+            f"<sitemap><loc>{page_server.url(f'/sitemap-{day}.xml')}</loc>"
+            f"<lastmod>2024-03-0{day}</lastmod></sitemap>"
+            for day in (1, 2, 3, 4)
+        )
+        page_server.add(
+            "/sitemap.xml",
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            f"<sitemap><loc>{page_server.url('/sitemap-undated.xml')}</loc></sitemap>"
+            f"{children}</sitemapindex>",
+            headers=XML,
+        )
+        for name in ("1", "2", "3", "4", "undated"):
+            story = (page_server.url(f"/news/story-{name}"), None)
+            page_server.add(f"/sitemap-{name}.xml", sitemap_xml([story]), headers=XML)
+
+        async with httpx.AsyncClient() as client:
+            entries = await discover_feed_entries(
+                client, [page_server.url("/sitemap.xml")], max_sitemaps=2
+            )
+
+        assert [e.url for e in entries] == [
+            page_server.url("/news/story-4"),
+            page_server.url("/news/story-3"),
+        ]
+        assert "/sitemap-1.xml" not in page_server.hits
+        assert "/sitemap-undated.xml" not in page_server.hits
+
+    @pytest.mark.asyncio
+    async def test_sitemap_used_instead_of_listing(self, page_server):
+        """Test that sitemap articles are listed newest first without fetching the listing."""
+        page_server.add(
+            "/sitemap.xml",
+            sitemap_xml(
+                [
+                    (page_server.url("/news/old"), "2024-01-01"),
+                    (page_server.url("/news/new"), "2024-03-01"),
+                    (page_server.url("/about"), "2024-03-02"),
+                ]
+            ),
+            headers=XML,
+        )
+        page_server.add("/news", listing_html(["/news/listed"]))
+
+        async with NvidiaScraper(base_url=page_server.base_url) as scraper:
+            urls = await scraper._get_article_urls()
+
+        assert urls == [page_server.url("/news/new"), page_server.url("/news/old")]
+        assert "/news" not in page_server.hits
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_listing_without_feed(self, page_server):
+        """Test that the HTML listing is walked when no sitemap or feed exists."""
+        page_server.add("/sitemap.xml", "<html>Not found</html>", status=404)
+        page_server.add("/news", listing_html(["/news/listed"]))
+        page_server.add("/news?page=2", listing_html([]))
+
+        async with NvidiaScraper(base_url=page_server.base_url) as scraper:
+            urls = await scraper._get_article_urls()
+
+        assert urls == [page_server.url("/news/listed")]
+        assert page_server.hits["/sitemap.xml"] == 1
+
+    @pytest.mark.asyncio
+    async def test_watermark_limits_incremental_runs(self, page_server, tmp_path):
+        """Test that a completed incremental run only lists newer entries next time."""
+        entries = [(page_server.url(f"/news/story-{day}"), f"2024-03-0{day}") for day in (1, 2)]
+        page_server.add("/sitemap.xml", sitemap_xml(entries), headers=XML)
+
+        async with NvidiaScraper(
+            base_url=page_server.base_url, incremental=True, state_dir=str(tmp_path)
+        ) as scraper:
+            first = await scraper._discover_feed_urls()
+            scraper._commit_feed_watermark()
+
+            entries.append((page_server.url("/news/story-3"), "2024-03-03"))
+            page_server.add("/sitemap.xml", sitemap_xml(entries), headers=XML)
+            scraper._start_run()
+            second = await scraper._discover_feed_urls()
+
+            assert scraper.fetch_state.get_watermark(scraper.get_source_name()) == datetime(
+                2024, 3, 2, tzinfo=timezone.utc
+            )
+
+        assert first == [page_server.url("/news/story-2"), page_server.url("/news/story-1")]
+        assert second == [page_server.url("/news/story-3")]
+
+    @pytest.mark.asyncio
+    async def test_failed_entry_listed_again(self, page_server, tmp_path):
+        """Test that the watermark stays below an entry whose scrape failed."""
+        entries = [(page_server.url(f"/news/story-{day}"), f"2024-03-0{day}") for day in (1, 2, 3)]
+        page_server.add("/sitemap.xml", sitemap_xml(entries), headers=XML)
+        for day in (1, 3):
+            page_server.add(f"/news/story-{day}", ARTICLE_HTML.replace("GPU", f"GPU {day}"))
+        page_server.add("/news/story-2", "Server error", status=500)
+
+        async with NvidiaScraper(
+            base_url=page_server.base_url,
+            incremental=True,
+            state_dir=str(tmp_path),
+            retry_policy=RetryPolicy(max_attempts=1),
+        ) as scraper:
+            scraper._browser_pool = FakeBrowserPool()
+            first = await scraper.scrape()
+            scraper._start_run()
+            second = await scraper._discover_feed_urls()
+
+        assert len(first) == 2
+        assert second == [page_server.url("/news/story-2")]
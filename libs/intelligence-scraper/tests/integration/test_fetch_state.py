@@ -0,0 +1,77 @@
+"""
+Integration tests for conditional fetching
+
+Verifies that unchanged pages are detected via ETag or content hash and skipped.
+"""
+
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.utils.strategy import PLAYWRIGHT
+from tests.integration.conftest import ARTICLE_HTML
+from tests.integration.test_playwright_fallback import FakeBrowserPool
+
+
+class TestConditionalFetch:
+    """Tests for the fetch state store and unchanged-page detection."""
+
+    @pytest.mark.asyncio
+    async def test_etag_revalidation_marks_article_unchanged(self, page_server, tmp_path):
+        """Test that a 304 on the second run skips extraction."""
+        page_server.add("/news/gpu", ARTICLE_HTML, headers={"ETag": '"v1"'})
+        url = page_server.url("/news/gpu")
+
+        async with NvidiaScraper(state_dir=str(tmp_path)) as scraper:
+            first = await scraper._scrape_article_with_retry(url)
+            second = await scraper._scrape_article_with_retry(url)
+
+            assert first is not None
+            assert second is None
+            assert url in scraper.unchanged_urls
+            assert scraper.fetch_state.get(url).status == "unchanged"
+
+    @pytest.mark.asyncio
+    async def test_identical_body_without_validators_is_unchanged(self, page_server, tmp_path):
+        """Test that a matching content hash is treated as unchanged across runs."""
+        page_server.add("/news/gpu", ARTICLE_HTML)
+        url = page_server.url("/news/gpu")
+
+        async with NvidiaScraper(state_dir=str(tmp_path)) as scraper:
+            assert await scraper._scrape_article_with_retry(url) is not None
+
+        async with NvidiaScraper(state_dir=str(tmp_path)) as scraper:
+            assert await scraper._scrape_article_with_retry(url) is None
+            assert url in scraper.unchanged_urls
+
+    @pytest.mark.asyncio
+    async def test_changed_body_is_extracted_again(self, page_server, tmp_path):
+        """Test that modified content is re-extracted."""
+        page_server.add("/news/gpu", ARTICLE_HTML)
+        url = page_server.url("/news/gpu")
+
+        async with NvidiaScraper(state_dir=str(tmp_path)) as scraper:
+            assert await scraper._scrape_article_with_retry(url) is not None
+            page_server.add("/news/gpu", ARTICLE_HTML.replace("today", "yesterday"))
+            assert await scraper._scrape_article_with_retry(url) is not None
+            assert url not in scraper.unchanged_urls
+
+    @pytest.mark.asyncio
+    async def test_browser_rendered_page_is_revalidated(self, page_server, tmp_path):
+        """Test that pages sent straight to the browser get fetch state and skip re-rendering."""
+        page_server.add("/news/gpu", ARTICLE_HTML, headers={"ETag": '"v1"'})
+        url = page_server.url("/news/gpu")
+
+        async with NvidiaScraper(state_dir=str(tmp_path)) as scraper:
+            pool = FakeBrowserPool()
+            scraper._browser_pool = pool
+            scraper.strategy.choose_method = lambda url: PLAYWRIGHT
+
+            first = await scraper._scrape_article_with_retry(url)
+            second = await scraper._scrape_article_with_retry(url)
+
+            assert first.metadata["scraperMethod"] == "playwright"
+            assert second is None
+            assert len(pool.pages) == 1
+            assert url in scraper.unchanged_urls
+            assert scraper.fetch_state.get(url).etag == '"v1"'
+            assert url in scraper.fetch_state.known_urls()
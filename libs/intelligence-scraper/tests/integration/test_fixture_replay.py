@@ -0,0 +1,45 @@
+"""
+Integration tests for fixture recording and replay
+
+Verifies that a recorded run can be scraped again offline from the replay server.
+"""
+
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.utils.fixtures import FixtureArchive, ReplayServer
+from tests.integration.conftest import ARTICLE_HTML
+
+
+class TestFixtureReplay:
+    """Tests for record mode and the replay server."""
+
+    @pytest.mark.asyncio
+    async def test_recorded_run_replays_offline(self, page_server, tmp_path):
+        """Test that replaying a recording yields the same articles."""
+        page_server.add(
+            "/news",
+            f'<html><body><article><h3><a href="{page_server.url("/news/gpu")}">GPU</a>'
+            "</h3></article></body></html>",
+        )
+        page_server.add("/news?page=2", "<html><body></body></html>")
+        page_server.add("/news/gpu", ARTICLE_HTML)
+        archive_path = str(tmp_path / "nvidia.jsonl.gz")
+
+        recorder = NvidiaScraper(base_url=page_server.base_url, record_fixtures=archive_path)
+        recorded = await recorder.scrape()
+
+        archive = FixtureArchive.load(archive_path)
+        assert {entry.url for entry in archive.entries} >= {
+            page_server.url("/news"),
+            page_server.url("/news?page=2"),
+            page_server.url("/news/gpu"),
+        }
+
+        with ReplayServer(archive, latency=0.01) as server:
+            replayed = await NvidiaScraper(base_url=server.base_url).scrape()
+
+        assert len(recorded) == len(replayed) == 1
+        assert replayed[0].title == recorded[0].title
+        assert replayed[0].content == recorded[0].content
+        assert str(replayed[0].url) == server.url_for(str(recorded[0].url))
@@ -0,0 +1,184 @@
+"""
+Integration tests for the distributed crawl frontier
+
+Verifies the lease queries sent to MongoDB and how scraper workers claim,
+finish and hand back frontier URLs.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import pytest
+
+from intelligence_scraper.utils.frontier import (
+    PENDING,
+    CrawlFrontier,
+    FrontierItem,
+    claim_query,
+    claim_update,
+    retry_delay,
+    seed_update,
+)
+from tests.integration.test_concurrent_scrape import FakeNvidiaScraper
+
+NOW = datetime(2024, 3, 18, 12, 0, tzinfo=timezone.utc)
+
+
+class MemoryFrontier:
+    """In-memory stand-in for CrawlFrontier recording each outcome."""
+
+    def __init__(self, lease_seconds: float = 60.0):
+        self.lease_seconds = lease_seconds
+        self.pending: List[str] = []
+        self.claimed_by: Dict[str, str] = {}
+        self.outcomes: Dict[str, str] = {}
+        self.renewals = 0
+
+    async def seed(self, urls, source=None, priority=0, next_fetch_at=None) -> int:
+        new = [url for url in urls if url not in self.pending and url not in self.outcomes]
+        self.pending.extend(new)
+        return len(new)
+
+    async def reclaim_expired(self) -> int:
+        return 0
+
+    def worker(self, worker_id: str) -> "MemoryFrontierWorker":
+        return MemoryFrontierWorker(self, worker_id)
+
+
+class MemoryFrontierWorker:
+    """One worker's view of a MemoryFrontier."""
+
+    def __init__(self, shared: MemoryFrontier, worker_id: str):
+        self.shared = shared
+        self.worker_id = worker_id
+        self.lease_seconds = shared.lease_seconds
+
+    def __getattr__(self, name):
+        return getattr(self.shared, name)
+
+    async def claim(self, batch_size: int, source: Optional[str] = None) -> List[FrontierItem]:
+        await asyncio.sleep(0)
+        batch = self.shared.pending[:batch_size]
+        del self.shared.pending[:batch_size]
+        for url in batch:
+            self.shared.claimed_by[url] = self.worker_id
+        return [FrontierItem(url, source, 0, 1, NOW) for url in batch]
+
+    async def renew(self, items) -> int:
+        self.shared.renewals += 1
+        return len(list(items))
+
+    async def complete(self, item: FrontierItem) -> bool:
+        self.shared.outcomes[item.url] = "done"
+        return True
+
+    async def fail(self, item: FrontierItem, error: str) -> bool:
+        self.shared.outcomes[item.url] = "failed"
+        return True
+
+    async def release(self, item: FrontierItem, delay: float = 0.0) -> bool:
+        self.shared.outcomes[item.url] = "released"
+        return True
+
+
+class TestFrontierQueries:
+    """Tests for the documents sent to MongoDB."""
+
+    def test_claim_query_includes_expired_leases(self):
+        """Test that due URLs are claimable when unleased or their lease expired."""
+        query = claim_query(NOW, "NVIDIA Newsroom", max_attempts=3)
+
+        assert query["state"] == PENDING
+        assert query["source"] == "NVIDIA Newsroom"
+        assert query["nextFetchAt"] == {"$lte": NOW}
+        assert query["attempts"] == {"$lt": 3}
+        assert query["$or"] == [{"leaseExpiresAt": None}, {"leaseExpiresAt": {"$lte": NOW}}]
+        assert "source" not in claim_query(NOW, None, 3)
+
+    def test_claim_update_leases_to_worker(self):
+        """Test that a claim sets the lease and counts the attempt."""
+        update = claim_update("worker-1", NOW, 90)
+
+        assert update["$set"]["leaseOwner"] == "worker-1"
+        assert update["$set"]["leaseExpiresAt"] == NOW + timedelta(seconds=90)
+        assert update["$inc"] == {"attempts": 1}
+
+    def test_seed_keeps_existing_state(self):
+        """Test that seeding only sets fields on insert, apart from raising priority."""
+        update = seed_update("https://example.com/news/a", "NVIDIA Newsroom", 5, NOW, NOW)
+
+        assert update["$setOnInsert"]["state"] == PENDING
+        assert update["$setOnInsert"]["nextFetchAt"] == NOW
+        assert update["$max"] == {"priority": 5}
+        assert "priority" not in update["$setOnInsert"]
+
+    def test_retry_delay_doubles(self):
+        """Test the backoff between failed attempts."""
+        assert [retry_delay(n, 60) for n in (1, 2, 3)] == [60, 120, 240]
+
+    def test_invalid_lease_rejected(self):
+        """Test that a non-positive lease length is rejected."""
+        with pytest.raises(ValueError):
+            CrawlFrontier(collection=None, lease_seconds=0)
+
+
+class TestFrontierWorkers:
+    """Tests for scrapers working from a shared frontier."""
+
+    @pytest.mark.asyncio
+    async def test_workers_split_urls_and_report_outcomes(self):
+        """Test that two workers scrape each URL once and report failures."""
+        urls = [f"https://example.com/news/{i}" for i in range(8)]
+        frontier = MemoryFrontier()
+        workers = [
+            FakeNvidiaScraper(
+                urls, failing={urls[3]}, concurrency=2, frontier=frontier.worker(f"w{n}")
+            )
+            for n in range(2)
+        ]
+
+        results = await asyncio.gather(*(worker.scrape() for worker in workers))
+
+        scraped = [str(a.url) for articles in results for a in articles]
+        assert sorted(scraped) == sorted(u for u in urls if u != urls[3])
+        assert set(frontier.claimed_by.values()) == {"w0", "w1"}
+        assert frontier.outcomes[urls[3]] == "failed"
+        assert {u for u, o in frontier.outcomes.items() if o == "done"} == set(scraped)
+        assert not frontier.pending
+
+    @pytest.mark.asyncio
+    async def test_worker_stops_at_max_articles(self):
+        """Test that a worker claims no more than max_articles URLs."""
+        urls = [f"https://example.com/news/{i}" for i in range(6)]
+        frontier = MemoryFrontier()
+        scraper = FakeNvidiaScraper(
+            urls, failing=set(), max_articles=3, concurrency=2, frontier=frontier.worker("w0")
+        )
+
+        articles = await scraper.scrape()
+
+        assert len(articles) == 3
+        assert len(frontier.pending) == 3
+
+    @pytest.mark.asyncio
+    async def test_leases_renewed_and_deadline_skips_released(self):
+        """Test that long batches renew leases and deadline-skipped URLs are handed back."""
+        urls = [f"https://example.com/news/{i}" for i in range(4)]
+        frontier = MemoryFrontier(lease_seconds=0.06)
+
+        class SlowScraper(FakeNvidiaScraper):
+            async def _scrape_article_with_retry(self, url):
+                await asyncio.sleep(0.1)
+                return await super()._scrape_article_with_retry(url)
+
+        scraper = SlowScraper(
+            urls, failing=set(), concurrency=2, deadline=0.15, frontier=frontier.worker("w0")
+        )
+
+        await scraper.scrape()
+
+        assert frontier.renewals >= 1
+        assert "released" in frontier.outcomes.values()
+        assert not scraper._frontier_leases
@@ -0,0 +1,93 @@
+"""
+Integration tests for the raw HTML archive
+
+Verifies append-only segments, the index and offline re-extraction.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.utils.html_archive import HtmlArchive
+from tests.integration.conftest import ARTICLE_HTML
+
+
+class TestHtmlArchive:
+    """Tests for HtmlArchive."""
+
+    def test_append_and_read_latest(self, tmp_path):
+        """Test that the newest fetch of a URL is returned and older ones are kept."""
+        archive = HtmlArchive(str(tmp_path), codec="gzip")
+        archive.append("https://example.com/a", "<p>old</p>", "Test", datetime(2024, 1, 1))
+        archive.append("https://example.com/a", "<p>new</p>", "Test", datetime(2024, 2, 1))
+        archive.append("https://example.com/b", "<p>b – ünïcode</p>", "Test")
+
+        assert archive.latest("https://example.com/a") == "<p>new</p>"
+        assert archive.latest("https://example.com/b") == "<p>b – ünïcode</p>"
+        assert archive.latest("https://example.com/missing") is None
+        assert len(archive.entries(latest_only=False)) == 3
+        assert {e.url for e in archive.entries()} == {
+            "https://example.com/a",
+            "https://example.com/b",
+        }
+        archive.close()
+
+    def test_segments_rotate_and_survive_reopen(self, tmp_path):
+        """Test that full segments are left alone and reopening keeps appending."""
+        archive = HtmlArchive(str(tmp_path), codec="gzip", segment_max_bytes=1)
+        archive.append("https://example.com/a", "<p>a</p>", "Test")
+        archive.append("https://example.com/b", "<p>b</p>", "Test")
+        archive.close()
+
+        reopened = HtmlArchive(str(tmp_path), codec="gzip", segment_max_bytes=1)
+        reopened.append("https://example.com/c", "<p>c</p>", "Test")
+
+        assert len(list(tmp_path.glob("segment-*.warc.gz"))) == 3
+        assert [reopened.read(e) for e in reopened.entries()] == [
+            "<p>a</p>",
+            "<p>b</p>",
+            "<p>c</p>",
+        ]
+        reopened.close()
+
+    def test_unknown_codec_rejected(self, tmp_path):
+        """Test that only supported codecs are accepted."""
+        with pytest.raises(ValueError):
+            HtmlArchive(str(tmp_path), codec="lz4")
+
+
+class TestReextract:
+    """Tests for re-extracting articles from the archive."""
+
+    @pytest.mark.asyncio
+    async def test_archived_articles_reextract_offline(self, page_server, tmp_path):
+        """Test that a run's archive rebuilds the same articles without the site."""
+        page_server.add(
+            "/news",
+            f'<html><body><article><h3><a href="{page_server.url("/news/gpu")}">GPU</a>'
+            "</h3></article></body></html>",
+        )
+        page_server.add("/news?page=2", "<html><body></body></html>")
+        page_server.add("/news/gpu", ARTICLE_HTML)
+        archive_dir = str(tmp_path / "archive")
+
+        scraped = await NvidiaScraper(
+            base_url=page_server.base_url, html_archive_dir=archive_dir
+        ).scrape()
+        hits = page_server.hits["/news/gpu"]
+
+        reextracted = [
+            a async for a in NvidiaScraper(html_archive_dir=archive_dir).reextract_iter()
+        ]
+
+        assert page_server.hits["/news/gpu"] == hits
+        assert len(scraped) == len(reextracted) == 1
+        assert reextracted[0].content == scraped[0].content
+        assert reextracted[0].title == scraped[0].title
+
+    @pytest.mark.asyncio
+    async def test_reextract_requires_archive(self):
+        """Test that re-extraction without an archive fails clearly."""
+        with pytest.raises(RuntimeError):
+            [a async for a in NvidiaScraper().reextract_iter()]
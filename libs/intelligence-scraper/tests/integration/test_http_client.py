@@ -0,0 +1,40 @@
+"""
+Integration tests for the shared HTTP client
+
+Verifies that the pooled client reuses keep-alive connections and reports it.
+"""
+
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.utils.http import ConnectionStats, create_http_client
+
+
+class TestSharedHttpClient:
+    """Tests for connection pooling and reuse reporting."""
+
+    @pytest.mark.asyncio
+    async def test_sequential_requests_reuse_connection(self, page_server):
+        """Test that repeated requests to one host open a single connection."""
+        page_server.add("/page", "<html><body>ok</body></html>")
+        stats = ConnectionStats()
+
+        async with create_http_client(timeout=5, stats=stats) as client:
+            for _ in range(5):
+                response = await client.get(page_server.url("/page"))
+                assert response.status_code == 200
+
+        assert stats.requests == 5
+        assert stats.connections_opened == 1
+        assert stats.connections_reused == 4
+
+    @pytest.mark.asyncio
+    async def test_scraper_context_manager_closes_client(self):
+        """Test that the scraper's client is only available while open."""
+        scraper = NvidiaScraper()
+
+        async with scraper:
+            assert not scraper.client.is_closed
+
+        with pytest.raises(RuntimeError):
+            scraper.client
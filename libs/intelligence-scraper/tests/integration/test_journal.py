@@ -0,0 +1,118 @@
+"""
+Integration tests for the run journal
+
+Verifies journal records, recovery from a cut-off record and resuming an
+interrupted scrape without repeating completed work.
+"""
+
+import json
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from intelligence_scraper.models import ScrapedArticle
+from intelligence_scraper.utils.journal import RunJournal
+from tests.integration.test_concurrent_scrape import FakeNvidiaScraper
+
+
+class CountingScraper(FakeNvidiaScraper):
+    """Fake scraper recording every listing crawl and article fetch."""
+
+    def __init__(self, urls: List[str], **kwargs):
+        super().__init__(urls, failing=set(), **kwargs)
+        self.listings = 0
+        self.fetched: List[str] = []
+
+    async def _get_article_urls(self) -> List[str]:
+        self.listings += 1
+        return self.urls
+
+    async def _scrape_article_with_retry(self, url: str):
+        self.fetched.append(url)
+        return await super()._scrape_article_with_retry(url)
+
+
+def make_article(url: str) -> ScrapedArticle:
+    return ScrapedArticle(
+        url=url,
+        title="NVIDIA Announces New GPU Architecture",
+        content="Article content for testing.",
+        publishDate=datetime(2024, 1, 15),
+        source="NVIDIA Newsroom",
+    )
+
+
+class TestRunJournal:
+    """Tests for RunJournal records."""
+
+    def test_resume_reads_records_and_drops_partial_line(self, tmp_path):
+        """Test that a journal cut off mid-record is loaded and stays appendable."""
+        path = tmp_path / "run.journal"
+        journal = RunJournal(str(path))
+        journal.record_run("NVIDIA Newsroom")
+        journal.record_discovered(["https://example.com/news/a", "https://example.com/news/b"])
+        journal.record_failed("https://example.com/news/a", "failed")
+        journal.record_completed(
+            "https://example.com/news/a", make_article("https://example.com/news/a")
+        )
+        journal.close()
+        with open(path, "a", encoding="utf-8") as f:
+            f.write('{"type": "completed", "url": "https://exa')
+
+        resumed = RunJournal(str(path), resume=True)
+        resumed.record_run("NVIDIA Newsroom")
+        resumed.close()
+
+        assert resumed.discovered == ["https://example.com/news/a", "https://example.com/news/b"]
+        assert resumed.pending(resumed.discovered) == ["https://example.com/news/b"]
+        assert not resumed.failed
+        assert list(resumed.articles()) == ["https://example.com/news/a"]
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert all(json.loads(line) for line in lines)
+
+    def test_resume_rejects_other_source(self, tmp_path):
+        """Test that a journal cannot be resumed by a different source."""
+        path = tmp_path / "run.journal"
+        journal = RunJournal(str(path))
+        journal.record_run("Other Source")
+        journal.close()
+
+        resumed = RunJournal(str(path), resume=True)
+        with pytest.raises(ValueError):
+            resumed.record_run("NVIDIA Newsroom")
+        resumed.close()
+
+
+class TestResume:
+    """Tests for resuming an interrupted scrape."""
+
+    @pytest.mark.asyncio
+    async def test_interrupted_run_resumes_without_refetching(self, tmp_path):
+        """Test that completed articles are replayed and only the rest are fetched."""
+        urls = [f"https://example.com/news/{i}" for i in range(6)]
+        journal = str(tmp_path / "run.journal")
+
+        first = CountingScraper(urls, concurrency=6, journal_path=journal)
+        done = []
+        async for article in first.scrape_iter():
+            done.append(str(article.url))
+            if len(done) == 2:
+                # The process dies here
+                break
+        await first.close()
+
+        second = CountingScraper(urls, concurrency=2, journal_path=journal, resume=True)
+        articles = await second.scrape()
+
+        # Later articles finish first, so the replayed ones are not a listing prefix
+        assert set(done) == {urls[4], urls[5]}
+        assert [str(a.url) for a in articles] == urls
+        assert second.listings == 0
+        assert not set(second.fetched) & set(done)
+        assert len(second.fetched) == len(urls) - len(done)
+
+    def test_resume_needs_journal(self):
+        """Test that resuming without a journal path is rejected."""
+        with pytest.raises(ValueError):
+            CountingScraper([], resume=True)
@@ -0,0 +1,68 @@
+"""
+Integration tests for newsroom listing pagination
+
+Verifies paging up to max_articles and the incremental known-URL stop condition.
+"""
+
+from typing import List
+
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+
+
+def listing_html(paths: List[str]) -> str:
+    """Build a newsroom-style listing page linking to the given paths."""
+    items = "".join(f'<article><h3><a href="{p}">Story {p}</a></h3></article>' for p in paths)
+    return f"<html><body>{items}</body></html>"
+
+
+@pytest.fixture
+def newsroom(page_server):
+    """Serve three listing pages of three articles each, then an empty page."""
+    for page in range(1, 4):
+        paths = [f"/news/story-{page}-{i}" for i in range(3)]
+        path = "/news" if page == 1 else f"/news?page={page}"
+        page_server.add(path, listing_html(paths))
+    page_server.add("/news?page=4", listing_html([]))
+    return page_server
+
+
+def make_scraper(server, **kwargs) -> NvidiaScraper:
+    return NvidiaScraper(base_url=server.base_url, **kwargs)
+
+
+class TestListingCrawl:
+    """Tests for NvidiaScraper listing page discovery."""
+
+    @pytest.mark.asyncio
+    async def test_pages_until_max_articles(self, newsroom):
+        """Test that listing pages are walked beyond the first page."""
+        async with make_scraper(newsroom, max_articles=7) as scraper:
+            urls = await scraper._get_article_urls()
+
+        assert len(urls) == 7
+        assert urls[0] == newsroom.url("/news/story-1-0")
+        assert urls[-1] == newsroom.url("/news/story-3-0")
+
+    @pytest.mark.asyncio
+    async def test_stops_at_end_of_listing(self, newsroom):
+        """Test that an empty listing page ends the crawl."""
+        async with make_scraper(newsroom, max_articles=100) as scraper:
+            urls = await scraper._get_article_urls()
+
+        assert len(urls) == 9
+
+    @pytest.mark.asyncio
+    async def test_incremental_stops_at_fully_known_page(self, newsroom):
+        """Test that only new URLs are returned and paging stops at a known page."""
+        known = [newsroom.url(f"/news/story-{p}-{i}") for p in (1, 2) for i in range(3)]
+        known.remove(newsroom.url("/news/story-1-0"))
+
+        async with make_scraper(
+            newsroom, max_articles=100, concurrency=1, incremental=True, known_urls=known
+        ) as scraper:
+            urls = await scraper._get_article_urls()
+
+        assert urls == [newsroom.url("/news/story-1-0")]
+        assert "/news?page=3" not in newsroom.hits
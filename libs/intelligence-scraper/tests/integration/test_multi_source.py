@@ -0,0 +1,175 @@
+"""
+Integration tests for the multi-source runner
+
+Verifies registry lookup, the global concurrency budget and per-source failure isolation.
+"""
+
+import json
+from typing import List
+
+import pytest
+
+from intelligence_scraper.registry import available_sources, get_scraper_class, register_scraper
+from intelligence_scraper.runner import MultiSourceRunner, SourceConfig, load_run_config
+from tests.integration.test_concurrent_scrape import FakeNvidiaScraper
+
+
+class TrackedScraper(FakeNvidiaScraper):
+    """Fake scraper that counts articles in flight across all instances."""
+
+    in_flight_total = 0
+    peak_total = 0
+
+    async def _scrape_article_with_retry(self, url: str):
+        TrackedScraper.in_flight_total += 1
+        TrackedScraper.peak_total = max(TrackedScraper.peak_total, TrackedScraper.in_flight_total)
+        try:
+            return await super()._scrape_article_with_retry(url)
+        finally:
+            TrackedScraper.in_flight_total -= 1
+
+
+class BrokenScraper(FakeNvidiaScraper):
+    """Fake scraper whose listing crawl fails."""
+
+    async def _get_article_urls(self) -> List[str]:
+        raise RuntimeError("listing unavailable")
+
+
+register_scraper("tracked", TrackedScraper)
+register_scraper("broken", BrokenScraper)
+
+
+def urls_for(prefix: str, count: int) -> List[str]:
+    return [f"https://{prefix}.example.com/news/{i}" for i in range(count)]
+
+
+class TestRegistry:
+    """Tests for scraper registration and lookup."""
+
+    def test_builtin_source_is_registered(self):
+        """Test that the NVIDIA scraper is available without plugins."""
+        assert "nvidia" in available_sources()
+        assert get_scraper_class("NVIDIA").__name__ == "NvidiaScraper"
+
+    def test_unknown_source(self):
+        """Test that unknown sources return None."""
+        assert get_scraper_class("does-not-exist") is None
+
+    def test_register_rejects_non_scrapers(self):
+        """Test that only BaseScraper subclasses can be registered."""
+        with pytest.raises(TypeError):
+            register_scraper("bad", object)
+
+
+class TestMultiSourceRunner:
+    """Tests for MultiSourceRunner."""
+
+    @pytest.mark.asyncio
+    async def test_sources_share_global_budget(self):
+        """Test that all sources together stay within the global concurrency budget."""
+        TrackedScraper.peak_total = 0
+        sources = [
+            SourceConfig(
+                name="tracked",
+                label=prefix,
+                concurrency=3,
+                options={"urls": urls_for(prefix, 5), "failing": set()},
+            )
+            for prefix in ("a", "b", "c")
+        ]
+        runner = MultiSourceRunner(sources, global_concurrency=4)
+
+        articles = [a async for a in runner.run_iter()]
+
+        assert len(articles) == 15
+        assert TrackedScraper.peak_total == 4
+        assert {key: r.scraped for key, r in runner.results.items()} == {"a": 5, "b": 5, "c": 5}
+
+    @pytest.mark.asyncio
+    async def test_failing_source_does_not_stop_others(self):
+        """Test that one source failing is reported while the others complete."""
+        sources = [
+            SourceConfig(name="broken", options={"urls": [], "failing": set()}),
+            SourceConfig(name="tracked", options={"urls": urls_for("ok", 3), "failing": set()}),
+        ]
+        runner = MultiSourceRunner(sources, global_concurrency=2)
+
+        articles = [a async for a in runner.run_iter()]
+
+        assert len(articles) == 3
+        assert "listing unavailable" in runner.results["broken"].error
+        assert runner.results["tracked"].error is None
+
+    def test_unknown_source_rejected(self):
+        """Test that the runner refuses sources missing from the registry."""
+        with pytest.raises(ValueError):
+            MultiSourceRunner([SourceConfig(name="does-not-exist")])
+
+    def test_duplicate_source_rejected(self):
+        """Test that two sources reported under the same key are refused."""
+        with pytest.raises(ValueError, match="Duplicate source 'nvidia'"):
+            MultiSourceRunner([SourceConfig(name="nvidia"), SourceConfig(name="nvidia")])
+
+
+class TestRunConfig:
+    """Tests for load_run_config."""
+
+    def test_load_json_config(self, tmp_path):
+        """Test that a JSON config is parsed into source settings."""
+        path = tmp_path / "sources.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "concurrency": 6,
+                    "sources": ["nvidia", {"name": "nvidia", "label": "nv2", "max_articles": 5}],
+                }
+            )
+        )
+
+        config = load_run_config(str(path))
+
+        assert config.concurrency == 6
+        assert [s.key for s in config.sources] == ["nvidia", "nv2"]
+        assert config.sources[1].max_articles == 5
+
+    def test_unknown_source_in_config(self, tmp_path):
+        """Test that configs naming unregistered sources are rejected."""
+        path = tmp_path / "sources.json"
+        path.write_text(json.dumps({"sources": [{"name": "nope"}]}))
+
+        with pytest.raises(ValueError, match="unknown source"):
+            load_run_config(str(path))
+
+    def test_duplicate_source_in_config(self, tmp_path):
+        """Test that a source listed twice without distinct labels is rejected."""
+        path = tmp_path / "sources.json"
+        path.write_text(json.dumps({"sources": ["nvidia", {"name": "nvidia", "max_articles": 5}]}))
+
+        with pytest.raises(ValueError, match="listed more than once"):
+            load_run_config(str(path))
+
+    def test_unknown_key_in_config(self, tmp_path):
+        """Test that a misspelled source key is rejected with the entry it is in."""
+        path = tmp_path / "sources.json"
+        path.write_text(json.dumps({"sources": ["nvidia", {"name": "nvidia", "max_article": 5}]}))
+
+        with pytest.raises(ValueError, match=r"sources\[1\]: unknown key\(s\) max_article"):
+            load_run_config(str(path))
+
+    def test_non_mapping_entry_in_config(self, tmp_path):
+        """Test that a source entry that is neither a name nor a mapping is rejected."""
+        path = tmp_path / "sources.json"
+        path.write_text(json.dumps({"sources": [["nvidia"]]}))
+
+        with pytest.raises(ValueError, match=r"sources\[0\]: expected a source name or mapping"):
+            load_run_config(str(path))
+
+    def test_invalid_yaml_config(self, tmp_path):
+        """Test that malformed YAML is reported as a ValueError."""
+        pytest.importorskip("yaml")
+        path = tmp_path / "sources.yaml"
+        path.write_text("sources: [nvidia\n")
+
+        with pytest.raises(ValueError, match="invalid YAML"):
+            load_run_config(str(path))
@@ -0,0 +1,124 @@
+"""
+Integration tests for network-capture extraction
+
+Verifies reading article fields from captured XHR/fetch JSON payloads.
+"""
+
+from dataclasses import replace
+
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.utils.network_capture import (
+    PayloadCapture,
+    article_from_payload,
+    capture_article,
+    html_to_text,
+    json_path,
+)
+from intelligence_scraper.utils.page_load import PageLoadStats, ResourcePolicy
+from tests.integration.test_page_load import FakePage
+
+PAYLOAD = {
+    "data": {
+        "article": {
+            "headline": "NVIDIA Announces New GPU Architecture",
+            "publishedAt": "2024-03-18",
+            "blocks": [
+                {"html": "<p>SANTA CLARA — NVIDIA today announced <b>Blackwell</b>.</p>"},
+                {"html": "<p>It delivers faster inference.<br>Available now.</p>"},
+            ],
+        }
+    }
+}
+
+CAPTURE = PayloadCapture(
+    url_pattern=r"/api/articles/",
+    title_path="data.article.headline",
+    content_path="data.article.blocks.0.html",
+    date_path="data.article.publishedAt",
+)
+
+
+class TestPayloadParsing:
+    """Tests for payload field lookup and HTML flattening."""
+
+    def test_json_path(self):
+        """Test keys, list indexes and missing steps."""
+        assert json_path(PAYLOAD, "data.article.publishedAt") == "2024-03-18"
+        assert json_path(PAYLOAD, "data.article.blocks.-1.html").startswith("<p>It")
+        assert json_path(PAYLOAD, "data.article.blocks.5.html") is None
+        assert json_path(PAYLOAD, "data.missing.title") is None
+        assert json_path(PAYLOAD, None) is None
+
+    def test_html_to_text_keeps_paragraphs(self):
+        """Test that block elements become paragraphs and markup is dropped."""
+        text = html_to_text(
+            "<h2>Intro</h2><p>First <a href='#'>link</a> text</p>"
+            "<script>track()</script><ul><li>One</li><li>Two</li></ul>Tail<br>line"
+        )
+
+        assert text == "Intro\n\nFirst link text\n\nOne\n\nTwo\n\nTail line"
+
+    def test_article_from_payload(self):
+        """Test that title, body and date are read from configured paths."""
+        article = article_from_payload(PAYLOAD, CAPTURE, "https://example.com/api/articles/1")
+
+        assert article.title == "NVIDIA Announces New GPU Architecture"
+        assert article.content == "SANTA CLARA — NVIDIA today announced Blackwell."
+        assert article.publish_date == "2024-03-18"
+
+    def test_payload_without_body_ignored(self):
+        """Test that unrelated JSON responses are not taken for the article."""
+        assert article_from_payload({"user": {"id": 1}}, CAPTURE, "https://example.com/api") is None
+
+    def test_url_pattern(self):
+        """Test response URL matching."""
+        assert CAPTURE.matches("https://example.com/api/articles/42?lang=en")
+        assert not CAPTURE.matches("https://example.com/api/nav")
+
+
+class TestCapturedArticle:
+    """Tests for articles built from captured payloads."""
+
+    def test_scraper_builds_article_from_payload(self):
+        """Test that captured fields become an article with capture metadata."""
+        scraper = NvidiaScraper(payload_capture=CAPTURE)
+        captured = article_from_payload(PAYLOAD, CAPTURE, "https://example.com/api/articles/1")
+
+        article = scraper._build_captured_article(
+            "https://example.com/news/gpu", captured, PageLoadStats(requests=3)
+        )
+
+        assert article.title == "NVIDIA Announces New GPU Architecture"
+        assert article.publishDate.year == 2024
+        assert article.metadata["scraperMethod"] == "playwright_capture"
+        assert article.metadata["payloadUrl"] == "https://example.com/api/articles/1"
+        assert article.metadata["pageLoad"]["requests"] == 3
+
+
+class TestCaptureArticle:
+    """Tests for capturing the payload while a page loads."""
+
+    @pytest.mark.asyncio
+    async def test_cross_site_payload_not_blocked(self):
+        """Test that an article API on another site gets through third-party blocking."""
+        page_url = "https://news.example.com/stories/gpu"
+        api_url = "https://cms.example-api.net/api/articles/1"
+        page = FakePage(
+            [
+                (page_url, "document", "2000"),
+                (api_url, "fetch", "800"),
+                ("https://tracker.example.org/t.js", "script", "300"),
+            ],
+            payloads={api_url: PAYLOAD},
+        )
+
+        captured, stats = await capture_article(
+            page, page_url, replace(CAPTURE, wait_ms=100), ResourcePolicy(), timeout_ms=1000
+        )
+
+        assert captured is not None
+        assert captured.payload_url == api_url
+        assert stats.blocked == 1
+        assert stats.blocked_by_type == {"script": 1}
@@ -0,0 +1,190 @@
+"""
+Integration tests for the Playwright page-load policy
+
+Verifies which requests a ResourcePolicy blocks and the counters load_page
+reports for article metadata, using a fake page instead of Chromium.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+import pytest
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from intelligence_scraper.utils.page_load import ResourcePolicy, load_page
+
+PAGE_URL = "https://nvidianews.nvidia.com/news/gpu"
+
+
+class FakeRequest:
+    def __init__(self, url: str, resource_type: str):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeResponse:
+    def __init__(self, request: FakeRequest, length: Optional[str], body: Optional[dict] = None):
+        self.request = request
+        self.url = request.url
+        self.ok = True
+        self.headers = {"content-length": length} if length is not None else {}
+        self.body = body
+
+    async def json(self) -> dict:
+        if self.body is None:
+            raise ValueError("not JSON")
+        return self.body
+
+
+class FakeRoute:
+    def __init__(self, request: FakeRequest):
+        self.request = request
+        self.aborted = False
+
+    async def abort(self) -> None:
+        self.aborted = True
+
+    async def continue_(self) -> None:
+        pass
+
+
+class FakePage:
+    """Playwright page stand-in that issues a fixed list of requests on goto."""
+
+    def __init__(
+        self,
+        requests: List[Tuple[str, str, Optional[str]]],
+        payloads: Optional[Dict[str, dict]] = None,
+        ready: bool = True,
+    ):
+        # (url, resource type, content-length header), and JSON bodies by URL
+        self.requests = requests
+        self.payloads = payloads or {}
+        self.listeners: Dict[str, list] = {}
+        self.route_handler = None
+        self.wait_until: Optional[str] = None
+        self.selectors: List[str] = []
+        self.ready = ready
+
+    async def route(self, pattern, handler) -> None:
+        self.route_handler = handler
+
+    def on(self, event: str, handler) -> None:
+        self.listeners.setdefault(event, []).append(handler)
+
+    async def goto(self, url: str, timeout: float, wait_until: str) -> None:
+        self.wait_until = wait_until
+        for request_url, resource_type, length in self.requests:
+            request = FakeRequest(request_url, resource_type)
+            for handler in self.listeners.get("request", []):
+                handler(request)
+            if self.route_handler is not None:
+                route = FakeRoute(request)
+                await self.route_handler(route)
+                if route.aborted:
+                    continue
+            for handler in self.listeners.get("response", []):
+                handler(FakeResponse(request, length, self.payloads.get(request_url)))
+
+    async def wait_for_selector(self, selector: str, timeout: float) -> None:
+        self.selectors.append(selector)
+        if not self.ready:
+            raise PlaywrightTimeout(f"waiting for {selector} timed out")
+
+
+class TestResourcePolicy:
+    """Tests for ResourcePolicy blocking decisions."""
+
+    def test_blocked_resource_types(self):
+        """Test that heavy resource types are blocked but the navigation never is."""
+        policy = ResourcePolicy(blocked_resource_types=frozenset({"image", "document"}))
+        host = "nvidianews.nvidia.com"
+
+        assert policy.should_block("image", "https://nvidianews.nvidia.com/a.png", host)
+        assert not policy.should_block("document", PAGE_URL, host)
+        assert not policy.should_block("stylesheet", "https://nvidianews.nvidia.com/a.css", host)
+
+    def test_third_party_hosts(self):
+        """Test that other sites are blocked while subdomains and allowed hosts load."""
+        policy = ResourcePolicy(allowed_hosts=frozenset({"cdn.example.net"}))
+        host = "nvidianews.nvidia.com"
+
+        assert policy.should_block("script", "https://tracker.example.com/t.js", host)
+        assert not policy.should_block("script", "https://images.nvidia.com/app.js", host)
+        assert not policy.should_block("script", "https://cdn.example.net/lib.js", host)
+        assert not ResourcePolicy(block_third_party=False).should_block(
+            "script", "https://tracker.example.com/t.js", host
+        )
+
+    def test_full_blocks_nothing(self):
+        """Test that the full policy loads everything and waits for network idle."""
+        policy = ResourcePolicy.full()
+
+        assert not policy.intercepts
+        assert policy.wait_until == "networkidle"
+        assert not policy.should_block(
+            "image", "https://tracker.example.com/a.png", "nvidianews.nvidia.com"
+        )
+
+    def test_invalid_wait_mode_rejected(self):
+        """Test that an unknown wait_until is rejected."""
+        with pytest.raises(ValueError):
+            ResourcePolicy(wait_until="idle")
+
+
+class TestLoadPage:
+    """Tests for the counters load_page reports."""
+
+    @pytest.mark.asyncio
+    async def test_counters(self):
+        """Test request, blocked and byte counts for one page load."""
+        page = FakePage(
+            [
+                (PAGE_URL, "document", "2000"),
+                ("https://nvidianews.nvidia.com/app.js", "script", "500"),
+                ("https://nvidianews.nvidia.com/hero.jpg", "image", "90000"),
+                ("https://nvidianews.nvidia.com/font.woff2", "font", "30000"),
+                ("https://tracker.example.com/t.js", "script", "700"),
+                ("https://nvidianews.nvidia.com/chunked.js", "script", None),
+            ]
+        )
+        policy = ResourcePolicy(ready_selector="h1")
+
+        stats = await load_page(page, PAGE_URL, policy, timeout_ms=1000)
+        data = stats.to_dict()
+
+        assert data["requests"] == 6
+        assert data["blocked"] == 3
+        assert data["blocked_by_type"] == {"image": 1, "font": 1, "script": 1}
+        assert data["bytes_downloaded"] == 2500
+        assert data["load_ms"] >= 0
+        assert page.wait_until == "domcontentloaded"
+        assert page.selectors == ["h1"]
+        assert not data["ready_timed_out"]
+
+    @pytest.mark.asyncio
+    async def test_missing_ready_selector_falls_back(self):
+        """Test that a page without the ready selector is still returned as loaded."""
+        page = FakePage([(PAGE_URL, "document", "2000")], ready=False)
+        policy = ResourcePolicy(ready_selector="article")
+
+        stats = await load_page(page, PAGE_URL, policy, timeout_ms=1000)
+
+        assert page.selectors == ["article"]
+        assert stats.ready_timed_out
+        assert stats.bytes_downloaded == 2000
+
+    @pytest.mark.asyncio
+    async def test_full_policy_not_routed(self):
+        """Test that the full policy loads every request without routing."""
+        page = FakePage(
+            [
+                (PAGE_URL, "document", "2000"),
+                ("https://nvidianews.nvidia.com/hero.jpg", "image", "90000"),
+            ]
+        )
+
+        stats = await load_page(page, PAGE_URL, ResourcePolicy.full(), timeout_ms=1000)
+
+        assert page.route_handler is None
+        assert stats.blocked == 0
+        assert stats.bytes_downloaded == 92000
@@ -0,0 +1,165 @@
+"""
+Integration tests for the Playwright fallback
+
+Runs NvidiaScraper._scrape_with_playwright against a fake browser pool, so the
+rendering path is exercised without Chromium.
+"""
+
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.utils import telemetry
+from intelligence_scraper.utils.network_capture import PayloadCapture
+
+PAGE_URL = "https://nvidianews.nvidia.com/news/gpu"
+ARTICLE_TEXT = (
+    "NVIDIA Announces New GPU Architecture\n\n"
+    "NVIDIA today announced a new GPU architecture designed to accelerate AI."
+)
+
+
+class FakeElement:
+    """Element handle returning fixed text."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+    async def inner_text(self) -> str:
+        return self.text
+
+
+class FakeRequest:
+    def __init__(self, url: str, resource_type: str):
+        self.url = url
+        self.resource_type = resource_type
+
+
+class FakeResponse:
+    def __init__(self, url: str, resource_type: str, body: Optional[dict] = None):
+        self.url = url
+        self.request = FakeRequest(url, resource_type)
+        self.ok = True
+        self.headers = {"content-length": "100"}
+        self.body = body
+
+    async def json(self) -> dict:
+        if self.body is None:
+            raise ValueError("not JSON")
+        return self.body
+
+
+class FakePage:
+    """Playwright page stand-in that 'loads' by firing its listeners."""
+
+    def __init__(self, responses: List[FakeResponse]):
+        self.responses = responses
+        self.listeners: Dict[str, list] = {}
+        self.routes = 0
+        self.gotos: List[str] = []
+
+    async def route(self, pattern, handler) -> None:
+        self.routes += 1
+
+    def on(self, event: str, handler) -> None:
+        self.listeners.setdefault(event, []).append(handler)
+
+    async def goto(self, url: str, timeout: float, wait_until: str) -> None:
+        self.gotos.append(url)
+        for response in self.responses:
+            for handler in self.listeners.get("request", []):
+                handler(response.request)
+            for handler in self.listeners.get("response", []):
+                handler(response)
+
+    async def wait_for_selector(self, selector: str, timeout: float) -> None:
+        pass
+
+    async def content(self) -> str:
+        return f"<html><body>{ARTICLE_TEXT}</body></html>"
+
+    async def inner_text(self, selector: str) -> str:
+        return ARTICLE_TEXT
+
+    async def query_selector(self, selector: str) -> FakeElement:
+        return FakeElement("NVIDIA Announces New GPU Architecture")
+
+
+class FakeBrowserPool:
+    """Browser pool handing out fake pages."""
+
+    def __init__(self, responses: Optional[List[FakeResponse]] = None):
+        self.responses = responses or []
+        self.pages: List[FakePage] = []
+
+    @asynccontextmanager
+    async def page(self):
+        page = FakePage(self.responses)
+        self.pages.append(page)
+        yield page
+
+    async def close(self) -> None:
+        pass
+
+
+class TestPlaywrightFallback:
+    """Tests for scraping pages with the browser pool."""
+
+    @pytest.mark.asyncio
+    async def test_rendered_page_scraped(self):
+        """Test that a rendered page becomes an article with Playwright stage timing."""
+        scraper = NvidiaScraper()
+        pool = FakeBrowserPool([FakeResponse(PAGE_URL, "document")])
+        scraper._browser_pool = pool
+
+        with telemetry.track_article() as article_telemetry:
+            article = await scraper._scrape_with_playwright(PAGE_URL)
+
+        assert article is not None
+        assert article.title == "NVIDIA Announces New GPU Architecture"
+        assert article.metadata["scraperMethod"] == "playwright"
+        assert article.metadata["pageLoad"]["requests"] == 1
+        assert telemetry.PLAYWRIGHT in article_telemetry.stages_ms
+        assert article_telemetry.bytes[telemetry.PLAYWRIGHT] == 100
+        assert pool.pages[0].gotos == [PAGE_URL]
+
+    @pytest.mark.asyncio
+    async def test_captured_payload_used(self):
+        """Test that a matching XHR payload becomes the article without rendering."""
+        capture = PayloadCapture(url_pattern=r"/api/article", content_path="body")
+        payload = {"title": "Captured Headline", "body": "<p>Captured article body text.</p>"}
+        scraper = NvidiaScraper(payload_capture=capture)
+        pool = FakeBrowserPool(
+            [
+                FakeResponse(PAGE_URL, "document"),
+                FakeResponse("https://nvidianews.nvidia.com/api/article", "fetch", payload),
+            ]
+        )
+        scraper._browser_pool = pool
+
+        article = await scraper._scrape_with_playwright(PAGE_URL)
+
+        assert article.metadata["scraperMethod"] == "playwright_capture"
+        assert article.title == "Captured Headline"
+        assert len(pool.pages) == 1
+
+    @pytest.mark.asyncio
+    async def test_capture_miss_renders_on_fresh_page(self):
+        """Test that a missing payload costs only the capture wait, then renders anew."""
+        capture = PayloadCapture(url_pattern=r"/api/article", wait_ms=50)
+        scraper = NvidiaScraper(payload_capture=capture, timeout=30)
+        pool = FakeBrowserPool([FakeResponse(PAGE_URL, "document")])
+        scraper._browser_pool = pool
+
+        started = time.perf_counter()
+        article = await scraper._scrape_with_playwright(PAGE_URL)
+        elapsed = time.perf_counter() - started
+
+        assert article.metadata["scraperMethod"] == "playwright"
+        assert elapsed < 1
+        assert len(pool.pages) == 2
+        assert [page.gotos for page in pool.pages] == [[PAGE_URL], [PAGE_URL]]
+        assert [page.routes for page in pool.pages] == [1, 1]
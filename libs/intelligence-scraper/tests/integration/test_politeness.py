@@ -0,0 +1,108 @@
+"""
+Integration tests for the per-host politeness scheduler
+
+Verifies token-bucket pacing, robots.txt crawl delay and adaptive slow-down.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from intelligence_scraper.utils.http import ConnectionStats, create_http_client
+from intelligence_scraper.utils.politeness import PolitenessScheduler, parse_retry_after
+
+
+class TestPolitenessScheduler:
+    """Tests for PolitenessScheduler pacing."""
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_paces_one_host(self):
+        """Test that requests beyond the burst wait for tokens."""
+        scheduler = PolitenessScheduler(requests_per_second=20, burst=2)
+
+        started = time.monotonic()
+        await asyncio.gather(*(scheduler.acquire("https://a.example/x") for _ in range(6)))
+        elapsed = time.monotonic() - started
+
+        # 2 immediate, then 4 more at 20/s
+        assert elapsed >= 0.18
+        stats = scheduler.stats()["https://a.example"]
+        assert stats["requests"] == 6
+        assert stats["max_wait_ms"] > 0
+
+    @pytest.mark.asyncio
+    async def test_hosts_are_paced_independently(self):
+        """Test that a slow host does not hold up another."""
+        scheduler = PolitenessScheduler(requests_per_second=1)
+        await scheduler.acquire("https://slow.example/1")
+
+        waited = await scheduler.acquire("https://fast.example/1")
+
+        assert waited < 0.05
+
+    def test_throttle_halves_rate_and_recovers(self):
+        """Test that 429 slows a host and successes bring it back to the limit."""
+        scheduler = PolitenessScheduler(requests_per_second=4)
+        url = "https://a.example/x"
+
+        scheduler.record_response(url, 429, None)
+        assert scheduler.host(url).rate == 2
+
+        for _ in range(50):
+            scheduler.record_response(url, 200, None)
+        assert scheduler.host(url).rate == 4
+        assert scheduler.stats()["https://a.example"]["throttled"] == 1
+
+    def test_unlimited_host_gets_limited_on_503(self):
+        """Test that a host without a fixed limit is paced after it pushes back."""
+        scheduler = PolitenessScheduler(throttled_rate=2.0)
+        url = "https://a.example/x"
+
+        scheduler.record_response(url, 503, None)
+
+        assert scheduler.host(url).rate == 2.0
+
+    def test_parse_retry_after(self):
+        """Test both Retry-After forms."""
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:05 GMT", now=1445412480) == 5.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+
+class TestPoliteTransport:
+    """Tests for pacing through the shared HTTP client."""
+
+    @pytest.mark.asyncio
+    async def test_retry_after_delays_next_request(self, page_server):
+        """Test that Retry-After holds back the following request to the host."""
+        page_server.add("/busy", "busy", status=429, headers={"Retry-After": "1"})
+        page_server.add("/page", "ok")
+        scheduler = PolitenessScheduler()
+
+        async with create_http_client(
+            timeout=5, stats=ConnectionStats(), scheduler=scheduler
+        ) as client:
+            assert (await client.get(page_server.url("/busy"))).status_code == 429
+            started = time.monotonic()
+            assert (await client.get(page_server.url("/page"))).status_code == 200
+
+        assert time.monotonic() - started >= 0.9
+
+    @pytest.mark.asyncio
+    async def test_robots_request_rate(self, page_server):
+        """Test that robots.txt Request-rate spaces requests to the host."""
+        page_server.add("/robots.txt", "User-agent: *\nRequest-rate: 5/1\n")
+        page_server.add("/page", "ok")
+        scheduler = PolitenessScheduler(respect_robots=True)
+
+        async with create_http_client(
+            timeout=5, stats=ConnectionStats(), scheduler=scheduler
+        ) as client:
+            started = time.monotonic()
+            for _ in range(3):
+                await client.get(page_server.url("/page"))
+
+        assert time.monotonic() - started >= 0.4
+        assert page_server.hits["/robots.txt"] == 1
@@ -0,0 +1,91 @@
+"""
+Integration tests for pre-extraction HTML pruning
+
+Verifies which markup is removed and that pruning leaves extraction output unchanged.
+"""
+
+import json
+
+import lxml.html
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.utils.extraction import extract_article
+from intelligence_scraper.utils.pruning import PruneRules, prune_html
+from tests.integration.conftest import ARTICLE_HTML
+
+JSON_LD = json.dumps(
+    {"@type": "NewsArticle", "datePublished": "2024-03-18", "author": "NVIDIA Newsroom"}
+)
+
+HEAVY_HTML = ARTICLE_HTML.replace(
+    "</head>",
+    f'<script type="application/ld+json">{JSON_LD}</script>'
+    "<style>.x { color: red }</style><script>var tracking = 1;</script></head>",
+).replace(
+    "</body>",
+    "<svg><path d='M0 0'/></svg><noscript>Enable JavaScript</noscript>"
+    "<div class='cookie-banner'>We use cookies</div>"
+    "<footer>Copyright NVIDIA</footer></body>",
+)
+
+
+def tags(tree) -> set:
+    return {element.tag for element in tree.iter() if isinstance(element.tag, str)}
+
+
+class TestPruneHtml:
+    """Tests for prune_html."""
+
+    def test_boilerplate_removed_and_json_ld_kept(self):
+        """Test that default rules drop boilerplate but keep structured data."""
+        tree = prune_html(HEAVY_HTML, PruneRules())
+
+        assert not tags(tree) & {"style", "svg", "noscript", "nav", "footer"}
+        scripts = tree.findall(".//script")
+        assert [s.get("type") for s in scripts] == ["application/ld+json"]
+        assert "NVIDIA Announces New GPU Architecture" in lxml.html.tostring(
+            tree, encoding="unicode"
+        )
+
+    def test_site_xpaths_removed(self):
+        """Test that configured XPath selectors are pruned, keeping following text."""
+        html = "<html><body><div><p class='ad'>Ad</p>tail text<p>Body</p></div></body></html>"
+
+        tree = prune_html(html, PruneRules(xpaths=("//p[@class='ad']",)))
+
+        text = tree.text_content()
+        assert "Ad" not in text
+        assert "tail text" in text and "Body" in text
+
+    def test_none_rules_disabled(self):
+        """Test that PruneRules.none() removes nothing."""
+        assert not PruneRules.none().enabled
+
+
+class TestPrunedExtraction:
+    """Tests for extraction from pruned pages."""
+
+    def test_output_parity(self):
+        """Test that pruning does not change the extracted article or its metadata."""
+        full = extract_article(HEAVY_HTML)
+        pruned = extract_article(HEAVY_HTML, PruneRules(xpaths=("//div[@class='cookie-banner']",)))
+
+        assert pruned.content == full.content
+        assert pruned.title == full.title
+        assert pruned.publish_date == full.publish_date == "2024-03-18"
+        assert pruned.author == full.author
+
+    @pytest.mark.asyncio
+    async def test_scraper_prunes_configured_selectors(self, page_server):
+        """Test that scraper-level XPath selectors reach the extraction workers."""
+        page = HEAVY_HTML.replace(
+            "</article>", "<p class='promo'>Subscribe to our newsletter today.</p></article>"
+        )
+        page_server.add("/news/gpu", page)
+
+        async with NvidiaScraper(prune_xpaths=["//p[@class='promo']"]) as scraper:
+            article = await scraper._scrape_article(page_server.url("/news/gpu"))
+
+        assert "NVIDIA" in article.content
+        assert "newsletter" not in article.content
@@ -0,0 +1,89 @@
+"""
+Integration tests for streamed response limits
+
+Verifies early aborts on non-HTML and oversized responses and incremental decoding.
+"""
+
+import httpx
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.utils.http import (
+    SKIP_CONTENT_TYPE,
+    SKIP_TOO_LARGE,
+    ResponseSkipped,
+    read_html_body,
+)
+from tests.integration.conftest import ARTICLE_HTML
+
+
+def chunked_response(chunks, content_type="text/html; charset=utf-8") -> httpx.Response:
+    async def _stream():
+        for chunk in chunks:
+            yield chunk
+
+    return httpx.Response(200, headers={"Content-Type": content_type}, content=_stream())
+
+
+class TestReadHtmlBody:
+    """Tests for read_html_body."""
+
+    @pytest.mark.asyncio
+    async def test_multibyte_characters_split_across_chunks(self):
+        """Test that decoding is incremental and keeps split UTF-8 sequences intact."""
+        encoded = "<p>Jensen Huang – 黄仁勋</p>".encode("utf-8")
+        chunks = [encoded[start:][:3] for start in range(0, len(encoded), 3)]
+
+        body = await read_html_body(chunked_response(chunks))
+
+        assert body.text == "<p>Jensen Huang – 黄仁勋</p>"
+        assert body.size == len(encoded)
+
+    @pytest.mark.asyncio
+    async def test_stream_aborts_past_byte_cap(self):
+        """Test that reading stops once the body grows past the cap."""
+        read = []
+
+        async def _stream():
+            for i in range(100):
+                read.append(i)
+                yield b"x" * 1000
+
+        response = httpx.Response(200, headers={"Content-Type": "text/html"}, content=_stream())
+
+        with pytest.raises(ResponseSkipped) as excinfo:
+            await read_html_body(response, max_bytes=5000)
+
+        assert excinfo.value.reason == SKIP_TOO_LARGE
+        assert len(read) == 6
+
+    @pytest.mark.asyncio
+    async def test_non_html_rejected_before_reading(self):
+        """Test that a PDF is rejected from its headers alone."""
+        with pytest.raises(ResponseSkipped) as excinfo:
+            await read_html_body(chunked_response([b"%PDF-1.7"], "application/pdf"))
+
+        assert excinfo.value.reason == SKIP_CONTENT_TYPE
+
+
+class TestScraperResponseLimits:
+    """Tests for skip reasons recorded by the scraper."""
+
+    @pytest.mark.asyncio
+    async def test_skipped_pages_recorded_without_browser_fallback(self, page_server):
+        """Test that PDFs and oversized pages are skipped with their reason."""
+        page_server.add("/news/report", "%PDF-1.7", headers={"Content-Type": "application/pdf"})
+        page_server.add("/news/huge", "<html>" + "x" * 5000 + "</html>")
+        page_server.add("/news/gpu", ARTICLE_HTML)
+
+        async with NvidiaScraper(max_response_bytes=4000) as scraper:
+            pdf = await scraper._scrape_article_with_retry(page_server.url("/news/report"))
+            huge = await scraper._scrape_article_with_retry(page_server.url("/news/huge"))
+            ok = await scraper._scrape_article_with_retry(page_server.url("/news/gpu"))
+
+        assert pdf is None and huge is None and ok is not None
+        assert scraper.skipped_urls == {
+            page_server.url("/news/report"): SKIP_CONTENT_TYPE,
+            page_server.url("/news/huge"): SKIP_TOO_LARGE,
+        }
+        assert page_server.hits["/news/report"] == 1
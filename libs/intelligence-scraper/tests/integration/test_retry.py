@@ -0,0 +1,231 @@
+"""
+Integration tests for the retry policy and circuit breaker
+
+Verifies failure classification, backoff and fail-fast skipping of dead hosts.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import httpx
+import pytest
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeout
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.utils.retry import (
+    CLIENT_ERROR,
+    CLOSED,
+    CONNECT,
+    HALF_OPEN,
+    OPEN,
+    SERVER_ERROR,
+    THROTTLED,
+    TIMEOUT,
+    CircuitBreaker,
+    NavigationError,
+    RetryPolicy,
+    classify_error,
+)
+from intelligence_scraper.utils.strategy import PLAYWRIGHT
+from tests.integration.test_playwright_fallback import FakeBrowserPool, FakePage
+
+
+def status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://example.com/a")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status, request=request)
+    )
+
+
+class HangingPage(FakePage):
+    """Page whose navigation times out, as on a host that accepts but never answers."""
+
+    async def goto(self, url: str, timeout: float, wait_until: str) -> None:
+        self.gotos.append(url)
+        raise PlaywrightTimeout(f"Timeout {timeout}ms exceeded.")
+
+
+class UnreachablePage(FakePage):
+    """Page whose navigation fails at the network level."""
+
+    async def goto(self, url: str, timeout: float, wait_until: str) -> None:
+        self.gotos.append(url)
+        raise PlaywrightError(f"net::ERR_CONNECTION_REFUSED at {url}")
+
+
+class FailingBrowserPool(FakeBrowserPool):
+    """Browser pool handing out pages that fail to navigate."""
+
+    def __init__(self, page_class: type):
+        super().__init__()
+        self.page_class = page_class
+
+    @asynccontextmanager
+    async def page(self):
+        page = self.page_class(self.responses)
+        self.pages.append(page)
+        yield page
+
+
+class TestRetryPolicy:
+    """Tests for classification and backoff."""
+
+    def test_classify_error(self):
+        """Test that failures are sorted into host and page problems."""
+        assert classify_error(httpx.ReadTimeout("slow")) == TIMEOUT
+        assert classify_error(httpx.ConnectError("refused")) == CONNECT
+        assert classify_error(status_error(503)) == SERVER_ERROR
+        assert classify_error(status_error(429)) == THROTTLED
+        assert classify_error(status_error(404)) == CLIENT_ERROR
+        assert classify_error(PlaywrightTimeout("Timeout 30000ms exceeded")) == TIMEOUT
+        assert classify_error(NavigationError("net::ERR_CONNECTION_REFUSED")) == CONNECT
+
+    def test_client_errors_not_retried(self):
+        """Test that 4xx failures give up while timeouts retry until the limit."""
+        policy = RetryPolicy(max_attempts=3)
+
+        assert not policy.should_retry(CLIENT_ERROR, 1)
+        assert policy.should_retry(TIMEOUT, 2)
+        assert not policy.should_retry(TIMEOUT, 3)
+
+    def test_backoff_is_jittered_and_capped(self):
+        """Test that delays stay within the exponential cap."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+
+        delays = [policy.backoff(10) for _ in range(50)]
+
+        assert all(0 <= d <= 5.0 for d in delays)
+        assert len(set(delays)) > 1
+
+
+class TestCircuitBreaker:
+    """Tests for per-host circuit state transitions."""
+
+    def test_opens_then_half_opens_and_recovers(self, monkeypatch):
+        """Test closed -> open -> half-open -> closed."""
+        clock = [100.0]
+        monkeypatch.setattr("intelligence_scraper.utils.retry.time.monotonic", lambda: clock[0])
+        breaker = CircuitBreaker(failure_threshold=0.5, min_calls=4, reset_timeout=10)
+        url = "https://down.example/a"
+
+        for success in (True, False, False, True):
+            assert breaker.allow(url)
+            breaker.record(url, success)
+        assert breaker.state(url) == OPEN
+        assert not breaker.allow(url)
+        assert breaker.allow("https://other.example/a")
+
+        clock[0] += 10
+        assert breaker.allow(url)
+        assert breaker.state(url) == HALF_OPEN
+        assert not breaker.allow(url)  # one probe at a time
+
+        breaker.record(url, True)
+        assert breaker.state(url) == CLOSED
+
+    def test_failed_probe_reopens(self, monkeypatch):
+        """Test that a failing half-open probe opens the circuit again."""
+        clock = [0.0]
+        monkeypatch.setattr("intelligence_scraper.utils.retry.time.monotonic", lambda: clock[0])
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=5)
+        url = "https://down.example/a"
+
+        breaker.record(url, False)
+        clock[0] += 5
+        assert breaker.allow(url)
+        breaker.record(url, False)
+
+        assert breaker.state(url) == OPEN
+
+    def test_released_probe_lets_next_probe_through(self, monkeypatch):
+        """Test that an abandoned half-open probe does not block the host."""
+        clock = [0.0]
+        monkeypatch.setattr("intelligence_scraper.utils.retry.time.monotonic", lambda: clock[0])
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=5)
+        url = "https://down.example/a"
+
+        breaker.record(url, False)
+        clock[0] += 5
+        assert breaker.allow(url)
+        breaker.release(url)
+
+        assert breaker.allow(url)
+
+
+class TestScraperRetry:
+    """Tests for retry and fail-fast behaviour in NvidiaScraper."""
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_released(self):
+        """Test that a half-open probe cut off by the deadline does not block the host."""
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=0)
+        url = "https://down.example/news/a"
+        breaker.record(url, False)
+
+        class HangingScraper(NvidiaScraper):
+            async def _scrape_article(self, url):
+                await asyncio.sleep(10)
+
+        scraper = HangingScraper(circuit_breaker=breaker, deadline=0.05)
+        scraper._start_run()
+        result = await scraper._run_before_deadline(
+            url, lambda: scraper._scrape_article_with_retry(url)
+        )
+
+        assert result is None
+        assert scraper.skipped_urls[url] == "deadline"
+        assert breaker.state(url) == HALF_OPEN
+        assert breaker.allow(url)
+
+    @pytest.mark.asyncio
+    async def test_not_found_is_not_retried(self, page_server):
+        """Test that a 404 costs one request and no retries."""
+        page_server.add("/news/gone", "missing", status=404)
+        scraper = NvidiaScraper(retry_policy=RetryPolicy(max_attempts=3, base_delay=0))
+
+        async with scraper:
+            assert await scraper._scrape_article_with_retry(page_server.url("/news/gone")) is None
+
+        assert page_server.hits["/news/gone"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failing_host_is_skipped_once_circuit_opens(self, page_server):
+        """Test that articles after the circuit opens are skipped without requests."""
+        for i in range(6):
+            page_server.add(f"/news/{i}", "down", status=500)
+        scraper = NvidiaScraper(
+            retry_policy=RetryPolicy(max_attempts=2, base_delay=0),
+            circuit_breaker=CircuitBreaker(min_calls=3, reset_timeout=60),
+        )
+
+        async with scraper:
+            for i in range(6):
+                assert (
+                    await scraper._scrape_article_with_retry(page_server.url(f"/news/{i}")) is None
+                )
+
+        assert sum(page_server.hits.values()) == 3
+        assert len(scraper.skipped_urls) == 5
+        assert set(scraper.skipped_urls.values()) == {"circuit_open"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("page_class", [HangingPage, UnreachablePage])
+    async def test_browser_failures_open_circuit(self, page_class):
+        """Test that Playwright timeouts and network errors count against the host."""
+        pool = FailingBrowserPool(page_class)
+        scraper = NvidiaScraper(
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=CircuitBreaker(min_calls=3, reset_timeout=60),
+        )
+
+        async with scraper:
+            scraper._browser_pool = pool
+            scraper.strategy.choose_method = lambda url: PLAYWRIGHT
+            for i in range(5):
+                url = f"https://down.example/news/{i}"
+                assert await scraper._scrape_article_with_retry(url) is None
+
+        assert len(pool.pages) == 3
+        assert scraper.circuit_breaker.state("https://down.example/news/0") == OPEN
+        assert set(scraper.skipped_urls.values()) == {"circuit_open"}
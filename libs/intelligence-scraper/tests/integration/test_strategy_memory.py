@@ -0,0 +1,53 @@
+"""
+Integration tests for extraction strategy memory
+
+Verifies that URL patterns needing JS rendering skip trafilatura and are re-probed.
+"""
+
+from intelligence_scraper.utils.strategy import (
+    PLAYWRIGHT,
+    TRAFILATURA,
+    StrategyMemory,
+    url_pattern,
+)
+
+JS_URL = "https://nvidianews.nvidia.com/news/story-{}"
+
+
+class TestStrategyMemory:
+    """Tests for per-pattern extraction method selection."""
+
+    def test_url_pattern_groups_by_first_segment(self):
+        """Test that article URLs under one section share a pattern."""
+        assert url_pattern(JS_URL.format(1)) == "nvidianews.nvidia.com/news/*"
+        assert url_pattern("https://nvidianews.nvidia.com/news") == "nvidianews.nvidia.com/news"
+
+    def test_failing_pattern_goes_to_browser_and_is_reprobed(self):
+        """Test that repeated trafilatura failures switch to the browser."""
+        memory = StrategyMemory(min_samples=3, reprobe_every=3)
+
+        for i in range(3):
+            assert memory.choose_method(JS_URL.format(i)) == TRAFILATURA
+            memory.record(JS_URL.format(i), TRAFILATURA, success=False)
+
+        choices = [memory.choose_method(JS_URL.format(i)) for i in range(3, 6)]
+        assert choices == [PLAYWRIGHT, PLAYWRIGHT, TRAFILATURA]
+
+    def test_successful_reprobe_restores_trafilatura(self):
+        """Test that a site that becomes extractable returns to trafilatura."""
+        memory = StrategyMemory(min_samples=1, threshold=0.5)
+        memory.record(JS_URL.format(0), TRAFILATURA, success=False)
+        assert memory.choose_method(JS_URL.format(1)) == PLAYWRIGHT
+
+        memory.record(JS_URL.format(2), TRAFILATURA, success=True)
+        memory.record(JS_URL.format(3), TRAFILATURA, success=True)
+        assert memory.choose_method(JS_URL.format(4)) == TRAFILATURA
+
+    def test_statistics_persist_across_runs(self, tmp_path):
+        """Test that statistics are reloaded from the state directory."""
+        memory = StrategyMemory(str(tmp_path), min_samples=1)
+        memory.record(JS_URL.format(0), TRAFILATURA, success=False)
+        memory.close()
+
+        reopened = StrategyMemory(str(tmp_path), min_samples=1)
+        assert reopened.choose_method(JS_URL.format(1)) == PLAYWRIGHT
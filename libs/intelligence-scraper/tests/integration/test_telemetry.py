@@ -0,0 +1,100 @@
+"""
+Integration tests for per-stage telemetry
+
+Verifies stage timings and byte counts on scraped articles and the run summary.
+"""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from intelligence_scraper.extractors.nvidia import NvidiaScraper
+from intelligence_scraper.utils import telemetry
+from tests.integration.conftest import ARTICLE_HTML
+
+
+class ListedScraper(NvidiaScraper):
+    """NvidiaScraper with a fixed listing and real article fetches."""
+
+    def __init__(self, urls: List[str], **kwargs):
+        super().__init__(**kwargs)
+        self.urls = urls
+
+    async def _get_article_urls(self) -> List[str]:
+        return self.urls
+
+
+class TestStatistics:
+    """Tests for percentile and histogram helpers."""
+
+    def test_nearest_rank_percentile(self):
+        """Test that percentiles pick observed values."""
+        values = list(range(1, 101))
+
+        assert telemetry.percentile(values, 50) == 50
+        assert telemetry.percentile(values, 95) == 95
+        assert telemetry.percentile([7.0], 95) == 7.0
+        assert telemetry.percentile([], 50) == 0.0
+
+    def test_histogram_buckets(self):
+        """Test that values land in the first bucket that holds them."""
+        counts = telemetry.histogram([0.5, 3, 5, 40000])
+
+        assert counts["<=1"] == 1
+        assert counts["<=5"] == 2
+        assert counts[">30000"] == 1
+        assert sum(counts.values()) == 4
+
+    @pytest.mark.asyncio
+    async def test_concurrent_articles_do_not_mix(self):
+        """Test that each task records into its own article."""
+
+        async def _work(seconds: float) -> telemetry.ArticleTelemetry:
+            with telemetry.track_article() as article:
+                telemetry.record_stage(telemetry.EXTRACT, seconds)
+                await asyncio.sleep(0.01)
+                telemetry.record_bytes(telemetry.DOWNLOAD, int(seconds * 1000))
+            return article
+
+        first, second = await asyncio.gather(_work(1.0), _work(2.0))
+
+        assert first.stages_ms[telemetry.EXTRACT] == 1000
+        assert second.stages_ms[telemetry.EXTRACT] == 2000
+        assert first.bytes[telemetry.DOWNLOAD] == 1000
+        assert second.bytes[telemetry.DOWNLOAD] == 2000
+
+
+class TestScraperTelemetry:
+    """Tests for telemetry collected during a scrape."""
+
+    @pytest.mark.asyncio
+    async def test_article_metadata_and_run_summary(self, page_server):
+        """Test that articles carry stage timings and the summary aggregates them."""
+        page_server.add("/news/gpu", ARTICLE_HTML)
+        page_server.add("/news/missing", "Not found", status=404)
+        urls = [page_server.url("/news/gpu"), page_server.url("/news/missing")]
+
+        scraper = ListedScraper(urls, max_articles=2)
+        articles = await scraper.scrape()
+
+        assert len(articles) == 1
+        article_telemetry = articles[0].metadata["telemetry"]
+        for stage_name in (telemetry.CONNECT, telemetry.WAIT, telemetry.DOWNLOAD):
+            assert stage_name in article_telemetry["stagesMs"]
+        assert telemetry.EXTRACT in article_telemetry["stagesMs"]
+        assert telemetry.CLEAN in article_telemetry["stagesMs"]
+        assert article_telemetry["bytes"][telemetry.DOWNLOAD] == len(ARTICLE_HTML.encode("utf-8"))
+        assert article_telemetry["totalMs"] >= article_telemetry["stagesMs"][telemetry.EXTRACT]
+
+        summary = scraper.run_telemetry.summary()
+        assert summary["articles"] == 2
+        assert summary["outcomes"] == {"scraped": 1, "failed": 1}
+        assert summary["methods"] == {"trafilatura": 1}
+        # Both requests waited for headers; only the found page had a body to download
+        wait = summary["stages"][telemetry.WAIT]
+        assert wait["count"] == 2
+        assert wait["p50_ms"] <= wait["p95_ms"] <= wait["max_ms"]
+        assert sum(wait["histogram"].values()) == 2
+        assert summary["stages"][telemetry.DOWNLOAD]["count"] == 1
+        assert summary["bytes"][telemetry.DOWNLOAD]["total"] >= len(ARTICLE_HTML)